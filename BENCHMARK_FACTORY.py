@@ -0,0 +1,288 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_BENCHMARK]
+[TARGET: GENERATE_HCI_PAPER_V7 PIPELINE]
+[OBJECTIVE: PER-STAGE THROUGHPUT + PEAK MEMORY, WITH REGRESSION GATES]
+
+Builds synthetic papers of increasing size and runs them through the same
+stages as `GENERATE_HCI_PAPER_V7.build`: sanitize, fingerprint the model,
+render each venue, stage the figures and derive the layout-sized copies.
+Compilation is left out; it is dominated by the TeX engine, not by us.
+
+Every stage is timed best-of-N, then run once more under tracemalloc for its
+peak Python allocation. Results are appended to
+`.factory/bench/history.jsonl`; a stage that is slower (or hungrier) than
+the median of its last few recorded runs by more than the threshold fails
+the run with exit code 1.
+
+    python BENCHMARK_FACTORY.py [--sizes small,medium,large] [--repeats 3]
+                                [--threshold 0.25] [--no-record]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import GENERATE_HCI_PAPER_V7 as v7
+from BENCHMARK_SANITIZER import PARAGRAPH
+from factory import derivatives, staging, venues
+from factory.buildgraph import BuildGraph, Value
+from factory.templates import Figure, Paper, Reference, Section
+
+HISTORY_PATH = os.path.join(".factory", "bench", "history.jsonl")
+
+# name: (sections, figures, bibliography entries)
+SIZES = {
+    "small": (10, 4, 50),
+    "medium": (100, 24, 1000),
+    "large": (400, 48, 4000),
+}
+
+BASELINE_RUNS = 5  # history entries the median baseline is taken over
+NOISE_FLOOR_S = 0.005  # stages faster than this are not gated on time
+IMAGE_PX = (2400, 1600)
+
+
+# ==========================================
+# 1. SYNTHETIC PAPERS
+# ==========================================
+def synthetic_sources(n_sections, n_figures, n_refs):
+    """Raw (unsanitized) strings shaped like the V7 content, at scale."""
+    sections = [(f"Section {i}: R&D “Case {i}”", PARAGRAPH * 3 + f"\nObserved in {i}% of trials — see [b{i % max(n_refs, 1) + 1}].\n")
+                for i in range(n_sections)]
+    captions = [f"Artifact {j} — Aspect & Mnemonic detail ({j}% scale)." for j in range(n_figures)]
+    refs = [(f"b{k + 1}",
+             f"A. Author{k}, “Study {k} of R&D,” Proc. CHI '{k % 100:02d}.",
+             f"Author{k}, A. “Study {k} of R&D: 100% Tangible.” \\textit{{Proceedings of CHI}} ({1990 + k % 35}): {k}-{k + 9}.")
+            for k in range(n_refs)]
+    return sections, captions, refs
+
+
+def sanitize_sources(sections, captions, refs):
+    return ([(v7.sanitize(h), v7.sanitize(b)) for h, b in sections],
+            [v7.sanitize(c) for c in captions],
+            [(key, v7.sanitize(short), v7.sanitize(full)) for key, short, full in refs])
+
+
+def build_model(sections, captions, refs):
+    figures = [[] for _ in sections]
+    for j, caption in enumerate(captions):
+        figures[j % len(sections)].append(
+            Figure(caption, [(r"0.48\columnwidth", f"fig{j}.jpg")]))
+    return Paper(
+        title="Tangible Algorithmics at Scale",
+        author="Benchmark",
+        affiliation="Department of Unorthodox Engineering",
+        email="bench@example.invalid",
+        abstract=PARAGRAPH,
+        sections=[Section(h, b, f) for (h, b), f in zip(sections, figures)],
+        bibliography=[Reference(*r) for r in refs],
+    )
+
+
+def make_images(n_figures, src_dir="images"):
+    """Source figures: real JPEGs when Pillow is present, random bytes otherwise."""
+    os.makedirs(src_dir, exist_ok=True)
+    rng = random.Random(0)
+    image_map = {}
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    for j in range(n_figures):
+        name = f"source figure {j}.jpg"
+        path = os.path.join(src_dir, name)
+        if Image is not None:
+            Image.effect_noise(IMAGE_PX, 64 + j % 32).convert("RGB").save(path, quality=92)
+        else:
+            with open(path, "wb") as f:
+                f.write(rng.randbytes(1 << 20))
+        image_map[name] = f"fig{j}.jpg"
+    return image_map
+
+
+# ==========================================
+# 2. STAGES
+# ==========================================
+def _reset(*paths):
+    for path in paths:
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+def _bytes(*strings):
+    return sum(len(s.encode("utf-8")) for s in strings)
+
+
+def stages(size):
+    """[(name, setup, action, work, unit)] for one synthetic paper.
+
+    `setup` runs untimed before every repetition so cached stages are
+    measured cold; `work` is the amount processed, for the throughput column.
+    """
+    n_sections, n_figures, n_refs = SIZES[size]
+    raw = synthetic_sources(n_sections, n_figures, n_refs)
+    clean = sanitize_sources(*raw)
+    paper = build_model(*clean)
+    image_map = make_images(n_figures)
+    raw_bytes = _bytes(*(s for pair in raw[0] for s in pair), *raw[1], *(s for r in raw[2] for s in r[1:]))
+    tex_bytes = {v: _bytes(venues.render(v, paper)) for v in ("ieee", "blind")}
+    image_bytes = sum(os.path.getsize(os.path.join("images", n)) for n in image_map)
+    graph = BuildGraph(os.path.join(".factory", "bench-manifest.json"))
+
+    def nothing():
+        pass
+
+    def fresh_derivatives():
+        _reset(derivatives.CACHE_DIR, derivatives.MANIFEST_PATH, derivatives.DERIVED_DIR)
+        if not os.path.exists(staging.MANIFEST_PATH):
+            staging.stage(image_map)
+
+    return [
+        ("sanitize", nothing, lambda: sanitize_sources(*raw), raw_bytes / 1e6, "MB"),
+        ("model", nothing, lambda: build_model(*clean), n_sections, "sections"),
+        ("fingerprint", nothing, lambda: graph.fingerprint([Value(paper)]), len(repr(paper)) / 1e6, "MB"),
+        ("render:ieee", nothing, lambda: venues.write("ieee", paper, "HCI_Paper_Repo.tex"), tex_bytes["ieee"] / 1e6, "MB"),
+        ("render:blind", nothing, lambda: venues.write("blind", paper, "Manuscript_Blind.tex"), tex_bytes["blind"] / 1e6, "MB"),
+        ("stage", lambda: _reset(staging.STORE_DIR, staging.MANIFEST_PATH, *image_map.values()),
+         lambda: staging.stage(image_map), image_bytes / 1e6, "MB"),
+        ("figures", fresh_derivatives, lambda: derivatives.derive("HCI_Paper_Repo.tex"), n_figures, "figures"),
+    ]
+
+
+def measure(setup, action, repeats):
+    """(best seconds, peak traced KiB)."""
+    best = float("inf")
+    for _ in range(repeats):
+        setup()
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    setup()
+    tracemalloc.start()
+    try:
+        action()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak / 1024
+
+
+def run_size(size, repeats):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix=f"bench-{size}-") as work:
+        cwd = os.getcwd()
+        os.chdir(work)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                plan = stages(size)
+            for name, setup, action, work_done, unit in plan:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    seconds, peak_kib = measure(setup, action, repeats)
+                results[name] = {"seconds": seconds, "throughput": work_done / seconds if seconds else None,
+                                 "unit": f"{unit}/s", "peak_kib": peak_kib}
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+# ==========================================
+# 3. HISTORY + REGRESSION GATE
+# ==========================================
+def load_history(path=HISTORY_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def baseline(history, size, stage):
+    """Median seconds and peak over the last BASELINE_RUNS recorded runs, or None."""
+    rows = [h["results"][size][stage] for h in history
+            if h.get("python") == platform.python_version() and stage in h["results"].get(size, {})]
+    rows = rows[-BASELINE_RUNS:]
+    if not rows:
+        return None
+    return statistics.median(r["seconds"] for r in rows), statistics.median(r["peak_kib"] for r in rows)
+
+
+def check(results, history, threshold):
+    """Prints the report; returns the list of regressions."""
+    regressions = []
+    print(f"{'size':<7} {'stage':<13} {'best ms':>9} {'throughput':>20} {'peak KiB':>10} {'vs base':>8}")
+    for size, stages_ in results.items():
+        for stage, r in stages_.items():
+            base = baseline(history, size, stage)
+            verdict = "-"
+            if base:
+                ratio = r["seconds"] / base[0] if base[0] else 1.0
+                verdict = f"{(ratio - 1) * 100:+.0f}%"
+                if ratio > 1 + threshold and r["seconds"] > NOISE_FLOOR_S:
+                    regressions.append(f"{size}/{stage}: {r['seconds'] * 1000:.1f} ms vs {base[0] * 1000:.1f} ms")
+                if base[1] and r["peak_kib"] > base[1] * (1 + threshold) and r["peak_kib"] - base[1] > 256:
+                    regressions.append(f"{size}/{stage}: peak {r['peak_kib']:.0f} KiB vs {base[1]:.0f} KiB")
+            rate = f"{r['throughput']:.1f} {r['unit']}" if r["throughput"] else "-"
+            print(f"{size:<7} {stage:<13} {r['seconds'] * 1000:9.1f} {rate:>20} {r['peak_kib']:10.0f} {verdict:>8}")
+    return regressions
+
+
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def record(results, path=HISTORY_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    entry = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": _commit(),
+             "python": platform.python_version(), "results": results}
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the manuscript pipeline on synthetic papers.")
+    parser.add_argument("--sizes", default=",".join(SIZES), help="comma-separated subset of " + ", ".join(SIZES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown/growth vs baseline (0.25 = 25%%)")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--no-record", action="store_true", help="compare only; do not append to the history")
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)}")
+
+    history = load_history(args.history)
+    results = {size: run_size(size, args.repeats) for size in sizes}
+    regressions = check(results, history, args.threshold)
+    if not args.no_record:
+        record(results, args.history)
+    if regressions:
+        print("[ERROR] Regressions beyond threshold:")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    if history:
+        print("[SYSTEM] No regressions.")
+    else:
+        print("[SYSTEM] No baseline yet." if args.no_record else "[SYSTEM] Baseline recorded.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_BENCHMARK]
+[TARGET: factory.sanitize]
+[OBJECTIVE: THROUGHPUT ON MULTI-MEGABYTE MANUSCRIPTS]
+"""
+import sys
+import time
+
+from factory.sanitize import sanitize
+
+# A block with the mix the generators actually feed in: mostly prose, with
+# smart quotes, percentages, pre-escaped characters and some math.
+PARAGRAPH = r"""
+We live in an era of “Invisible Computation.” Cloud architectures, serverless functions, and sleek software
+interfaces have successfully hidden the messy, chaotic, and beautiful mathematics that govern our digital lives [1].
+While efficient for consumer productivity, this abstraction creates a profound cognitive disconnect for the engineer
+and the student. A user running a Neural Network today sees a loading bar, not the fluid dynamics of weight adaptation.
+
+Group B demonstrated a 40% higher retention rate of the terminology one week later ($p < 0.05$) — R&D \& tooling.
+\begin{align}
+    \dot{x} &= \sigma(y-x) \\
+    \dot{y} &= x(\rho-z)-y
+\end{align}
+The Q-PID solves $\frac{dx}{dt} = -x/\tau + S$ and the \textbf{Isochron Key} iterates for $t=1000$ steps.
+"""
+
+
+def legacy_sanitize(text):
+    """The V5-V7 chain, kept verbatim as the baseline."""
+    text = text.replace("&", " and ").replace("%", "\\%")
+    text = text.replace("“", '"').replace("”", '"').replace("’", "'")
+    return text
+
+
+def best_of(fn, text, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes_mb=(1, 4, 16), repeats=3):
+    """Prints the table; returns False if the shared sanitizer is slower than the legacy chain at any size."""
+    print(f"{'size':>8} {'legacy MB/s':>12} {'shared MB/s':>12} {'ratio':>7}")
+    slower = []
+    for mb in sizes_mb:
+        text = PARAGRAPH * (mb * (1 << 20) // len(PARAGRAPH) + 1)
+        size = len(text.encode("utf-8")) / (1 << 20)
+        t_legacy = best_of(legacy_sanitize, text, repeats)
+        t_shared = best_of(lambda t: sanitize(t, ampersand=" and "), text, repeats)
+        print(f"{size:7.1f}M {size / t_legacy:12.1f} {size / t_shared:12.1f} {t_shared / t_legacy:6.2f}x")
+        if t_shared > t_legacy:
+            slower.append(f"{size:.1f}M")
+
+    # The legacy chain mangles math; the shared engine must not.
+    out = sanitize(PARAGRAPH, ampersand=" and ")
+    assert r"\dot{x} &= \sigma(y-x)" in out, "align environment was escaped"
+    assert r"\& tooling" in out and r"\\%" not in out, "pre-escaped text was escaped twice"
+    print("[SYSTEM] Math-mode preservation: OK")
+    if slower:
+        print(f"[ERROR] Shared sanitizer slower than the legacy chain at {', '.join(slower)}.")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run(tuple(int(a) for a in sys.argv[1:]) or (1, 4, 16)) else 1)
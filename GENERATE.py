@@ -0,0 +1,135 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_CLI]
+[ROLE: SINGLE ENTRY POINT FOR EVERY GENERATED ARTIFACT]
+
+    python GENERATE.py [--trace] {paper,blind,title,readme,all} [--force] [--jobs N]
+    python GENERATE.py startup-check [--budget SECONDS]
+
+Only argparse is loaded at startup. Each subcommand imports what it needs
+when it runs, so `--help` and `readme` never touch the compiler toolchain,
+and the downloader (requests/zipfile/tarfile) is only loaded when the
+engine is actually missing. `--trace` records build spans (see
+`factory.trace`) and prints where the time went.
+"""
+import argparse
+import os
+import sys
+
+DOCUMENTS = ("paper", "blind", "title")
+
+# Modules that must not load just to print help, or just to import the paper.
+HEAVY = ("requests", "zipfile", "tarfile", "subprocess", "concurrent.futures", "socketserver", "PIL", "numpy")
+DOWNLOADER = ("requests", "zipfile", "tarfile", "PIL", "numpy")
+STARTUP_BUDGET = 0.25  # seconds, best of STARTUP_RUNS, for `GENERATE.py --help`
+STARTUP_RUNS = 5
+
+
+# ==========================================
+# 1. COMMANDS
+# ==========================================
+def build_documents(targets, args):
+    import GENERATE_HCI_PAPER_V7 as paper
+
+    return paper.build(force=args.force, max_workers=args.jobs, targets=targets)
+
+
+def build_readme(args):
+    import GENERATE_ARTIFACT_README as readme
+
+    readme.generate_readme()
+    return True
+
+
+def build_all(args):
+    return build_documents(DOCUMENTS, args) & build_readme(args)
+
+
+# ==========================================
+# 2. STARTUP GUARD
+# ==========================================
+def _imported(argv):
+    """Run `argv` under `-X importtime`; return (modules imported, wall seconds)."""
+    import subprocess
+    import time
+
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + argv, cwd=os.path.dirname(os.path.abspath(__file__)),
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(argv)} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules, elapsed
+
+
+def startup_check(args):
+    """Fail if the cold-start paths pull in heavy modules or exceed the time budget."""
+    baseline, _ = _imported(["-c", "pass"])  # whatever site/sitecustomize already loads
+    probes = [
+        ("GENERATE.py --help", ["GENERATE.py", "--help"], HEAVY + ("GENERATE_HCI_PAPER_V7",)),
+        ("import GENERATE_HCI_PAPER_V7", ["-c", "import GENERATE_HCI_PAPER_V7"], DOWNLOADER),
+        ("import GENERATE_ARTIFACT_README", ["-c", "import GENERATE_ARTIFACT_README"], HEAVY),
+    ]
+    ok = True
+    for label, argv, banned in probes:
+        modules, _ = _imported(argv)
+        fresh = modules - baseline
+        leaked = [b for b in banned if any(m == b or m.startswith(b + ".") for m in fresh)]
+        if leaked:
+            ok = False
+            print(f"[ERROR] {label}: imports {', '.join(leaked)}")
+        else:
+            print(f"[SYSTEM] {label}: no heavy imports.")
+
+    best = min(_imported(["GENERATE.py", "--help"])[1] for _ in range(STARTUP_RUNS))
+    if best > args.budget:
+        ok = False
+        print(f"[ERROR] GENERATE.py --help: {best * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)")
+    else:
+        print(f"[SYSTEM] GENERATE.py --help: {best * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)")
+    return ok
+
+
+# ==========================================
+# 3. ENTRY POINT
+# ==========================================
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="GENERATE.py", description="Build the submission artifacts.")
+    parser.add_argument("--trace", action="store_true",
+                        help="write a Chrome trace to .factory/traces/ and print a timing summary")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("paper", "IEEE two-column repo version"),
+                            ("blind", "anonymised Leonardo manuscript"),
+                            ("title", "non-blind title page"),
+                            ("all", "every PDF and the README")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--force", action="store_true", help="rebuild every stage, ignoring the build cache")
+        cmd.add_argument("--jobs", type=int, default=None, metavar="N", help="parallel compile jobs")
+    sub.add_parser("readme", help="regenerate README.md")
+    check = sub.add_parser("startup-check", help="guard the cold-start import set and time")
+    check.add_argument("--budget", type=float, default=STARTUP_BUDGET, metavar="SECONDS")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.trace:
+        from factory import trace
+
+        trace.enable()
+    if args.command in DOCUMENTS:
+        ok = build_documents([args.command], args)
+    elif args.command == "readme":
+        ok = build_readme(args)
+    elif args.command == "all":
+        ok = build_all(args)
+    else:
+        ok = startup_check(args)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
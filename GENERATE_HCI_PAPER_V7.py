@@ -6,65 +6,54 @@
 import os
 import subprocess
 import sys
-import requests
-import zipfile
-import shutil
+
+import GENERATE_TITLE_PAGE as title_page
+from factory import derivatives, staging, texd, toolchain, venues
+from factory.buildgraph import BuildGraph, Code, File, Value
+from factory.compilepool import Job, run_jobs
+from factory.sanitize import sanitize as latex_sanitize
+from factory.templates import Figure, Paper, Reference, Section
+from factory.trace import traced
 
 # ==========================================
 # 0. SETUP & IMAGE STAGING
 # ==========================================
-TECTONIC_URL = "https://github.com/tectonic-typesetting/tectonic/releases/download/tectonic%400.14.1/tectonic-0.14.1-x86_64-pc-windows-msvc.zip"
-
-
+@traced()
 def ensure_compiler():
-    if os.path.exists("tectonic.exe"): return
-    print("[SYSTEM] Downloading Compiler...")
     try:
-        r = requests.get(TECTONIC_URL, stream=True)
-        with open("tectonic.zip", 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192): f.write(chunk)
-        with zipfile.ZipFile("tectonic.zip", 'r') as z:
-            z.extractall(".")
-        os.remove("tectonic.zip")
+        return toolchain.ensure_engine()
     except Exception as e:
         print(f"[ERROR] {e}")
         sys.exit(1)
 
 
+IMAGE_MAP = {
+    "THE FULL COLLECTOR'S SET.jpg": "fig1_collection.jpg",
+    "q-pid liquid intelligence concept.jpg": "fig2a_qpid.jpg",
+    "THE ISOCHRON KEY (The Time Telescope).jpg": "fig2b_isochron.jpg",
+    "THE ASPECT 23 KEY (The Deprogrammer).jpg": "fig3a_aspect.jpg",
+    "THE MNEMONIC KEY (The Bio-Logger).jpg": "fig3b_mnemonic.jpg",
+    "fig4_diagram.png": "fig4_diagram.png"
+}
+
+
+@traced()
 def stage_images():
-    """Stage images with safe filenames."""
-    image_map = {
-        "THE FULL COLLECTOR'S SET.jpg": "fig1_collection.jpg",
-        "q-pid liquid intelligence concept.jpg": "fig2a_qpid.jpg",
-        "THE ISOCHRON KEY (The Time Telescope).jpg": "fig2b_isochron.jpg",
-        "THE ASPECT 23 KEY (The Deprogrammer).jpg": "fig3a_aspect.jpg",
-        "THE MNEMONIC KEY (The Bio-Logger).jpg": "fig3b_mnemonic.jpg",
-        "fig4_diagram.png": "fig4_diagram.png"
-    }
+    """Stage images with safe filenames (content-addressed; unchanged files are skipped)."""
+    image_map = IMAGE_MAP
 
     if not os.path.exists("images"):
         print("[WARN] 'images' folder not found. Using placeholders.")
         # Create dummy placeholder function inline
         if not os.path.exists("fig1_collection.jpg"):
-            with open("fig1_collection.jpg", "wb") as f: f.write(
-                b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00\x00:\x7e\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82')
+            with open("fig1_collection.jpg", "wb") as f: f.write(staging.PLACEHOLDER_PNG)
         return
 
-    for src_name, safe_name in image_map.items():
-        src_path = os.path.join("images", src_name)
-        if os.path.exists(src_path):
-            shutil.copy(src_path, safe_name)
-        else:
-            # Create placeholder if specific file missing
-            with open(safe_name, "wb") as f:
-                f.write(
-                    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00\x00:\x7e\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82')
+    staging.stage(image_map)
 
 
 def sanitize(text):
-    text = text.replace("&", " and ").replace("%", "\\%")
-    text = text.replace("“", '"').replace("”", '"').replace("’", "'")
-    return text
+    return latex_sanitize(text, ampersand=" and ")
 
 
 # ==========================================
@@ -149,142 +138,159 @@ The "Unorthodox Artifacts" collection demonstrates that hardware design is not m
 
 
 # ==========================================
-# 2. LATEX GENERATORS (FIXED CAPTIONS)
+# 2. CONTENT MODEL + VENUE RENDERS
 # ==========================================
+PAPER = Paper(
+    title=TITLE, author=AUTHOR, affiliation=AFFILIATION, email=EMAIL, abstract=ABSTRACT,
+    sections=[
+        Section("Introduction", SECTION_INTRO, [
+            Figure("The Collection.", [(r"\columnwidth", "fig1_collection.jpg")]),
+        ]),
+        Section("Theoretical Framework", SECTION_THEORY),
+        Section("Methodology: The Artifacts", SECTION_ARTIFACTS_EXPANDED, [
+            Figure(r"Q-PID \& Isochron Key.", [(r"0.48\columnwidth", "fig2a_qpid.jpg"),
+                                               (r"0.48\columnwidth", "fig2b_isochron.jpg")]),
+        ]),
+        Section("Technical Implementation", SECTION_TECHNICAL, [
+            Figure(r"Aspect \& Mnemonic Keys.", [(r"0.48\columnwidth", "fig3a_aspect.jpg"),
+                                                 (r"0.48\columnwidth", "fig3b_mnemonic.jpg")]),
+        ]),
+        Section("Observations", SECTION_RESULTS),
+        Section("Conclusion", SECTION_CONCLUSION),
+    ],
+    bibliography=[
+        Reference("b1", r'M. Weiser, "The Computer for the 21st Century," Sci. Am., 1991.',
+                  r'Weiser, M. "The Computer for the 21st Century." \textit{Scientific American}, vol. 265, no. 3 (1991): 94-104.'),
+        Reference("b2", r'B. Sterling, "Design Fiction," Interactions, 2009.',
+                  r'Sterling, B. "Design Fiction." \textit{Interactions}, vol. 16, no. 3 (2009): 20-24.'),
+        Reference("b3", r'E. N. Lorenz, "Deterministic Nonperiodic Flow," JAS, 1963.',
+                  r'Lorenz, E. N. "Deterministic Nonperiodic Flow." \textit{Journal of the Atmospheric Sciences}, vol. 20 (1963): 130-141.'),
+        Reference("b4", r'E. Hutchins, "Cognition in the Wild," MIT Press, 1995.',
+                  r'Hutchins, E. \textit{Cognition in the Wild}. MIT Press, 1995.'),
+        Reference("b5", r"""H. Ishii, "Tangible Bits," CHI '97.""",
+                  r"""Ishii, H., and Ullmer, B. "Tangible Bits: Towards Seamless Interfaces between People, Bits and Atoms." \textit{Proceedings of CHI '97}, 234-241."""),
+    ],
+)
+
+
+@traced()
 def generate_repo_version():
     """Generates the IEEE 2-Column format (Pretty for GitHub)."""
-    # FIX: Replaced '&' with '\&' in captions manually
-    latex = r"""
-\documentclass[journal]{IEEEtran}
-\usepackage[utf8]{inputenc}
-\usepackage{cite}
-\usepackage{amsmath,amssymb,amsfonts}
-\usepackage{graphicx}
-\usepackage{xcolor}
-
-\begin{document}
-\title{""" + TITLE + r"""}
-\author{""" + AUTHOR + r"""\\ \textit{""" + AFFILIATION + r"""}}
-\maketitle
-
-\begin{abstract}
-""" + ABSTRACT + r"""
-\end{abstract}
-
-\section{Introduction}
-\IEEEPARstart{W}{e} """ + SECTION_INTRO.strip() + r"""
-\begin{figure}[h] \centering \includegraphics[width=\columnwidth]{fig1_collection.jpg} \caption{The Collection.} \end{figure}
-
-\section{Theoretical Framework}
-""" + SECTION_THEORY + r"""
-
-\section{Methodology: The Artifacts}
-""" + SECTION_ARTIFACTS_EXPANDED + r"""
-\begin{figure}[h] \centering \includegraphics[width=0.48\columnwidth]{fig2a_qpid.jpg} \includegraphics[width=0.48\columnwidth]{fig2b_isochron.jpg} \caption{Q-PID \& Isochron Key.} \end{figure}
-
-\section{Technical Implementation}
-""" + SECTION_TECHNICAL + r"""
-\begin{figure}[h] \centering \includegraphics[width=0.48\columnwidth]{fig3a_aspect.jpg} \includegraphics[width=0.48\columnwidth]{fig3b_mnemonic.jpg} \caption{Aspect \& Mnemonic Keys.} \end{figure}
-
-\section{Observations}
-""" + SECTION_RESULTS + r"""
-
-\section{Conclusion}
-""" + SECTION_CONCLUSION + r"""
-
-\begin{thebibliography}{00}
-\bibitem{b1} M. Weiser, "The Computer for the 21st Century," Sci. Am., 1991.
-\bibitem{b2} B. Sterling, "Design Fiction," Interactions, 2009.
-\bibitem{b3} E. N. Lorenz, "Deterministic Nonperiodic Flow," JAS, 1963.
-\bibitem{b4} E. Hutchins, "Cognition in the Wild," MIT Press, 1995.
-\bibitem{b5} H. Ishii, "Tangible Bits," CHI '97.
-\end{thebibliography}
-\end{document}
-    """
-    with open("HCI_Paper_Repo.tex", "w", encoding="utf-8") as f: f.write(latex)
+    venues.write("ieee", PAPER, "HCI_Paper_Repo.tex")
 
 
+@traced()
 def generate_blind_version():
     """Generates the Single-Column, Double-Spaced format (For Leonardo Submission)."""
-    latex = r"""
-\documentclass[12pt, letterpaper]{article}
-\usepackage[utf8]{inputenc}
-\usepackage[margin=1in]{geometry}
-\usepackage{setspace}
-\usepackage{graphicx}
-\usepackage{amsmath}
-\usepackage{cite}
-
-\doublespacing
-
-\begin{document}
-
-\begin{center}
-    \textbf{\Large """ + TITLE + r"""}
-
-    \vspace{1cm}
-    \textit{[Author Details Redacted for Blind Review]}
-\end{center}
-
-\begin{abstract}
-\noindent """ + ABSTRACT + r"""
-\end{abstract}
-
-\newpage
-
-\section{Introduction}
-""" + SECTION_INTRO + r"""
-
-\section{Theoretical Framework}
-""" + SECTION_THEORY + r"""
-
-\section{Methodology: The Artifacts}
-""" + SECTION_ARTIFACTS_EXPANDED + r"""
-
-\section{Technical Implementation}
-""" + SECTION_TECHNICAL + r"""
-
-\section{Observations}
-""" + SECTION_RESULTS + r"""
-
-\section{Conclusion}
-""" + SECTION_CONCLUSION + r"""
-
-\newpage
-\begin{thebibliography}{00}
-\bibitem{b1} Weiser, M. "The Computer for the 21st Century." \textit{Scientific American}, vol. 265, no. 3 (1991): 94-104.
-\bibitem{b2} Sterling, B. "Design Fiction." \textit{Interactions}, vol. 16, no. 3 (2009): 20-24.
-\bibitem{b3} Lorenz, E. N. "Deterministic Nonperiodic Flow." \textit{Journal of the Atmospheric Sciences}, vol. 20 (1963): 130-141.
-\bibitem{b4} Hutchins, E. \textit{Cognition in the Wild}. MIT Press, 1995.
-\bibitem{b5} Ishii, H., and Ullmer, B. "Tangible Bits: Towards Seamless Interfaces between People, Bits and Atoms." \textit{Proceedings of CHI '97}, 234-241.
-\end{thebibliography}
-
-\end{document}
-    """
-    with open("Manuscript_Blind.tex", "w", encoding="utf-8") as f: f.write(latex)
+    venues.write("blind", PAPER, "Manuscript_Blind.tex")
 
 
 # ==========================================
 # 3. COMPILATION
 # ==========================================
-def compile_pdfs():
+def compile_job(tex_path, via_daemon=False):
+    """A compile job; routed through the warm `factory.texd` service when it is running."""
+    name = "pdf:" + os.path.splitext(tex_path)[0]
+    if via_daemon:
+        # The request is made from the pool thread; the daemon holds the prime lock itself.
+        return Job(name, call=lambda: _compile_via_daemon(tex_path))
+    return Job(name, toolchain.engine_argv(tex_path), env=toolchain.engine_env(), lock=toolchain.prime_lock)
+
+
+def _compile_via_daemon(tex_path):
+    """(returncode, log) from the daemon, or from a direct compile if it has gone away
+    or answered with something other than a result."""
+    try:
+        result = texd.submit(tex_path)
+        return result["returncode"], result["log"].encode("utf-8")
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[WARN] texd unavailable ({e!r}); compiling {tex_path} directly.")
+    with toolchain.prime_lock():
+        proc = subprocess.run(toolchain.engine_argv(tex_path), env=toolchain.engine_env(),
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return proc.returncode, proc.stdout
+
+
+def compile_pdfs(max_workers=None):
+    """Compiles the repo, blind and title-page documents side by side."""
     ensure_compiler()
-    print("[SYSTEM] Compiling REPO Version (IEEE)...")
-    subprocess.run(["tectonic.exe", "HCI_Paper_Repo.tex"])
+    via_daemon = texd.available()
+    jobs = [compile_job(tex, via_daemon) for tex in ("HCI_Paper_Repo.tex", "Manuscript_Blind.tex", "Title_Page.tex")]
+    results = run_jobs(jobs, max_workers)
+    report()
+    return all(r.ok for r in results.values())
 
-    print("[SYSTEM] Compiling BLIND Version (Submission)...")
-    subprocess.run(["tectonic.exe", "Manuscript_Blind.tex"])
 
-    if os.path.exists("HCI_Paper_Repo.pdf") and os.path.exists("Manuscript_Blind.pdf"):
+def report(pdfs=("HCI_Paper_Repo.pdf", "Manuscript_Blind.pdf", "Title_Page.pdf")):
+    if all(os.path.exists(p) for p in pdfs):
         print("-" * 40)
-        print("[VICTORY] BOTH PDFS GENERATED.")
+        print("[VICTORY] ALL SUBMISSION PDFS GENERATED." if len(pdfs) > 1 else f"[VICTORY] {pdfs[0]} generated.")
         print("-" * 40)
-    else:
-        print("[ERROR] Compilation Failed.")
+        return True
+    print("[ERROR] Compilation Failed.")
+    return False
+
+
+# ==========================================
+# 4. INCREMENTAL BUILD
+# ==========================================
+# Stages each deliverable depends on, and the PDF it produces.
+TARGETS = {
+    "paper": (("compiler", "images", "tex:repo", "figures", "pdf:repo"), "HCI_Paper_Repo.pdf"),
+    "blind": (("compiler", "tex:blind", "pdf:blind"), "Manuscript_Blind.pdf"),
+    "title": (("compiler", "tex:title", "pdf:title"), "Title_Page.pdf"),
+}
+
+
+def build(force=False, max_workers=None, targets=None):
+    """Re-run only the stages whose inputs changed since the last build.
+
+    `targets` narrows the build to some of the keys of TARGETS (default: all).
+    Returns True when every selected PDF exists afterwards.
+    """
+    targets = list(targets or TARGETS)
+    only = {stage for t in targets for stage in TARGETS[t][0]}
+    figures = list(IMAGE_MAP.values())
+    via_daemon = texd.available()
+    try:
+        engine = toolchain.engine_path()
+    except toolchain.ToolchainError as e:  # No release build for this host and no FACTORY_TECTONIC.
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    graph = BuildGraph()
+    graph.add("compiler", ensure_compiler,
+              inputs=[Value((toolchain.VERSION, engine))], outputs=[engine])
+    graph.add("images", stage_images,
+              inputs=[Code(stage_images), Value(IMAGE_MAP)]
+              + [File(os.path.join("images", name)) for name in IMAGE_MAP],
+              outputs=figures)
+    model = Value(PAPER)
+    graph.add("tex:repo", generate_repo_version,
+              inputs=[model, Value(venues.IEEE)], outputs=["HCI_Paper_Repo.tex"])
+    graph.add("tex:blind", generate_blind_version,
+              inputs=[model, Value(venues.BLIND)], outputs=["Manuscript_Blind.tex"])
+    graph.add("tex:title", title_page.generate_title_page,
+              inputs=[Value(title_page.PAPER), Value(venues.TITLE_PAGE)], outputs=["Title_Page.tex"])
+    graph.add("figures", lambda: derivatives.derive("HCI_Paper_Repo.tex"),
+              inputs=[Code(derivatives.derive), Value((derivatives.DPI, derivatives.QUALITY)),
+                      File("HCI_Paper_Repo.tex"), File(staging.MANIFEST_PATH)],
+              outputs=[os.path.join(derivatives.DERIVED_DIR, f) for f in figures if f != "fig4_diagram.png"])
+    # The three compiles are adjacent, so the graph runs them as one parallel batch.
+    graph.add("pdf:repo", compile_job("HCI_Paper_Repo.tex", via_daemon),
+              inputs=[File(engine), File("HCI_Paper_Repo.tex"), File(derivatives.MANIFEST_PATH)],
+              outputs=["HCI_Paper_Repo.pdf"])
+    graph.add("pdf:blind", compile_job("Manuscript_Blind.tex", via_daemon),
+              inputs=[File(engine), File("Manuscript_Blind.tex")],
+              outputs=["Manuscript_Blind.pdf"])
+    graph.add("pdf:title", compile_job("Title_Page.tex", via_daemon),
+              inputs=[File(engine), File("Title_Page.tex")],
+              outputs=["Title_Page.pdf"])
+    graph.run(force=force, max_workers=max_workers, only=only)
+    if not toolchain.bundle_ready() and all(graph.manifest["stages"].get(n) for n in ("pdf:repo", "pdf:blind", "pdf:title")):
+        toolchain.mark_bundle_ready()
+        print("[SYSTEM] Shared TeX cache primed. Later builds run offline.")
+    return report(tuple(TARGETS[t][1] for t in targets))
 
 
 if __name__ == "__main__":
-    stage_images()
-    generate_repo_version()
-    generate_blind_version()
-    compile_pdfs()
+    build(force="--force" in sys.argv)
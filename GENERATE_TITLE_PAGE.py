@@ -4,36 +4,28 @@
 [OBJECTIVE: GENERATE NON-BLIND TITLE PAGE]
 """
 import os
-import subprocess
 import sys
-import requests
-import zipfile
+
+from factory import toolchain, venues
+from factory.compilepool import Job, run_jobs
+from factory.sanitize import sanitize as latex_sanitize
+from factory.templates import Paper
+from factory.trace import traced
 
 # ==========================================
 # 0. SETUP
 # ==========================================
-TECTONIC_URL = "https://github.com/tectonic-typesetting/tectonic/releases/download/tectonic%400.14.1/tectonic-0.14.1-x86_64-pc-windows-msvc.zip"
-
-
+@traced()
 def ensure_compiler():
-    if os.path.exists("tectonic.exe"): return
-    print("[SYSTEM] Downloading Compiler...")
     try:
-        r = requests.get(TECTONIC_URL, stream=True)
-        with open("tectonic.zip", 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192): f.write(chunk)
-        with zipfile.ZipFile("tectonic.zip", 'r') as z:
-            z.extractall(".")
-        os.remove("tectonic.zip")
+        return toolchain.ensure_engine()
     except Exception as e:
         print(f"[ERROR] {e}")
         sys.exit(1)
 
 
 def sanitize(text):
-    text = text.replace("&", " and ").replace("%", "\\%")
-    text = text.replace("“", '"').replace("”", '"').replace("’", "'")
-    return text
+    return latex_sanitize(text, ampersand=" and ")
 
 
 # ==========================================
@@ -48,51 +40,22 @@ ABSTRACT = sanitize(r"""
 As algorithmic complexity increases, the gap between user understanding and software function widens. This "Black Box" problem is particularly acute in fields like Chaos Theory, Neural Differential Equations, and Entropic Security, where mathematical abstraction alienates the user from the underlying dynamics. This paper proposes a framework for "Tangible Algorithmics," utilizing a suite of modular USB artifacts designed to physicalize these concepts. Four case studies are presented: (1) The Q-PID, a modular Liquid Neural Network node; (2) The Isochron Key, a crystal-embedded interface for visualizing deterministic chaos; (3) The Aspect Interface, a screen-embedded tool for subliminal cognitive reinforcement; and (4) The Mnemonic Key, a haptic bio-logger. By coupling executable code with weight-calibrated physical totems, the author argues that users achieve a deeper "Material Anchoring" of complex computational states. Preliminary trials suggest this multi-modal approach significantly improves conceptual retention compared to purely digital interfaces.
 """)
 
+PAPER = Paper(title=TITLE, author=AUTHOR, affiliation=AFFILIATION, email=EMAIL, abstract=ABSTRACT)
+
 
 # ==========================================
 # 2. GENERATOR
 # ==========================================
+@traced()
 def generate_title_page():
-    latex = r"""
-\documentclass[12pt, letterpaper]{article}
-\usepackage[utf8]{inputenc}
-\usepackage[margin=1in]{geometry}
-\usepackage{setspace}
-
-\begin{document}
-
-\vspace*{2cm}
-
-\begin{center}
-    \textbf{\Large """ + TITLE + r"""}
-
-    \vspace{2cm}
-
-    \textbf{""" + AUTHOR + r"""} \\
-    \vspace{0.5cm}
-    \textit{""" + AFFILIATION + r"""} \\
-    \texttt{""" + EMAIL + r"""}
-
-    \vspace{3cm}
-\end{center}
-
-\noindent \textbf{Abstract:} \\
-""" + ABSTRACT + r"""
-
-\vfill
-\noindent \textit{Corresponding Author: """ + AUTHOR + r"""}
-
-\end{document}
-    """
-
-    with open("Title_Page.tex", "w", encoding="utf-8") as f:
-        f.write(latex)
+    venues.write("title", PAPER, "Title_Page.tex")
 
 
 def compile_pdf():
     ensure_compiler()
     print("[SYSTEM] Compiling Title Page...")
-    subprocess.run(["tectonic.exe", "Title_Page.tex"])
+    run_jobs([Job("pdf:Title_Page", toolchain.engine_argv("Title_Page.tex"),
+                  env=toolchain.engine_env(), lock=toolchain.prime_lock)])
 
     if os.path.exists("Title_Page.pdf"):
         print("-" * 40)
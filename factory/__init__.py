@@ -0,0 +1,4 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_CORE]
+[ROLE: SHARED BUILD MACHINERY FOR THE GENERATOR SCRIPTS]
+"""
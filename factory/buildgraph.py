@@ -0,0 +1,203 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_BUILD_GRAPH]
+[ROLE: CONTENT-HASH INCREMENTAL STAGES]
+
+Each stage declares its inputs (files, values, code) and outputs. A stage is
+skipped when the digest of its inputs matches the persisted manifest and its
+outputs are still on disk exactly as they were left.
+"""
+import hashlib
+import json
+import os
+
+from factory.trace import span
+
+MANIFEST_PATH = os.path.join(".factory", "manifest.json")
+
+
+# ==========================================
+# 0. INPUT KINDS
+# ==========================================
+class File:
+    """A file on disk. Hashed by content, re-hashed only when its stat changes."""
+
+    def __init__(self, path):
+        self.path = path
+
+
+class Value:
+    """Any repr-stable Python value (section constants, settings)."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Code:
+    """A function's bytecode and constants (its embedded LaTeX template).
+
+    Decorated functions are hashed by the function they wrap.
+    """
+
+    def __init__(self, fn):
+        while hasattr(fn, "__wrapped__"):
+            fn = fn.__wrapped__
+        self.fn = fn
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _code_bytes(code):
+    parts = [code.co_code]
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            parts.append(_code_bytes(const))
+        else:
+            parts.append(repr(const).encode("utf-8"))
+    return b"\0".join(parts)
+
+
+# ==========================================
+# 1. GRAPH
+# ==========================================
+class BuildGraph:
+    """Ordered stages; later stages may take earlier outputs as File inputs."""
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.stages = []
+        self.dirty = False
+        self.manifest = {"files": {}, "stages": {}}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                print("[WARN] Build manifest unreadable. Rebuilding everything.")
+
+    def file_digest(self, path):
+        """SHA-256 of a file, memoised in the manifest on (size, mtime_ns)."""
+        if not os.path.exists(path):
+            return "missing"
+        key = _stat_key(path)
+        hit = self.manifest["files"].get(path)
+        if hit and hit[0] == key:
+            return hit[1]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        self.manifest["files"][path] = [key, h.hexdigest()]
+        self.dirty = True
+        return h.hexdigest()
+
+    def fingerprint(self, inputs):
+        h = hashlib.sha256()
+        for item in inputs:
+            if isinstance(item, File):
+                h.update(b"F" + item.path.encode("utf-8") + self.file_digest(item.path).encode("ascii"))
+            elif isinstance(item, Code):
+                h.update(b"C" + _code_bytes(item.fn.__code__))
+            elif isinstance(item, Value):
+                h.update(b"V" + repr(item.value).encode("utf-8"))
+            else:
+                raise TypeError(f"Unsupported build input: {item!r}")
+        return h.hexdigest()
+
+    def add(self, name, action, inputs=(), outputs=()):
+        """Register a stage.
+
+        `action` is either a callable, which may return False to report
+        failure, or a `factory.compilepool.Job`.
+        """
+        self.stages.append((name, action, list(inputs), list(outputs)))
+
+    def is_fresh(self, name, key, outputs):
+        record = self.manifest["stages"].get(name)
+        if not record or record["key"] != key:
+            return False
+        for path in outputs:
+            if not os.path.exists(path) or _stat_key(path) != record["outputs"].get(path):
+                return False
+        return True
+
+    def record(self, name, key, outputs):
+        self.manifest["stages"][name] = {
+            "key": key,
+            "outputs": {p: _stat_key(p) for p in outputs if os.path.exists(p)},
+        }
+
+    def run(self, force=False, max_workers=None, only=None):
+        """Run stale stages in order. Returns the names of the stages that ran.
+
+        Consecutive stages whose action is a compile `Job` form one batch and
+        run in parallel. A failed stage is not recorded, so it is retried on
+        the next run. `only`, if given, names the stages to consider; the
+        rest are left untouched.
+        """
+        from factory.compilepool import Job
+
+        ran = []
+        i = 0
+        while i < len(self.stages):
+            if only is not None and self.stages[i][0] not in only:
+                i += 1
+                continue
+            if not isinstance(self.stages[i][1], Job):
+                name, action, inputs, outputs = self.stages[i]
+                key = self.fingerprint(inputs)
+                i += 1
+                if not force and self.is_fresh(name, key, outputs):
+                    print(f"[SYSTEM] {name}: up to date.")
+                    continue
+                print(f"[SYSTEM] {name}: building...")
+                with span(name, cat="stage"):
+                    ok = action() is not False
+                self.finish(name, key, outputs, ok)
+                ran.append(name)
+                continue
+
+            batch = []
+            while i < len(self.stages) and isinstance(self.stages[i][1], Job):
+                name, job, inputs, outputs = self.stages[i]
+                i += 1
+                if only is not None and name not in only:
+                    continue
+                key = self.fingerprint(inputs)
+                if not force and self.is_fresh(name, key, outputs):
+                    print(f"[SYSTEM] {name}: up to date.")
+                    continue
+                batch.append((name, job, key, outputs))
+            if batch:
+                ran.extend(self.run_batch(batch, max_workers))
+        if self.dirty:
+            self.save()
+        return ran
+
+    def run_batch(self, batch, max_workers=None):
+        from factory.compilepool import run_jobs
+
+        print(f"[SYSTEM] Compiling {len(batch)} document(s) in parallel...")
+        with span("compile batch", cat="stage", documents=len(batch)):
+            results = run_jobs([job for _, job, _, _ in batch], max_workers)
+        for name, job, key, outputs in batch:
+            self.finish(name, key, outputs, results[job.name].ok)
+        return [name for name, _, _, _ in batch]
+
+    def finish(self, name, key, outputs, ok):
+        if ok:
+            self.record(name, key, outputs)
+        else:
+            print(f"[ERROR] {name}: stage failed.")
+            self.manifest["stages"].pop(name, None)
+        self.dirty = True
+
+    def save(self):
+        self.dirty = False
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
@@ -0,0 +1,133 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_COMPILE_POOL]
+[ROLE: BOUNDED PARALLEL DOCUMENT COMPILATION]
+
+Each job is an external compiler process, or a call made on the pool
+thread (e.g. a request to the `factory.texd` daemon). A small thread pool
+launches and waits on them, so wall-clock time tracks the slowest document. The first
+failure terminates every running job and cancels the ones still queued.
+"""
+import contextlib
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from factory import trace
+
+LOG_DIR = os.path.join(".factory", "logs")
+
+
+class Job:
+    """One compiler invocation. Output goes to `.factory/logs/<name>.log`.
+
+    `lock`, if given, is a zero-argument callable returning a context manager
+    that is held while the process runs. `call`, if given, runs instead of a
+    process: a zero-argument callable returning (returncode, log bytes). It
+    cannot be terminated once started.
+    """
+
+    def __init__(self, name, argv=(), cwd=None, env=None, lock=None, call=None):
+        self.name = name
+        self.argv = list(argv)
+        self.cwd = cwd
+        self.env = env
+        self.lock = lock
+        self.call = call
+        self.log_path = os.path.join(LOG_DIR, name.replace(":", "_") + ".log")
+
+
+class JobResult:
+    def __init__(self, name, status, returncode=None, elapsed=0.0, log_path=None):
+        self.name = name
+        self.status = status  # "ok" | "failed" | "cancelled"
+        self.returncode = returncode
+        self.elapsed = elapsed
+        self.log_path = log_path
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+def default_workers(n_jobs):
+    """One worker per job, capped at the core count but never below four."""
+    return max(1, min(n_jobs, max(4, os.cpu_count() or 1)))
+
+
+def run_jobs(jobs, max_workers=None):
+    """Run `jobs` concurrently. Returns {name: JobResult} in submission order."""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    cancel = threading.Event()
+    lock = threading.Lock()
+    running = {}
+
+    def run_one(job):
+        with trace.span(job.name, cat="compile") as s:
+            result = run_job(job)
+            s.args = {"status": result.status, "returncode": result.returncode}
+        return result
+
+    def run_job(job):
+        if cancel.is_set():
+            return JobResult(job.name, "cancelled", log_path=job.log_path)
+        start = time.perf_counter()
+        with open(job.log_path, "wb") as log, (job.lock() if job.lock else contextlib.nullcontext()):
+            if cancel.is_set():
+                return JobResult(job.name, "cancelled", log_path=job.log_path)
+            if job.call is not None:
+                try:
+                    rc, output = job.call()
+                except OSError as e:
+                    rc, output = None, f"[ERROR] {e}\n".encode("utf-8")
+                log.write(output)
+                return finish(job, rc, start)
+            try:
+                proc = subprocess.Popen(job.argv, cwd=job.cwd, env=job.env, stdout=log, stderr=subprocess.STDOUT)
+            except OSError as e:
+                log.write(f"[ERROR] {e}\n".encode("utf-8"))
+                cancel.set()
+                _terminate_all(running, lock)
+                return JobResult(job.name, "failed", None, 0.0, job.log_path)
+            with lock:
+                running[job.name] = proc
+            # A failure may have landed between the check above and Popen.
+            if cancel.is_set():
+                proc.terminate()
+            rc = proc.wait()
+            with lock:
+                running.pop(job.name, None)
+        return finish(job, rc, start)
+
+    def finish(job, rc, start):
+        elapsed = time.perf_counter() - start
+        if rc == 0:
+            return JobResult(job.name, "ok", rc, elapsed, job.log_path)
+        if cancel.is_set():
+            return JobResult(job.name, "cancelled", rc, elapsed, job.log_path)
+        cancel.set()
+        _terminate_all(running, lock)
+        return JobResult(job.name, "failed", rc, elapsed, job.log_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers or default_workers(len(jobs))) as pool:
+        futures = [(job, pool.submit(run_one, job)) for job in jobs]
+        try:
+            results = {job.name: f.result() for job, f in futures}
+        except KeyboardInterrupt:
+            cancel.set()
+            _terminate_all(running, lock)
+            raise
+
+    for r in results.values():
+        tag = {"ok": "[SYSTEM]", "failed": "[ERROR]", "cancelled": "[WARN]"}[r.status]
+        print(f"{tag} {r.name}: {r.status} (rc={r.returncode}, {r.elapsed:.2f}s) -> {r.log_path}")
+    return results
+
+
+def _terminate_all(running, lock):
+    with lock:
+        procs = list(running.values())
+    for proc in procs:
+        if proc.poll() is None:
+            proc.terminate()
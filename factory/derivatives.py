@@ -0,0 +1,131 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_FIGURE_DERIVATIVES]
+[ROLE: LAYOUT-SIZED, CACHED, PARALLEL FIGURE RE-ENCODING]
+
+Reads the `\\derivedgraphics[width=<f>\\columnwidth]{<name>}` slots out of a
+generated .tex file and produces each figure at the pixel width that slot
+needs at the target DPI. Results are cached under `.factory/derived/<key>`
+where the key covers (source hash, width, quality), and linked into
+`derived/`. Without Pillow the originals are linked instead.
+
+`derived/` is build output and is not committed. The macro (see the IEEE
+template in `factory.venues`) falls back to the original file when the
+derived copy is missing, so the committed .tex also compiles from a fresh
+checkout, at full resolution.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+
+from factory import staging
+
+DERIVED_DIR = "derived"
+CACHE_DIR = os.path.join(".factory", "derived")
+MANIFEST_PATH = os.path.join(".factory", "derived.json")
+
+DPI = 300
+QUALITY = 85
+
+# IEEEtran journal geometry, in inches.
+WIDTHS_IN = {"columnwidth": 3.5, "textwidth": 7.16, "linewidth": 3.5}
+
+_SLOT = re.compile(r"\\derivedgraphics\[width=([\d.]*)\\(columnwidth|textwidth|linewidth)\]\{([^}]+)\}")
+
+
+def layout_slots(tex_path):
+    """{figure name: width in inches}, keeping the widest use of each figure."""
+    with open(tex_path, "r", encoding="utf-8") as f:
+        latex = f.read()
+    slots = {}
+    for frac, unit, name in _SLOT.findall(latex):
+        inches = float(frac or 1) * WIDTHS_IN[unit]
+        slots[name] = max(inches, slots.get(name, 0.0))
+    return slots
+
+
+def _render(src, dst, width_px, quality):
+    """Worker: downsample `src` to `width_px` and re-encode into `dst`."""
+    from PIL import Image
+
+    with Image.open(src) as im:
+        if im.width > width_px:
+            height = max(1, round(im.height * width_px / im.width))
+            im = im.resize((width_px, height), Image.LANCZOS)
+        tmp = dst + ".tmp"
+        if dst.endswith(".png"):
+            im.save(tmp, format="PNG", optimize=True)
+        else:
+            im.convert("RGB").save(tmp, format="JPEG", quality=quality, optimize=True, progressive=True)
+    os.replace(tmp, dst)
+    return dst
+
+
+def _have_pillow():
+    try:
+        import PIL.Image  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def derive(tex_path, dpi=DPI, quality=QUALITY, max_workers=None):
+    """Builds `derived/` for every slot in `tex_path`. Returns {name: cache path}."""
+    slots = layout_slots(tex_path)
+    digests = {name: rec["digest"]
+               for path, rec in staging.load_manifest()["staged"].items()
+               for name in [os.path.basename(path)]}
+    pillow = _have_pillow()
+    if not pillow:
+        print("[WARN] Pillow not installed. Linking full-resolution figures.")
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+    plan = {}
+    todo = []
+    for name, inches in slots.items():
+        width_px = math.ceil(inches * dpi)
+        if not pillow or name not in digests:
+            plan[name] = name
+            continue
+        digest = digests[name]
+        key = hashlib.sha256(f"{digest}:{width_px}:{quality}".encode("ascii")).hexdigest()
+        cached = os.path.join(CACHE_DIR, key + os.path.splitext(name)[1])
+        plan[name] = cached
+        if not os.path.exists(cached):
+            todo.append((name, width_px, cached))
+
+    if len(todo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_render, name, cached, width_px, quality) for name, width_px, cached in todo]
+            for future in futures:
+                future.result()
+    for name, width_px, cached in (todo if len(todo) == 1 else ()):
+        _render(name, cached, width_px, quality)
+    for name, width_px, _ in todo:
+        print(f"  [OK] Derived: {name} @ {width_px}px")
+
+    manifest = {}
+    if os.path.exists(MANIFEST_PATH):
+        try:
+            with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            print("[WARN] Derivative manifest unreadable. Relinking every figure.")
+    changed = False
+    for name, source in plan.items():
+        dst = os.path.join(DERIVED_DIR, name)
+        if manifest.get(name) == source and os.path.exists(dst) \
+                and os.path.getsize(dst) == os.path.getsize(source):
+            continue
+        staging.place(source, dst)
+        manifest[name] = source
+        changed = True
+    if changed:
+        with open(MANIFEST_PATH + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(MANIFEST_PATH + ".tmp", MANIFEST_PATH)
+    return plan
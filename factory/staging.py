@@ -0,0 +1,158 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_IMAGE_STAGING]
+[ROLE: CONTENT-ADDRESSED, LINK-OR-SKIP FIGURE STAGING]
+
+Sources are hashed once (then trusted while their size and mtime hold) and
+ingested into `.factory/cas/<aa>/<sha256>`. Staged names are hardlinks to the
+stored blob, falling back to a reflink and only then to a byte copy. The
+staging manifest records the digest behind every staged file.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+STORE_DIR = os.path.join(".factory", "cas")
+MANIFEST_PATH = os.path.join(".factory", "staging.json")
+
+PLACEHOLDER_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00\x00:\x7e\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82'
+
+FICLONE = 0x40049409  # Linux ioctl: share extents between two files.
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            print("[WARN] Staging manifest unreadable. Restaging.")
+    return {"sources": {}, "blobs": {}, "staged": {}}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def source_digest(path, manifest):
+    key = _stat_key(path)
+    hit = manifest["sources"].get(path)
+    if hit and hit[0] == key:
+        return hit[1]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    manifest["sources"][path] = [key, h.hexdigest()]
+    return h.hexdigest()
+
+
+def blob_path(digest):
+    return os.path.join(STORE_DIR, digest[:2], digest)
+
+
+def reflink(src, dst):
+    """Copy-on-write clone of `src` at `dst`. Raises OSError where unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflink unsupported on this platform")
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.remove(dst)
+            raise
+
+
+def place(src, dst, allow_hardlink=True):
+    """Materialise `src` at `dst`: hardlink, else reflink, else copy."""
+    tmp = dst + ".staging"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    method = "copy"
+    try:
+        if not allow_hardlink:
+            raise OSError
+        os.link(src, tmp)
+        method = "hardlink"
+    except OSError:
+        try:
+            reflink(src, tmp)
+            method = "reflink"
+        except OSError:
+            shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+    return method
+
+
+def ingest(src, digest, manifest):
+    """Ensure the store holds an intact blob for `digest`."""
+    blob = blob_path(digest)
+    recorded = manifest["blobs"].get(digest)
+    # A blob is shared with its staged hardlinks; an in-place edit of a staged
+    # file shows up here as a changed stat and forces a fresh ingest.
+    if recorded and os.path.exists(blob) and _stat_key(blob) == recorded:
+        return blob
+    os.makedirs(os.path.dirname(blob), exist_ok=True)
+    # Never hardlink sources into the store: editing the source in place
+    # would then silently change the stored blob.
+    place(src, blob, allow_hardlink=False)
+    manifest["blobs"][digest] = _stat_key(blob)
+    return blob
+
+
+def _write_placeholder(manifest):
+    digest = hashlib.sha256(PLACEHOLDER_PNG).hexdigest()
+    blob = blob_path(digest)
+    recorded = manifest["blobs"].get(digest)
+    if not (recorded and os.path.exists(blob) and _stat_key(blob) == recorded):
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        with open(blob, "wb") as f:
+            f.write(PLACEHOLDER_PNG)
+        manifest["blobs"][digest] = _stat_key(blob)
+    return digest, blob
+
+
+def stage(image_map, src_dir="images", dest_dir=".", manifest_path=MANIFEST_PATH):
+    """Stage `{source name: safe name}`. Returns `{safe name: sha256}`."""
+    manifest = load_manifest(manifest_path)
+    before = json.dumps(manifest, sort_keys=True)
+    digests = {}
+    for src_name, safe_name in image_map.items():
+        src = os.path.join(src_dir, src_name)
+        dst = os.path.join(dest_dir, safe_name)
+        if os.path.exists(src):
+            digest = source_digest(src, manifest)
+        else:
+            digest, _ = _write_placeholder(manifest)
+        digests[safe_name] = digest
+
+        record = manifest["staged"].get(dst)
+        if record and record["digest"] == digest and os.path.exists(dst) \
+                and _stat_key(dst) == record["stat"]:
+            continue
+        if os.path.exists(src):
+            blob = ingest(src, digest, manifest)
+        else:
+            print(f"[WARN] Missing {src}. Staging placeholder.")
+            blob = blob_path(digest)
+        method = place(blob, dst)
+        manifest["staged"][dst] = {"digest": digest, "stat": _stat_key(dst), "method": method}
+        # Hardlinks share the blob's inode; keep its recorded stat in step.
+        manifest["blobs"][digest] = _stat_key(blob)
+        print(f"  [OK] Staged: {safe_name} ({method})")
+
+    if json.dumps(manifest, sort_keys=True) != before:
+        save_manifest(manifest, manifest_path)
+    return digests
@@ -0,0 +1,164 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_TEMPLATES]
+[ROLE: CONTENT MODEL + PRECOMPILED VENUE TEMPLATES]
+
+The paper is described once as a `Paper` (title, abstract, sections with their
+figures, bibliography). A venue template is compiled once into a Python
+function and rendered against that model in a single pass, so N formats
+cost one model plus N renders.
+
+Template syntax (chosen not to collide with LaTeX braces):
+
+    <<title>>                 field, dotted paths allowed: <<f.caption>>
+    <<intro.body|strip>>      filters: strip, upper, lower
+    <<for s in sections>> ... <<end>>
+    <<if s.figures>> ... <<else>> ... <<end>>
+"""
+import re
+
+
+class TemplateError(Exception):
+    pass
+
+
+# ==========================================
+# 0. CONTENT MODEL
+# ==========================================
+class _Model:
+    # A stable repr lets the build graph fingerprint a whole model as a Value.
+    def __repr__(self):
+        return f"{type(self).__name__}({vars(self)!r})"
+
+
+class Figure(_Model):
+    def __init__(self, caption, images):
+        self.caption = caption
+        self.images = [{"width": width, "file": path} for width, path in images]
+
+
+class Section(_Model):
+    def __init__(self, heading, body, figures=()):
+        self.heading = heading
+        self.body = body
+        self.figures = list(figures)
+
+
+class Reference(_Model):
+    """One bibliography entry in both the short (IEEE) and full (Chicago) styles."""
+
+    def __init__(self, key, short, full):
+        self.key = key
+        self.short = short
+        self.full = full
+
+
+class Paper(_Model):
+    def __init__(self, title, author, affiliation, email, abstract, sections=(), bibliography=()):
+        self.title = title
+        self.author = author
+        self.affiliation = affiliation
+        self.email = email
+        self.abstract = abstract
+        self.sections = list(sections)
+        self.bibliography = list(bibliography)
+
+    @property
+    def intro(self):
+        return self.sections[0]
+
+    @property
+    def body_sections(self):
+        return self.sections[1:]
+
+
+# ==========================================
+# 1. COMPILER
+# ==========================================
+_TAG = re.compile(r"<<(.*?)>>", re.S)
+_FOR = re.compile(r"for\s+(\w+)\s+in\s+(\S+)$")
+_PATH = re.compile(r"[A-Za-z_]\w*(?:\.\w+)*$")
+
+FILTERS = {
+    "strip": str.strip,
+    "upper": str.upper,
+    "lower": str.lower,
+}
+
+
+def _get(obj, key):
+    if type(obj) is dict:
+        return obj[key]
+    return getattr(obj, key)
+
+
+def _expr(text, local_vars, where):
+    path, *filters = [p.strip() for p in text.split("|")]
+    if not _PATH.match(path):
+        raise TemplateError(f"{where}: bad expression <<{text}>>")
+    root, *attrs = path.split(".")
+    code = f"v_{root}" if root in local_vars else f"_get(ctx, {root!r})"
+    for attr in attrs:
+        code = f"_get({code}, {attr!r})"
+    for name in filters:
+        if name not in FILTERS:
+            raise TemplateError(f"{where}: unknown filter '{name}'")
+        code = f"_filters[{name!r}]({code})"
+    return code
+
+
+def compile_template(source, name="<template>"):
+    """Compiles `source` into `render(ctx) -> str`."""
+    lines = ["def render(ctx):", "    _o = []", "    _a = _o.append"]
+    depth = 1
+    blocks = []
+    local_vars = []
+    pos = 0
+
+    def emit(code):
+        lines.append("    " * depth + code)
+
+    for m in _TAG.finditer(source):
+        if m.start() > pos:
+            emit(f"_a({source[pos:m.start()]!r})")
+        pos = m.end()
+        tag = m.group(1).strip()
+        where = f"{name}:{source.count(chr(10), 0, m.start()) + 1}"
+        if tag.startswith("for "):
+            loop = _FOR.match(tag)
+            if not loop:
+                raise TemplateError(f"{where}: bad loop <<{tag}>>")
+            var, iterable = loop.groups()
+            emit(f"for v_{var} in {_expr(iterable, local_vars, where)}:")
+            local_vars.append(var)
+            blocks.append("for")
+            depth += 1
+            emit("pass")
+        elif tag.startswith("if "):
+            emit(f"if {_expr(tag[3:], local_vars, where)}:")
+            blocks.append("if")
+            depth += 1
+            emit("pass")
+        elif tag == "else":
+            if not blocks or blocks[-1] != "if":
+                raise TemplateError(f"{where}: <<else>> outside <<if>>")
+            blocks[-1] = "else"
+            emit_at = depth - 1
+            lines.append("    " * emit_at + "else:")
+            emit("pass")
+        elif tag == "end":
+            if not blocks:
+                raise TemplateError(f"{where}: unmatched <<end>>")
+            if blocks.pop() == "for":
+                local_vars.pop()
+            depth -= 1
+        else:
+            emit(f"_a({_expr(tag, local_vars, where)})")
+    if blocks:
+        raise TemplateError(f"{name}: unclosed <<{blocks[-1]}>>")
+    if pos < len(source):
+        emit(f"_a({source[pos:]!r})")
+    emit("return ''.join(_o)")
+
+    namespace = {"_get": _get, "_filters": FILTERS}
+    exec(compile("\n".join(lines), name, "exec"), namespace)
+    return namespace["render"]
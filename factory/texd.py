@@ -0,0 +1,178 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_TEX_DAEMON]
+[ROLE: WARM LOCAL COMPILE SERVICE]
+
+Tectonic has no resident mode, so the daemon keeps warm everything around it:
+the shared package/format cache (see `factory.toolchain`), exercised once at
+start-up so formats and bundle files are generated and paged in, and a
+persistent work directory per document that holds its intermediates (.aux,
+.toc, .log) between runs. Clients send one JSON line per job over a
+loopback socket and get one JSON line back. Only .tex files under the
+project root (the directory holding `factory/`) are compiled.
+
+    python -m factory.texd serve
+    python -m factory.texd compile HCI_Paper_Repo.tex
+    python -m factory.texd stop
+"""
+import hashlib
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+from factory import toolchain
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("FACTORY_TEXD_PORT", "47123"))
+STATE_DIR = os.path.abspath(os.path.join(".factory", "texd"))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+WARMUP_TEX = r"""\documentclass{article}
+\usepackage{amsmath,amssymb,graphicx,cite,setspace,xcolor}
+\begin{document}warm\end{document}
+"""
+
+
+# ==========================================
+# 0. SERVER
+# ==========================================
+class _State:
+    def __init__(self):
+        self.locks = {}
+        self.guard = threading.Lock()
+
+    def lock_for(self, tex_path):
+        with self.guard:
+            return self.locks.setdefault(tex_path, threading.Lock())
+
+
+def _in_project(path):
+    try:
+        return os.path.commonpath([path, PROJECT_ROOT]) == PROJECT_ROOT
+    except ValueError:  # another drive
+        return False
+
+
+def compile_document(state, tex_path):
+    """Compile in the document's persistent work dir, then publish the PDF."""
+    tex_path = os.path.abspath(tex_path)
+    if not tex_path.endswith(".tex") or not os.path.isfile(tex_path):
+        return {"returncode": 2, "elapsed": 0.0, "log": f"[ERROR] Not a .tex file: {tex_path}"}
+    name = os.path.splitext(os.path.basename(tex_path))[0]
+    workdir = os.path.join(STATE_DIR, "docs", hashlib.sha1(tex_path.encode("utf-8")).hexdigest()[:12])
+    os.makedirs(workdir, exist_ok=True)
+    start = time.perf_counter()
+    argv = toolchain.engine_argv(tex_path, ["--keep-intermediates", "--keep-logs", "--outdir", workdir])
+    with state.lock_for(tex_path), toolchain.prime_lock():
+        proc = subprocess.run(
+            argv, cwd=os.path.dirname(tex_path), env=toolchain.engine_env(),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        )
+        pdf = os.path.join(workdir, name + ".pdf")
+        if proc.returncode == 0 and os.path.exists(pdf):
+            target = os.path.join(os.path.dirname(tex_path), name + ".pdf")
+            shutil.copyfile(pdf, target + ".tmp")
+            os.replace(target + ".tmp", target)
+    return {
+        "returncode": proc.returncode,
+        "elapsed": time.perf_counter() - start,
+        "log": proc.stdout.decode("utf-8", "replace"),
+    }
+
+
+def warm_up(state):
+    """Prime the cache so the first real job does not pay for bundle and format setup."""
+    path = os.path.join(STATE_DIR, "warmup", "warmup.tex")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(WARMUP_TEX)
+    result = compile_document(state, path)
+    status = "ready" if result["returncode"] == 0 else "warm-up failed (continuing)"
+    print(f"[SYSTEM] texd {status} in {result['elapsed']:.2f}s.")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+        except ValueError:
+            return
+        if request.get("op") == "stop":
+            self._reply({"returncode": 0})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        elif request.get("op") == "ping":
+            self._reply({"returncode": 0, "pid": os.getpid()})
+        else:
+            tex_path = os.path.realpath(str(request.get("tex", "")))
+            if not _in_project(tex_path):
+                self._reply({"returncode": 2, "elapsed": 0.0, "log": f"[ERROR] Outside the project: {tex_path}"})
+                return
+            self._reply(compile_document(self.server.state, tex_path))
+
+    def _reply(self, payload):
+        self.wfile.write(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve(host=HOST, port=PORT):
+    toolchain.ensure_engine()
+    with _Server((host, port), _Handler) as server:
+        server.state = _State()
+        warm_up(server.state)
+        print(f"[SYSTEM] texd listening on {host}:{port}")
+        server.serve_forever()
+
+
+# ==========================================
+# 1. CLIENT
+# ==========================================
+def _request(payload, timeout=None, host=HOST, port=PORT):
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline().decode("utf-8"))
+
+
+def available(host=HOST, port=PORT):
+    try:
+        _request({"op": "ping"}, timeout=0.2, host=host, port=port)
+    except OSError:
+        return False
+    return True
+
+
+def submit(tex_path, timeout=None):
+    """Compile through a running daemon. Raises OSError if none is listening."""
+    return _request({"tex": os.path.abspath(tex_path)}, timeout=timeout)
+
+
+def main(argv):
+    if not argv or argv[0] not in ("serve", "compile", "stop"):
+        print(__doc__.strip())
+        return 2
+    if argv[0] == "serve":
+        serve()
+        return 0
+    if argv[0] == "stop":
+        _request({"op": "stop"}, timeout=2)
+        return 0
+    rc = 0
+    for tex in argv[1:]:
+        result = submit(tex)
+        sys.stdout.write(result["log"])
+        print(f"[SYSTEM] {tex}: rc={result['returncode']} in {result['elapsed']:.2f}s")
+        rc = rc or result["returncode"]
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,259 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_TOOLCHAIN]
+[ROLE: HASH-VERIFIED ENGINE CACHE + SHARED OFFLINE TEX BUNDLE]
+
+The tectonic binary for the host platform is downloaded once into a per-user
+cache, checked against a SHA-256 pin, and unpacked atomically. All compile
+jobs share one TECTONIC_CACHE_DIR. The first successful build primes it
+under a lock; after that every job runs with `--only-cached`, so builds need
+no network. A complete local bundle can be used instead through
+FACTORY_TEX_BUNDLE.
+
+Pins live in `toolchain.lock.json` next to this module, one SHA-256 per
+release asset. No asset is pinned yet, so the file is created by the first
+recording run: an asset without a pin is refused before anything is
+downloaded unless it is pinned for the run through TECTONIC_SHA256, or
+FACTORY_RECORD_PINS=1 is set to record the digest of the download. Check a
+recorded digest against the release's published checksum, then commit the
+lock file.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import platform
+import shutil
+import time
+
+VERSION = "0.14.1"
+RELEASE_URL = "https://github.com/tectonic-typesetting/tectonic/releases/download/tectonic%40{v}/{asset}"
+
+ASSETS = {
+    ("windows", "x86_64"): "tectonic-{v}-x86_64-pc-windows-msvc.zip",
+    ("linux", "x86_64"): "tectonic-{v}-x86_64-unknown-linux-musl.tar.gz",
+    ("linux", "aarch64"): "tectonic-{v}-aarch64-unknown-linux-musl.tar.gz",
+    ("darwin", "x86_64"): "tectonic-{v}-x86_64-apple-darwin.tar.gz",
+    ("darwin", "aarch64"): "tectonic-{v}-aarch64-apple-darwin.tar.gz",
+}
+
+LOCK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "toolchain.lock.json")
+
+
+class ToolchainError(Exception):
+    pass
+
+
+# ==========================================
+# 0. LOCATIONS
+# ==========================================
+def cache_root():
+    root = os.environ.get("FACTORY_CACHE")
+    if not root:
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") \
+            or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(base, "qpid-factory")
+    return root
+
+
+def tex_cache_dir():
+    return os.path.join(cache_root(), "tex-bundle")
+
+
+def host_key():
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+    machine = {"amd64": "x86_64", "x64": "x86_64", "arm64": "aarch64"}.get(machine, machine)
+    return system, machine
+
+
+def asset_name():
+    key = host_key()
+    if key not in ASSETS:
+        raise ToolchainError(f"No tectonic {VERSION} build for {key[0]}/{key[1]}.")
+    return ASSETS[key].format(v=VERSION)
+
+
+def engine_path():
+    """The engine this build will use, without downloading anything.
+
+    FACTORY_TECTONIC wins, then the portable `tectonic.exe` shipped next to
+    the scripts (Windows USB layout), then the hash-verified cached download.
+    """
+    explicit = os.environ.get("FACTORY_TECTONIC")
+    if explicit:
+        return explicit
+    if os.name == "nt" and os.path.exists("tectonic.exe"):
+        return os.path.abspath("tectonic.exe")
+    exe = "tectonic.exe" if os.name == "nt" else "tectonic"
+    asset_name()  # Fail early on hosts without a release build.
+    return os.path.join(cache_root(), "engines", VERSION, "-".join(host_key()), exe)
+
+
+# ==========================================
+# 1. LOCKING
+# ==========================================
+@contextlib.contextmanager
+def file_lock(name):
+    """Inter-process exclusive lock on `<cache>/locks/<name>.lock`."""
+    path = os.path.join(cache_root(), "locks", name + ".lock")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# ==========================================
+# 2. ENGINE
+# ==========================================
+def _load_pins():
+    if os.path.exists(LOCK_FILE):
+        with open(LOCK_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def _save_pin(asset, digest):
+    pins = _load_pins()
+    pins[asset] = digest
+    with open(LOCK_FILE + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(pins, f, indent=1, sort_keys=True)
+    os.replace(LOCK_FILE + ".tmp", LOCK_FILE)
+    print(f"[WARN] Recorded pin {digest[:16]}... for {asset} in {LOCK_FILE}; check it and commit the file.")
+
+
+def _download(url, dest):
+    import requests
+
+    h = hashlib.sha256()
+    tmp = dest + ".part"
+    r = requests.get(url, stream=True, timeout=60)
+    r.raise_for_status()
+    with open(tmp, "wb") as f:
+        for chunk in r.iter_content(chunk_size=1 << 16):
+            f.write(chunk)
+            h.update(chunk)
+    os.replace(tmp, dest)
+    return h.hexdigest()
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _extract(archive, dest_dir):
+    if archive.endswith(".zip"):
+        import zipfile
+        with zipfile.ZipFile(archive) as z:
+            z.extractall(dest_dir)
+    else:
+        import tarfile
+        # Use the safe extraction filter where this Python has it.
+        kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        with tarfile.open(archive) as t:
+            t.extractall(dest_dir, **kwargs)
+
+
+def ensure_engine():
+    """Returns a verified engine path, downloading it at most once per host."""
+    path = engine_path()
+    if os.path.exists(path):
+        return path
+    asset = asset_name()
+    with file_lock("engine"):
+        if os.path.exists(path):  # Another job finished the download while we waited.
+            return path
+        downloads = os.path.join(cache_root(), "downloads")
+        os.makedirs(downloads, exist_ok=True)
+        archive = os.path.join(downloads, asset)
+        expected = os.environ.get("TECTONIC_SHA256") or _load_pins().get(asset)
+        if not expected and os.environ.get("FACTORY_RECORD_PINS") != "1":
+            raise ToolchainError(f"No pin for {asset} in {LOCK_FILE}. "
+                                 "Pin it with TECTONIC_SHA256 or record it with FACTORY_RECORD_PINS=1.")
+        if os.path.exists(archive):
+            digest = _sha256(archive)
+        else:
+            print(f"[SYSTEM] Downloading {asset}...")
+            digest = _download(RELEASE_URL.format(v=VERSION, asset=asset), archive)
+        if expected and digest != expected:
+            os.remove(archive)
+            raise ToolchainError(f"Checksum mismatch for {asset}: got {digest}, pinned {expected}.")
+        if not expected:
+            _save_pin(asset, digest)
+
+        staging_dir = path + ".extract"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        _extract(archive, staging_dir)
+        binary = os.path.join(staging_dir, os.path.basename(path))
+        if not os.path.exists(binary):
+            raise ToolchainError(f"{asset} does not contain {os.path.basename(path)}.")
+        os.chmod(binary, 0o755)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(binary, path)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        print(f"[SUCCESS] Compiler installed: {path}")
+    return path
+
+
+# ==========================================
+# 3. SHARED BUNDLE
+# ==========================================
+def _primed_marker():
+    return os.path.join(tex_cache_dir(), ".primed-" + VERSION)
+
+
+def bundle_ready():
+    """True once a build has filled the shared cache (or a local bundle is configured)."""
+    return bool(os.environ.get("FACTORY_TEX_BUNDLE")) or os.path.exists(_primed_marker())
+
+
+def mark_bundle_ready():
+    os.makedirs(tex_cache_dir(), exist_ok=True)
+    with open(_primed_marker(), "w", encoding="utf-8") as f:
+        f.write(time.strftime("%Y-%m-%dT%H:%M:%S"))
+
+
+def engine_env():
+    env = dict(os.environ)
+    env["TECTONIC_CACHE_DIR"] = tex_cache_dir()
+    return env
+
+
+def prime_lock():
+    """Serialises compiles until the shared cache is primed, so that jobs do
+    not race each other fetching the same packages. A no-op afterwards."""
+    if bundle_ready():
+        return contextlib.nullcontext()
+    return file_lock("bundle")
+
+
+def engine_argv(tex_path, extra=()):
+    """Compile command line: offline once the shared cache is primed."""
+    argv = [engine_path(), *extra]
+    bundle = os.environ.get("FACTORY_TEX_BUNDLE")
+    if bundle:
+        argv += ["--bundle", bundle]
+    elif bundle_ready() and os.environ.get("FACTORY_OFFLINE", "1") != "0":
+        argv.append("--only-cached")
+    return argv + [tex_path]
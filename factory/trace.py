@@ -0,0 +1,167 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_TRACE]
+[ROLE: BUILD SPANS -> CHROME TRACE + SUMMARY]
+
+Off by default. `enable()` (or FACTORY_TRACE=1 in the environment) starts
+recording; at exit the spans are written as Chrome trace-event JSON under
+`.factory/traces/` (open in chrome://tracing or ui.perfetto.dev) and a
+per-span summary is printed next to the totals from the previous traced run
+of the same command. The totals are appended to `history.jsonl` so
+regressions show up across runs.
+
+When tracing is off, `traced` costs one flag check per call.
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+TRACE_DIR = os.path.join(".factory", "traces")
+HISTORY_PATH = os.path.join(TRACE_DIR, "history.jsonl")
+
+_active = False
+_events = []
+_threads = {}
+_origin = time.perf_counter_ns()
+
+
+def enabled():
+    return _active
+
+
+def enable():
+    """Start recording spans; export them when the interpreter exits."""
+    global _active
+    if not _active:
+        _active = True
+        atexit.register(finish)
+
+
+class span:
+    """Times the enclosed block as one complete ("X") trace event."""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat="build", **args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        if _active:
+            _record(self.name, self.cat, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+def traced(name=None, cat="build"):
+    """Decorator form of `span`, named after the function by default."""
+
+    def wrap(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not _active:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, cat, start, time.perf_counter_ns(), None)
+
+        return inner
+
+    return wrap
+
+
+def _record(name, cat, start, end, args):
+    thread = threading.current_thread()
+    _threads.setdefault(thread.ident, thread.name)
+    event = {"name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+             "ts": (start - _origin) / 1000, "dur": (end - start) / 1000}
+    if args:
+        event["args"] = args
+    _events.append(event)  # list.append is atomic; compile threads share it
+
+
+# ==========================================
+# EXPORT
+# ==========================================
+def totals():
+    """{span name: [count, total ms, max ms]} over everything recorded so far."""
+    out = {}
+    for e in _events:
+        row = out.setdefault(e["name"], [0, 0.0, 0.0])
+        ms = e["dur"] / 1000
+        row[0] += 1
+        row[1] += ms
+        row[2] = max(row[2], ms)
+    return out
+
+
+def export(path):
+    pid = os.getpid()
+    meta = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": tname}}
+            for tid, tname in _threads.items()]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": meta + _events, "displayTimeUnit": "ms"}, f)
+
+
+def summary(current, previous=None):
+    """Table of spans by total time, with the change against `previous`."""
+    previous = previous or {}
+    lines = [f"{'span':<32} {'calls':>6} {'total ms':>10} {'max ms':>10} {'prev ms':>10} {'delta':>8}"]
+    for name, (count, total, peak) in sorted(current.items(), key=lambda kv: -kv[1][1]):
+        prev = previous.get(name)
+        if prev:
+            delta = f"{(total - prev[1]) / prev[1] * 100:+.0f}%" if prev[1] else "-"
+            before = f"{prev[1]:.1f}"
+        else:
+            delta, before = "new", "-"
+        lines.append(f"{name:<32} {count:>6} {total:>10.1f} {peak:>10.1f} {before:>10} {delta:>8}")
+    return "\n".join(lines)
+
+
+def _last_totals(command):
+    try:
+        with open(HISTORY_PATH, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    for line in reversed(lines):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if entry.get("command") == command:
+            return entry["totals"]
+    return None
+
+
+def finish():
+    """Write the trace, print the summary and append this run to the history."""
+    if not _events:
+        return None
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(TRACE_DIR, f"trace-{stamp}-{os.getpid()}.json")
+    export(path)
+    current = totals()
+    command = " ".join(os.path.basename(a) if i == 0 else a for i, a in enumerate(sys.argv))
+    print(f"[SYSTEM] Trace: {path}")
+    print(summary(current, _last_totals(command)))
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"time": stamp, "command": command, "trace": path, "totals": current}) + "\n")
+    _events.clear()
+    return path
+
+
+if os.environ.get("FACTORY_TRACE", "") not in ("", "0"):
+    enable()
@@ -0,0 +1,128 @@
+"""
+[SYSTEM: ACADEMIC_FACTORY_VENUES]
+[ROLE: ONE TEMPLATE PER SUBMISSION FORMAT]
+
+Every template renders the same `factory.templates.Paper`. Templates are
+compiled on first use and kept for the life of the process.
+"""
+from factory.templates import compile_template
+
+IEEE = r"""
+\documentclass[journal]{IEEEtran}
+\usepackage[utf8]{inputenc}
+\usepackage{cite}
+\usepackage{amsmath,amssymb,amsfonts}
+\usepackage{graphicx}
+\usepackage{xcolor}
+% Layout-sized copies from derived/ when the figure stage has run, else the originals.
+\newcommand{\derivedgraphics}[2][]{\IfFileExists{derived/#2}{\includegraphics[#1]{derived/#2}}{\includegraphics[#1]{#2}}}
+
+\begin{document}
+\title{<<title>>}
+\author{<<author>>\\ \textit{<<affiliation>>}}
+\maketitle
+
+\begin{abstract}
+<<abstract>>
+\end{abstract}
+
+\section{<<intro.heading>>}
+\IEEEPARstart{W}{e} <<intro.body|strip>>
+<<for f in intro.figures>>\begin{figure}[h] \centering <<for i in f.images>>\derivedgraphics[width=<<i.width>>]{<<i.file>>} <<end>>\caption{<<f.caption>>} \end{figure}
+<<end>>
+<<for s in body_sections>>\section{<<s.heading>>}
+<<s.body>>
+<<for f in s.figures>>\begin{figure}[h] \centering <<for i in f.images>>\derivedgraphics[width=<<i.width>>]{<<i.file>>} <<end>>\caption{<<f.caption>>} \end{figure}
+<<end>>
+<<end>>\begin{thebibliography}{00}
+<<for b in bibliography>>\bibitem{<<b.key>>} <<b.short>>
+<<end>>\end{thebibliography}
+\end{document}
+    """
+
+BLIND = r"""
+\documentclass[12pt, letterpaper]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[margin=1in]{geometry}
+\usepackage{setspace}
+\usepackage{graphicx}
+\usepackage{amsmath}
+\usepackage{cite}
+
+\doublespacing
+
+\begin{document}
+
+\begin{center}
+    \textbf{\Large <<title>>}
+
+    \vspace{1cm}
+    \textit{[Author Details Redacted for Blind Review]}
+\end{center}
+
+\begin{abstract}
+\noindent <<abstract>>
+\end{abstract}
+
+\newpage
+
+<<for s in sections>>\section{<<s.heading>>}
+<<s.body>>
+
+<<end>>\newpage
+\begin{thebibliography}{00}
+<<for b in bibliography>>\bibitem{<<b.key>>} <<b.full>>
+<<end>>\end{thebibliography}
+
+\end{document}
+    """
+
+TITLE_PAGE = r"""
+\documentclass[12pt, letterpaper]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[margin=1in]{geometry}
+\usepackage{setspace}
+
+\begin{document}
+
+\vspace*{2cm}
+
+\begin{center}
+    \textbf{\Large <<title>>}
+
+    \vspace{2cm}
+
+    \textbf{<<author>>} \\
+    \vspace{0.5cm}
+    \textit{<<affiliation>>} \\
+    \texttt{<<email>>}
+
+    \vspace{3cm}
+\end{center}
+
+\noindent \textbf{Abstract:} \\
+<<abstract>>
+
+\vfill
+\noindent \textit{Corresponding Author: <<author>>}
+
+\end{document}
+    """
+
+TEMPLATES = {"ieee": IEEE, "blind": BLIND, "title": TITLE_PAGE}
+
+_compiled = {}
+
+
+def render(venue, paper):
+    fn = _compiled.get(venue)
+    if fn is None:
+        fn = _compiled[venue] = compile_template(TEMPLATES[venue], f"<venue:{venue}>")
+    return fn(paper)
+
+
+def write(venue, paper, path):
+    latex = render(venue, paper)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(latex)
+    return path
@@ -0,0 +1,4 @@
+"""
+[SYSTEM: ISOCHRON_PAYLOAD]
+[ROLE: LORENZ ENSEMBLE SOLVERS FOR THE ISOCHRON KEY]
+"""
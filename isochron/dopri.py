@@ -0,0 +1,259 @@
+"""
+[SYSTEM: ISOCHRON_DOPRI]
+[ROLE: ADAPTIVE DORMAND-PRINCE 5(4), BATCHED, WITH DENSE OUTPUT]
+
+Every ensemble member carries its own step size and is accepted or rejected
+on its own embedded error estimate, but the stages are still evaluated for
+the whole batch at once on the (3, N) layout of `isochron.lorenz`. Calm
+stretches of the attractor take long steps; lobe switches take short ones.
+
+The 4th-order continuous extension (Hairer's `contd5`) makes the solution
+available between steps: `t_eval` samples are interpolated as each step
+crosses them, and `dense=True` keeps every step's coefficients so a
+`DenseOutput` can be queried at any time afterwards. Dense storage grows with
+N x steps, so use `t_eval` for large ensembles.
+
+Members that finish early are parked (zero step) and dropped from the
+working arrays once enough of them have accumulated.
+"""
+import numpy as np
+
+from isochron.lorenz import Lorenz
+
+# Butcher tableau (Dormand & Prince 1980).
+A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# 5th-order minus 4th-order weights: the local error estimate.
+E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+# Dense-output weights for the 4th-order interpolant.
+D = (-12715105075 / 11282082432, 0.0, 87487479700 / 32700410799, -10690763975 / 1880347072,
+     701980252875 / 199316789632, -1453857185 / 822651844, 69997945 / 29380423)
+
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+COMPACT_FRACTION = 0.25  # drop parked members once they are this share of the batch
+
+
+class DenseOutput:
+    """Piecewise interpolant over every accepted step of every member.
+
+    `sol(t)` takes a scalar or a per-member (N,) array of times and returns
+    (N, 3).
+    """
+
+    def __init__(self, n, t0, t_end, members, t_old, h, coefs):
+        order = np.lexsort((t_old, members))
+        self.n = n
+        self.t0 = t0
+        self.t_end = t_end
+        self.members = members[order]
+        self.t_old = t_old[order]
+        self.h = h[order]
+        self.coefs = coefs[order]  # (steps, 5, 3)
+        # Offsetting each member's times by a multiple of the span makes one
+        # globally sorted key, so every lookup is a single searchsorted.
+        self._span = (t_end - t0) + 1.0
+        self._key = self.t_old + self.members * self._span
+
+    def __call__(self, t):
+        t = np.broadcast_to(np.asarray(t, dtype=np.float64), (self.n,))
+        if np.any(t < self.t0) or np.any(t > self.t_end):
+            raise ValueError(f"dense output is defined on [{self.t0}, {self.t_end}]")
+        q = t + np.arange(self.n) * self._span
+        seg = np.searchsorted(self._key, q, side="right") - 1
+        theta = (t - self.t_old[seg]) / self.h[seg]
+        return _contd5(self.coefs[seg].transpose(1, 2, 0), theta).T
+
+    @property
+    def nbytes(self):
+        return self.members.nbytes + self.t_old.nbytes + self.h.nbytes + self.coefs.nbytes
+
+
+class Solution:
+    def __init__(self, y, t_eval, ys, steps, rejected, dense):
+        self.y = y  # (N, 3) at t_end
+        self.t_eval = t_eval
+        self.ys = ys  # (N, len(t_eval), 3) or None
+        self.steps = steps  # accepted steps per member
+        self.rejected = rejected
+        self.dense = dense
+
+    @property
+    def nfev(self):
+        """Right-hand-side evaluations per member: 6 per attempt (FSAL) + 2 to start."""
+        return 6 * (self.steps + self.rejected) + 2
+
+
+def _contd5(rc, theta):
+    """Evaluate (5, 3, m) dense coefficients at fractions `theta` (m,) of each step."""
+    theta1 = 1.0 - theta
+    return rc[0] + theta * (rc[1] + theta1 * (rc[2] + theta * (rc[3] + theta1 * rc[4])))
+
+
+def _rms(v, scale):
+    return np.sqrt(np.mean((v / scale) ** 2, axis=0))
+
+
+class _Batch:
+    """Working arrays for the members still being integrated."""
+
+    def __init__(self, members, y, k1, t, h, model):
+        self.members = members
+        self.y = y
+        self.k1 = k1
+        self.t = t
+        self.h = h
+        self.model = model
+        n = len(members)
+        self.k = [k1] + [np.empty((3, n)) for _ in range(6)]
+        self.stage = np.empty((3, n))
+        self.scratch = np.empty((3, n))
+        self.tmp = np.empty(n)
+        self.live = np.ones(n, dtype=bool)
+
+    def take(self, keep):
+        model = self.model.take(keep)
+        return _Batch(self.members[keep], np.ascontiguousarray(self.y[:, keep]),
+                      np.ascontiguousarray(self.k1[:, keep]), self.t[keep], self.h[keep], model)
+
+
+def _initial_step(y0, f0, model, rtol, atol, order=5):
+    """Hairer, Norsett & Wanner's starting-step heuristic, per member."""
+    scale = atol + rtol * np.abs(y0)
+    d0 = _rms(y0, scale)
+    d1 = _rms(f0, scale)
+    h0 = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / np.maximum(d1, 1e-300))
+    f1 = model.rhs(y0 + h0 * f0, np.empty_like(y0), np.empty(y0.shape[1]))
+    d2 = _rms(f1 - f0, scale) / h0
+    dmax = np.maximum(d1, d2)
+    h1 = np.where(dmax <= 1e-15, np.maximum(1e-6, h0 * 1e-3), (0.01 / np.maximum(dmax, 1e-300)) ** (1.0 / order))
+    return np.minimum(100 * h0, h1)
+
+
+def solve(initial, t_end, t0=0.0, model=None, rtol=1e-6, atol=1e-9, t_eval=None, dense=False, max_steps=1_000_000):
+    """Integrates an (N, 3) ensemble from `t0` to `t_end` with per-member error control.
+
+    `t_eval` (sorted times in [t0, t_end]) are sampled through the dense
+    interpolant into `Solution.ys`; `dense=True` also returns a
+    `DenseOutput` for arbitrary later queries.
+    """
+    y0 = np.asarray(initial, dtype=np.float64)
+    model = model or Lorenz()
+    n = len(y0)
+    if t_eval is not None:
+        t_eval = np.asarray(t_eval, dtype=np.float64)
+        if t_eval.size and (t_eval[0] < t0 or t_eval[-1] > t_end or np.any(np.diff(t_eval) < 0)):
+            raise ValueError("t_eval must be sorted and lie within [t0, t_end]")
+    ys = np.empty((n, len(t_eval), 3)) if t_eval is not None else None
+    final = np.empty((n, 3))
+    steps = np.zeros(n, dtype=np.int64)
+    rejected = np.zeros(n, dtype=np.int64)
+    records = [] if dense else None
+
+    y = np.array(y0.T, order="C")  # always a copy: y is stepped in place
+    k1 = model.rhs(y, np.empty_like(y), np.empty(n))
+    h = _initial_step(y, k1, model, rtol, atol)
+    batch = _Batch(np.arange(n), y, k1, np.full(n, float(t0)), h, model)
+    next_sample = np.zeros(n, dtype=np.int64)
+    if t_eval is not None:
+        at_start = np.searchsorted(t_eval, t0, side="right")
+        ys[:, :at_start] = y0[:, None, :]
+        next_sample[:] = at_start
+
+    for _ in range(max_steps):
+        b = batch
+        h = np.where(b.live, np.minimum(b.h, t_end - b.t), 0.0)
+        k, stage, scratch, tmp = b.k, b.stage, b.scratch, b.tmp
+        for s in range(1, 7):
+            np.multiply(k[0], A[s][0], out=stage)
+            for j in range(1, s):
+                if A[s][j]:
+                    np.multiply(k[j], A[s][j], out=scratch)
+                    stage += scratch
+            stage *= h
+            stage += b.y
+            b.model.rhs(stage, k[s], tmp)
+        # The last tableau row is the 5th-order weights, so `stage` is now y1 and k[6] = f(y1).
+        y1 = stage
+        np.multiply(k[0], E[0], out=scratch)
+        for j in range(2, 7):
+            scratch += E[j] * k[j]
+        scratch *= h
+        err = _rms(scratch, atol + rtol * np.maximum(np.abs(b.y), np.abs(y1)))
+
+        accept = (err <= 1.0) & b.live
+        reject = ~accept & b.live
+        ok = np.flatnonzero(accept)
+        if ok.size:
+            members = b.members[ok]
+            steps[members] += 1
+            if records is not None or t_eval is not None:
+                rc = _dense_coefficients(b.y[:, ok], y1[:, ok], [kk[:, ok] for kk in k], h[ok])
+                t_old = b.t[ok]
+                if records is not None:
+                    records.append((members, t_old, h[ok], rc.transpose(2, 0, 1).copy()))
+                if t_eval is not None:
+                    _sample(t_eval, ys, next_sample, members, t_old, h[ok], rc)
+            b.y[:, ok] = y1[:, ok]
+            b.k1[:, ok] = k[6][:, ok]
+            # Land exactly on t_end rather than one rounding error short of it.
+            b.t[ok] = np.where(h[ok] == t_end - b.t[ok], t_end, b.t[ok] + h[ok])
+        rejected[b.members[reject]] += 1
+
+        factor = SAFETY * np.maximum(err, 1e-10) ** -0.2
+        factor = np.clip(factor, MIN_FACTOR, np.where(reject, 1.0, MAX_FACTOR))
+        b.h = np.where(b.live, np.maximum(h, 1e-300) * factor, 0.0)
+
+        done = accept & (b.t >= t_end)
+        if done.any():
+            final[b.members[done]] = b.y[:, done].T
+            b.live &= ~done
+        if not b.live.any():
+            break
+        if (~b.live).mean() >= COMPACT_FRACTION:
+            batch = b.take(np.flatnonzero(b.live))
+    else:
+        raise RuntimeError(f"max_steps={max_steps} reached before t_end={t_end}")
+
+    out = None
+    if records is not None:
+        out = DenseOutput(n, float(t0), float(t_end), *(np.concatenate(col) for col in zip(*records)))
+    return Solution(final, t_eval, ys, steps, rejected, out)
+
+
+def _dense_coefficients(y0, y1, k, h):
+    """(5, 3, m) contd5 coefficients for accepted steps from y0 to y1."""
+    ydiff = y1 - y0
+    bspl = h * k[0] - ydiff
+    rc4 = ydiff - h * k[6] - bspl
+    rc5 = D[0] * k[0]
+    for j in range(2, 7):
+        rc5 = rc5 + D[j] * k[j]
+    return np.stack([y0, ydiff, bspl, rc4, h * rc5])
+
+
+def _sample(t_eval, ys, next_sample, members, t_old, h, rc):
+    """Fill every `t_eval` sample these steps crossed; at most a few per step."""
+    t_new = t_old + h
+    pending = np.arange(len(members))
+    while pending.size:
+        idx = next_sample[members[pending]]
+        inside = idx < len(t_eval)
+        pending = pending[inside]
+        idx = idx[inside]
+        crossed = t_eval[idx] <= t_new[pending]
+        pending = pending[crossed]
+        idx = idx[crossed]
+        if not pending.size:
+            break
+        theta = (t_eval[idx] - t_old[pending]) / h[pending]
+        ys[members[pending], idx] = _contd5(rc[:, :, pending], theta).T
+        next_sample[members[pending]] += 1
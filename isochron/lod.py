@@ -0,0 +1,203 @@
+"""
+[SYSTEM: ISOCHRON_LOD]
+[ROLE: LEVEL-OF-DETAIL DECIMATION FOR THE DIVERGENCE VISUALIZER]
+
+Two views of a trajectory need two kinds of decimation:
+
+* against time (x, y, z vs t): `minmax()` keeps, per bin, the first, last,
+  lowest and highest sample of every channel, so with one bin per pixel
+  column the drawn envelope matches drawing every point. `SeriesPyramid`
+  precomputes this for bin widths 4, 8, 16, ... samples; a view of any time
+  window picks the coarsest level whose bins are no wider than a pixel
+  column and slices it with a binary search. Bins are not aligned to the
+  columns of an arbitrary window, so an extreme can land one column over;
+  it is never lost.
+* in phase space (the butterfly): `simplify()` is Ramer-Douglas-Peucker with
+  a hard distance bound. `PhasePyramid` builds each level from the one below
+  with double the tolerance, so every level stays within twice its nominal
+  tolerance of the full path, and a view picks the coarsest level whose
+  error is under half a pixel and keeps only the segments that cross the
+  viewport, marking where the kept path breaks off and resumes.
+
+Either way the number of points handed to the renderer is bounded by the
+size of the screen, not the length of the run.
+"""
+import numpy as np
+
+MIN_POINTS = 64  # stop coarsening once a level is this small
+
+
+# ==========================================
+# 1. TIME SERIES
+# ==========================================
+def minmax(values, width, lo=0):
+    """Sorted indices (offset by `lo`) keeping first/last/min/max per `width`-sample bin.
+
+    `values` is (n,) or (n, channels); extremes are kept for every channel.
+    """
+    values = np.asarray(values)
+    if values.ndim == 1:
+        values = values[:, None]
+    n = len(values)
+    if width <= 2 or n <= 4:
+        return np.arange(lo, lo + n)
+    full = n // width * width
+    keep = [np.arange(0, n, width), np.arange(width - 1, full, width), [n - 1]]
+    if full:
+        body = values[:full].reshape(-1, width, values.shape[1])
+        starts = np.arange(0, full, width)[:, None]
+        keep += [(starts + body.argmin(axis=1)).ravel(), (starts + body.argmax(axis=1)).ravel()]
+    if full < n:
+        tail = values[full:]
+        keep += [full + tail.argmin(axis=0), full + tail.argmax(axis=0)]
+    return lo + np.unique(np.concatenate(keep))
+
+
+class SeriesPyramid:
+    """Min-max levels of one (n, channels) series sampled every `dt`."""
+
+    def __init__(self, values, dt=1.0, t0=0.0):
+        self.values = np.asarray(values)
+        self.dt = dt
+        self.t0 = t0
+        n = len(self.values)
+        self.widths = [1]
+        self.levels = [None]  # level 0 is every sample
+        width = 4
+        while n // width * 4 >= MIN_POINTS:
+            self.widths.append(width)
+            self.levels.append(minmax(self.values, width))
+            width *= 2
+
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self.levels if level is not None)
+
+    def view(self, t0, t1, pixels):
+        """(times, values) for the window [t0, t1] drawn `pixels` columns wide."""
+        n = len(self.values)
+        i0 = max(0, int(np.floor((t0 - self.t0) / self.dt)))
+        i1 = min(n - 1, int(np.ceil((t1 - self.t0) / self.dt)))
+        if i1 < i0:
+            return np.empty(0), self.values[:0]
+        per_pixel = (i1 - i0 + 1) / max(1, pixels)
+        k = 0
+        for k in range(len(self.widths) - 1, -1, -1):
+            if self.widths[k] <= per_pixel:
+                break
+        if k == 0:
+            idx = np.arange(i0, i1 + 1)
+        else:
+            level = self.levels[k]
+            a, b = np.searchsorted(level, (i0, i1))
+            # The window's own edge samples keep the line continuous at the border.
+            idx = np.unique(np.concatenate(([i0], level[a:b], [i1])))
+        return self.t0 + idx * self.dt, self.values[idx]
+
+
+# ==========================================
+# 2. PHASE SPACE
+# ==========================================
+def _segment_distance(points, a, b):
+    """Distance from each of `points` to the segment a-b (any dimension)."""
+    ab = b - a
+    denom = float(ab @ ab)
+    if denom == 0.0:
+        return np.linalg.norm(points - a, axis=1)
+    t = np.clip((points - a) @ ab / denom, 0.0, 1.0)
+    return np.linalg.norm(points - (a + t[:, None] * ab), axis=1)
+
+
+def simplify(points, tolerance, index=None):
+    """Ramer-Douglas-Peucker: sorted indices of a polyline within `tolerance` of `points`.
+
+    `index`, if given, maps rows of `points` back to original sample numbers.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    index = np.arange(n) if index is None else index
+    if n <= 2:
+        return index.copy()
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        d = _segment_distance(points[lo + 1:hi], points[lo], points[hi])
+        j = int(d.argmax())
+        if d[j] > tolerance:
+            mid = lo + 1 + j
+            keep[mid] = True
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+    return index[keep]
+
+
+class PhasePyramid:
+    """RDP levels of one path, tolerance doubling from `tolerance` upward.
+
+    Coordinates are whatever the caller projects to (e.g. the x-z plane).
+    """
+
+    def __init__(self, points, tolerance):
+        self.points = np.asarray(points, dtype=np.float64)
+        self.tolerances = [0.0]
+        self.levels = [np.arange(len(self.points))]
+        tol = tolerance
+        while len(self.levels[-1]) > MIN_POINTS:
+            prev = self.levels[-1]
+            level = simplify(self.points[prev], tol, prev)
+            if len(level) == len(prev) and tol > tolerance * 1024:
+                break
+            self.tolerances.append(tol)
+            self.levels.append(level)
+            tol *= 2
+
+    def error_bound(self, k):
+        """Max distance of level k from the full path: its tolerances summed."""
+        return sum(self.tolerances[1:k + 1])
+
+    def view(self, bounds, pixel_size):
+        """Points to draw inside `bounds` ((lo, hi) per axis) at `pixel_size` units per pixel.
+
+        Picks the coarsest level within half a pixel of the true path and
+        keeps every segment that crosses the viewport, including those with
+        both ends outside it, so lines are still drawn to the border. Returns
+        (indices, points, breaks): `breaks[i]` is True where point i starts a
+        new run, i.e. is not joined to the point before it;
+        `np.split(points, np.flatnonzero(breaks)[1:])` gives one polyline per run.
+        """
+        k = 0
+        for j in range(len(self.levels)):
+            if self.error_bound(j) <= pixel_size / 2:
+                k = j
+        idx = self.levels[k]
+        pts = self.points[idx]
+        lo = np.asarray([b[0] for b in bounds], dtype=np.float64)
+        hi = np.asarray([b[1] for b in bounds], dtype=np.float64)
+        if len(pts) < 2:
+            keep = np.all((pts >= lo) & (pts <= hi), axis=1)
+            return idx[keep], pts[keep], keep[keep]
+        hit = _crosses(pts[:-1], pts[1:], lo, hi)
+        keep = np.zeros(len(pts), dtype=bool)
+        keep[:-1] |= hit
+        keep[1:] |= hit
+        breaks = np.ones(len(pts), dtype=bool)
+        breaks[1:] = ~hit
+        return idx[keep], pts[keep], breaks[keep]
+
+
+def _crosses(a, b, lo, hi):
+    """Per segment a-b, whether any part of it lies in the box [lo, hi] (slab clipping)."""
+    d = b - a
+    flat = d == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0 = (lo - a) / d
+        t1 = (hi - a) / d
+    # An axis the segment does not move along either always or never holds it.
+    within = (a >= lo) & (a <= hi)
+    enter = np.where(flat, np.where(within, -np.inf, np.inf), np.minimum(t0, t1))
+    leave = np.where(flat, np.where(within, np.inf, -np.inf), np.maximum(t0, t1))
+    return np.maximum(enter.max(axis=1), 0.0) <= np.minimum(leave.min(axis=1), 1.0)
@@ -0,0 +1,164 @@
+"""
+[SYSTEM: ISOCHRON_LORENZ]
+[ROLE: VECTORIZED ENSEMBLE INTEGRATION, CLASSIC RK4]
+
+The Isochron Key iterates the Lorenz system from the paper,
+
+    x' = sigma (y - x),   y' = x (rho - z) - y,   z' = x y - beta z,
+
+for a whole ensemble of perturbed initial conditions at once. Callers pass
+and receive (N, 3) arrays. Internally the state is held component-major,
+(3, N), so x, y and z are each one contiguous vector, and every RK4 stage
+writes into preallocated buffers: a step is a fixed number of whole-array
+ufunc calls whatever N is, and nothing is allocated inside the loop.
+
+Without an observer the ensemble is integrated in member blocks that fit in
+cache; the members are independent, so the result is identical.
+"""
+import numpy as np
+
+SIGMA = 10.0
+RHO = 28.0
+BETA = 8.0 / 3.0
+DT = 0.01
+STEPS = 1000
+ORIGIN = (1.0, 1.0, 1.0)
+
+BLOCK = 8192  # members per cache block (~15 state-sized buffers of 3 x 8192 float64)
+
+
+class Lorenz:
+    """The right-hand side. `sigma`, `rho`, `beta` are scalars or per-member (N,) arrays."""
+
+    def __init__(self, sigma=SIGMA, rho=RHO, beta=BETA):
+        self.sigma = np.asarray(sigma, dtype=np.float64)
+        self.rho = np.asarray(rho, dtype=np.float64)
+        self.beta = np.asarray(beta, dtype=np.float64)
+
+    def __repr__(self):
+        return f"Lorenz(sigma={self.sigma!r}, rho={self.rho!r}, beta={self.beta!r})"
+
+    @property
+    def per_member(self):
+        return any(p.ndim for p in (self.sigma, self.rho, self.beta))
+
+    def take(self, members):
+        """The same model restricted to `members` (a slice or index array)."""
+        if not self.per_member:
+            return self
+        pick = [p[members] if p.ndim else p for p in (self.sigma, self.rho, self.beta)]
+        return Lorenz(*pick)
+
+    def rhs(self, s, out, tmp):
+        """out <- f(s) for a (3, N) state; `tmp` is an (N,) scratch vector."""
+        x, y, z = s
+        dx, dy, dz = out
+        np.subtract(y, x, out=dx)
+        np.multiply(dx, self.sigma, out=dx)
+        np.subtract(self.rho, z, out=dy)
+        np.multiply(dy, x, out=dy)
+        np.subtract(dy, y, out=dy)
+        np.multiply(z, self.beta, out=tmp)
+        np.multiply(x, y, out=dz)
+        np.subtract(dz, tmp, out=dz)
+        return out
+
+
+class RK4:
+    """Fixed-step classic Runge-Kutta over a (3, N) state, updated in place."""
+
+    def __init__(self, model, n, dt=DT):
+        self.model = model
+        self.dt = dt
+        self.k1, self.k2, self.k3, self.k4, self.stage = (np.empty((3, n)) for _ in range(5))
+        self.tmp = np.empty(n)
+        self.evaluations = 0
+
+    def step(self, s):
+        f, dt, tmp = self.model.rhs, self.dt, self.tmp
+        k1, k2, k3, k4, stage = self.k1, self.k2, self.k3, self.k4, self.stage
+        f(s, k1, tmp)
+        np.multiply(k1, dt / 2, out=stage)
+        stage += s
+        f(stage, k2, tmp)
+        np.multiply(k2, dt / 2, out=stage)
+        stage += s
+        f(stage, k3, tmp)
+        np.multiply(k3, dt, out=stage)
+        stage += s
+        f(stage, k4, tmp)
+        # s += dt/6 (k1 + 2 k2 + 2 k3 + k4)
+        k2 += k3
+        k2 *= 2.0
+        k1 += k2
+        k1 += k4
+        k1 *= dt / 6
+        s += k1
+        self.evaluations += 4
+        return s
+
+
+# ==========================================
+# ENSEMBLES
+# ==========================================
+def perturbed(n, scale=1e-3, seed=0, origin=ORIGIN):
+    """`n` initial conditions: `origin` plus Gaussian offsets of size `scale`."""
+    rng = np.random.default_rng(seed)
+    return np.asarray(origin, dtype=np.float64) + scale * rng.standard_normal((n, 3))
+
+
+def _ensemble(initial):
+    """`initial` as a float (N, 3) array; a single (3,) point becomes (1, 3)."""
+    initial = np.asarray(initial, dtype=np.float64)
+    if initial.shape != (3,) and (initial.ndim != 2 or initial.shape[1] != 3):
+        raise ValueError(f"initial must have shape (N, 3) or (3,), got {initial.shape}")
+    return np.atleast_2d(initial)
+
+
+def integrate(initial, steps=STEPS, dt=DT, model=None, observe=None, every=1):
+    """Advances every member of `initial` (N, 3) by `steps` RK4 steps.
+
+    A single (3,) point is treated as N = 1. Returns the final (N, 3) state.
+    `observe(step, t, state)`, if given, is called at step 0 and every `every`
+    steps after, with `state` an (N, 3) read-only view that is only valid
+    during the call.
+    """
+    initial = _ensemble(initial)
+    model = model or Lorenz()
+    n = len(initial)
+    if observe is not None:
+        return _run(initial, steps, dt, model, observe, every)
+    out = np.empty_like(initial)
+    for lo in range(0, n, BLOCK):
+        part = slice(lo, min(lo + BLOCK, n))
+        out[part] = _run(initial[part], steps, dt, model.take(part), None, every)
+    return out
+
+
+def _run(initial, steps, dt, model, observe, every):
+    s = np.array(initial.T, order="C")  # always a copy: the caller's array is never stepped
+    solver = RK4(model, s.shape[1], dt)
+    view = s.T
+    view.flags.writeable = False
+    if observe is not None:
+        observe(0, 0.0, view)
+    for i in range(1, steps + 1):
+        solver.step(s)
+        if observe is not None and i % every == 0:
+            observe(i, i * dt, view)
+    return view.copy()
+
+
+def trajectory(initial, steps=STEPS, dt=DT, model=None, every=1):
+    """Integrates and records (N, steps // every + 1, 3) samples in memory.
+
+    Fine for demo-sized ensembles; larger runs should stream through `observe`.
+    """
+    initial = _ensemble(initial)
+    out = np.empty((len(initial), steps // every + 1, 3))
+
+    def record(step, t, state):
+        out[:, step // every] = state
+
+    integrate(initial, steps, dt, model, record, every)
+    return out
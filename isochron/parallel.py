@@ -0,0 +1,139 @@
+"""
+[SYSTEM: ISOCHRON_PARALLEL]
+[ROLE: SHARDED MULTI-CORE ENSEMBLES OVER SHARED MEMORY]
+
+The Monte Carlo members are independent, so the ensemble is cut into shards
+and integrated by a process pool. Inputs, per-member parameters and results
+live in `multiprocessing.shared_memory` blocks; a task carries only block
+names, a member range and scalars, and each worker writes its rows of the
+result in place. No array is ever pickled.
+
+Seeding is fixed per SEED_BLOCK members (stream = (seed, block index)) and
+shards are whole seed blocks, so generated ensembles are bit-identical for
+any worker count, including the in-process path.
+"""
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from isochron.lorenz import DT, ORIGIN, STEPS, Lorenz, integrate
+
+SEED_BLOCK = 4096
+SHARDS_PER_WORKER = 4  # a few shards per worker evens out stragglers
+
+
+def seeded(n, scale=1e-3, seed=0, origin=ORIGIN, lo=0, hi=None):
+    """Members lo:hi of the `n`-member ensemble for `seed`, independent of how it is split.
+
+    `lo` must be a multiple of SEED_BLOCK.
+    """
+    hi = n if hi is None else hi
+    if lo % SEED_BLOCK:
+        raise ValueError(f"lo must be a multiple of SEED_BLOCK ({SEED_BLOCK})")
+    out = np.empty((hi - lo, 3))
+    for start in range(lo, hi, SEED_BLOCK):
+        rng = np.random.default_rng([seed, start // SEED_BLOCK])
+        rows = min(SEED_BLOCK, n - start)
+        block = rng.standard_normal((rows, 3))
+        take = min(rows, hi - start)
+        out[start - lo:start - lo + take] = block[:take]
+    out *= scale
+    out += np.asarray(origin, dtype=np.float64)
+    return out
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track`
+        return shared_memory.SharedMemory(name=name)
+
+
+def _view(shm, shape):
+    return np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+
+def _shard(task):
+    """Worker: integrate members [lo, hi) and write them into the shared result."""
+    (lo, hi, n, steps, dt, out_name, in_name, params_name, scalars, seed, scale, origin) = task
+    blocks = [_attach(name) for name in (out_name, in_name, params_name) if name]
+    try:
+        # Inputs are copied out (a shard's worth) so that no view outlives
+        # the block; only the result rows are written through a view.
+        i = 1
+        if in_name:
+            initial = _view(blocks[i], (n, 3))[lo:hi].copy()
+            i += 1
+        else:
+            initial = seeded(n, scale, seed, origin, lo, hi)
+        if params_name:
+            model = Lorenz(*_view(blocks[i], (3, n))[:, lo:hi].copy())
+        else:
+            model = Lorenz(*scalars)
+        _view(blocks[0], (n, 3))[lo:hi] = integrate(initial, steps, dt, model)
+    finally:
+        for shm in blocks:
+            shm.close()
+    return hi - lo
+
+
+def _shared(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    _view(shm, array.shape)[...] = array
+    return shm
+
+
+def _shards(n, workers):
+    blocks = -(-n // SEED_BLOCK)
+    per = max(1, -(-blocks // (workers * SHARDS_PER_WORKER)))
+    return [(b * SEED_BLOCK, min(n, (b + per) * SEED_BLOCK)) for b in range(0, blocks, per)]
+
+
+def run(initial=None, n=None, steps=STEPS, dt=DT, model=None, workers=None, seed=0, scale=1e-3,
+        origin=ORIGIN):
+    """Final (N, 3) states of an RK4 ensemble integrated across `workers` processes.
+
+    Pass `initial` (N, 3), or `n` to have each worker generate its own
+    members with `seeded()`.
+    """
+    if (initial is None) == (n is None):
+        raise ValueError("pass exactly one of `initial` or `n`")
+    model = model or Lorenz()
+    if initial is not None:
+        initial = np.ascontiguousarray(initial, dtype=np.float64)
+        n = len(initial)
+    workers = max(1, workers or os.cpu_count() or 1)
+    shards = _shards(n, workers)
+
+    if workers == 1 or len(shards) == 1:
+        start = initial if initial is not None else seeded(n, scale, seed, origin)
+        return integrate(start, steps, dt, model)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    owned = [shared_memory.SharedMemory(create=True, size=n * 3 * 8)]
+    try:
+        in_name = params_name = None
+        scalars = None
+        if initial is not None:
+            owned.append(_shared(initial))
+            in_name = owned[-1].name
+        if model.per_member:
+            params = np.empty((3, n))
+            params[:] = [np.broadcast_to(p, (n,)) for p in (model.sigma, model.rho, model.beta)]
+            owned.append(_shared(params))
+            params_name = owned[-1].name
+        else:
+            scalars = (float(model.sigma), float(model.rho), float(model.beta))
+        tasks = [(lo, hi, n, steps, dt, owned[0].name, in_name, params_name, scalars, seed, scale, tuple(origin))
+                 for lo, hi in shards]
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            done = sum(pool.map(_shard, tasks))
+        if done != n:
+            raise RuntimeError(f"shards covered {done} of {n} members")
+        return _view(owned[0], (n, 3)).copy()
+    finally:
+        for shm in owned:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,93 @@
+"""
+[SYSTEM: ISOCHRON_SEEDING]
+[ROLE: PERTURBATION STRINGS -> INDEPENDENT PRNG STREAMS, IN BULK]
+
+"The script accepts a user string ('The Perturbation') and seeds a
+pseudo-random number generator." Here a whole batch of strings is handled
+at once:
+
+1. Each string is NFC-normalised and hashed with SHA-256 under a versioned
+   domain tag, giving a 256-bit key that does not depend on the platform,
+   the Python hash seed or the position of the string in the batch.
+2. The key drives a counter-based generator (SplitMix64 finalisers keyed by
+   the hash and indexed by draw number), evaluated for every string at once
+   with uint64 array arithmetic, so the batch costs one hash per distinct
+   string plus a few whole-array operations.
+3. Box-Muller turns the uniforms into the Gaussian initial-condition
+   offsets.
+
+The generator is written out here rather than taken from numpy.random so
+that a replayed workshop log produces the same coordinates on any numpy
+version. `seed_sequence()` is there for callers that want a full
+numpy Generator for one string.
+"""
+import hashlib
+import unicodedata
+
+import numpy as np
+
+from isochron.lorenz import ORIGIN
+
+DOMAIN = b"isochron/perturbation/v1\0"
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def digest(text):
+    """The 32-byte key for one perturbation string."""
+    return hashlib.sha256(DOMAIN + unicodedata.normalize("NFC", text).encode("utf-8")).digest()
+
+
+def keys(strings):
+    """(N, 4) uint64 keys; repeated strings are hashed once."""
+    seen = {}
+    raw = bytearray()
+    for text in strings:
+        key = seen.get(text)
+        if key is None:
+            key = seen[text] = digest(text)
+        raw += key
+    return np.frombuffer(bytes(raw), dtype="<u8").reshape(-1, 4).astype(np.uint64)
+
+
+def _mix(z):
+    z = z ^ (z >> np.uint64(30))
+    z = z * _M1
+    z = z ^ (z >> np.uint64(27))
+    z = z * _M2
+    return z ^ (z >> np.uint64(31))
+
+
+def uniforms(k, count):
+    """(N, count) floats in (0, 1]: draw j of stream k, for every stream at once."""
+    j = np.arange(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        inner = _mix(k[:, 1:2] + (j + np.uint64(1)) * _GOLDEN)
+        z = _mix(k[:, 0:1] ^ inner ^ (k[:, 2:3] * _GOLDEN) ^ k[:, 3:4])
+    return ((z >> np.uint64(11)).astype(np.float64) + 1.0) * 2.0 ** -53
+
+
+def normals(k, dim=3):
+    """(N, dim) standard normal draws per stream (Box-Muller)."""
+    pairs = -(-dim // 2)
+    u = uniforms(k, 2 * pairs)
+    r = np.sqrt(-2.0 * np.log(u[:, :pairs]))
+    theta = 2.0 * np.pi * u[:, pairs:]
+    return np.concatenate([r * np.cos(theta), r * np.sin(theta)], axis=1)[:, :dim]
+
+
+def offsets(strings, scale=1e-3, dim=3):
+    """(N, dim) Gaussian offsets of size `scale`, one row per perturbation string."""
+    return scale * normals(keys(strings), dim)
+
+
+def initial_conditions(strings, scale=1e-3, origin=ORIGIN):
+    """(N, 3) Lorenz starting points: `origin` nudged by each string's offset."""
+    return np.asarray(origin, dtype=np.float64) + offsets(strings, scale)
+
+
+def seed_sequence(text):
+    """A numpy SeedSequence for one string, for callers that want a full Generator."""
+    return np.random.SeedSequence(np.frombuffer(digest(text), dtype="<u4").astype(np.uint32))
@@ -0,0 +1,247 @@
+"""
+[SYSTEM: ISOCHRON_STORE]
+[ROLE: CHUNKED FLOAT32 TRAJECTORY FILES, MEMORY-MAPPED FOR READING]
+
+One file per ensemble run:
+
+    b"ISOTRAJ1"  header length (uint32 LE)  JSON header  padding to 4 KiB
+    chunk 0: float32 (N, chunk, 3)   chunk 1: ...   (last chunk zero-padded)
+
+Time is split into chunks of `chunk` samples, and each chunk is stored
+member-major, so one member's stretch of one chunk is a single contiguous
+run. `TrajectoryWriter` observes `isochron.lorenz.integrate`, fills one
+chunk-sized buffer in RAM and appends it with a plain write when full; the
+buffer size, not the trajectory size, bounds memory. `TrajectoryStore` maps
+the file read-only and copies out only the members and samples asked for,
+so ensembles far larger than RAM can be browsed without swapping.
+
+The header records which perturbation string seeded each member (and the
+offset scale, when `record()` derived the starting points itself), so a
+stored ensemble can be regenerated or extended. A file is only opened once
+it is marked complete and its size matches the chunk count in its header.
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+from isochron import seeding
+from isochron.lorenz import DT, STEPS, Lorenz, integrate
+
+MAGIC = b"ISOTRAJ1"
+VERSION = 1
+ALIGN = 4096
+CHUNK_BUDGET = 64 << 20  # bytes of RAM for the writer's chunk buffer
+SAMPLE_BYTES = 3 * 4
+
+
+class StoreError(Exception):
+    pass
+
+
+def _params(model):
+    return {name: getattr(model, name).tolist() for name in ("sigma", "rho", "beta")}
+
+
+def chunk_length(n_members, n_samples, budget=CHUNK_BUDGET):
+    """Samples per chunk so that one chunk buffer stays within `budget` bytes."""
+    return int(max(1, min(n_samples, budget // max(1, n_members * SAMPLE_BYTES))))
+
+
+class TrajectoryWriter:
+    """Observer that streams an integration into a trajectory file.
+
+    Pass it as `observe=` with the same `every`; `close()` (or the context
+    manager) marks the file complete. `perturbations`, if given, is the
+    string each member was seeded from, and `scale` the offset size.
+    """
+
+    def __init__(self, path, n_members, steps=STEPS, dt=DT, every=1, model=None, meta=None, chunk=None,
+                 perturbations=None, scale=None):
+        if perturbations is not None and len(perturbations) != n_members:
+            raise StoreError(f"{len(perturbations)} perturbations for {n_members} members")
+        self.path = path
+        self.n_members = n_members
+        self.n_samples = steps // every + 1
+        self.every = every
+        self.chunk = chunk or chunk_length(n_members, self.n_samples)
+        self.header = {
+            "version": VERSION,
+            "n_members": n_members,
+            "n_samples": self.n_samples,
+            "chunk": self.chunk,
+            "dtype": "float32",
+            "layout": "chunk,member,sample,xyz",
+            "dt": dt,
+            "every": every,
+            "steps": steps,
+            "params": _params(model or Lorenz()),
+            "perturbations": None if perturbations is None else [str(p) for p in perturbations],
+            "scale": scale,
+            "meta": meta or {},
+            "complete": False,
+        }
+        self._header_size = self._header_bytes()
+        self.buffer = np.zeros((n_members, self.chunk, 3), dtype=np.float32)
+        self.filled = 0  # samples in the current buffer
+        self.written = 0  # samples already on disk
+        self.f = open(path + ".tmp", "wb")
+        self.f.write(self._header_block())
+
+    def _header_bytes(self):
+        # Sized with "complete": false; the final header is never longer.
+        body = json.dumps(self.header, sort_keys=True).encode("utf-8")
+        return -(-(len(MAGIC) + 4 + len(body)) // ALIGN) * ALIGN
+
+    def _header_block(self):
+        body = json.dumps(self.header, sort_keys=True).encode("utf-8")
+        block = MAGIC + struct.pack("<I", len(body)) + body
+        if len(block) > self._header_size:
+            raise StoreError("header outgrew its reserved block")
+        return block + b" " * (self._header_size - len(block))
+
+    def observe(self, step, t, state):
+        if step % self.every:
+            return
+        self.buffer[:, self.filled] = state
+        self.filled += 1
+        if self.filled == self.chunk:
+            self._flush()
+
+    __call__ = observe
+
+    def _flush(self):
+        if not self.filled:
+            return
+        self.buffer[:, self.filled:] = 0
+        self.f.write(memoryview(self.buffer).cast("B"))
+        self.written += self.filled
+        self.filled = 0
+
+    def close(self):
+        if self.f.closed:
+            return
+        self._flush()
+        self.header["complete"] = self.written == self.n_samples
+        self.f.seek(0)
+        self.f.write(self._header_block())
+        self.f.close()
+        os.replace(self.path + ".tmp", self.path)
+
+    def __enter__(self):
+        return self
+
+    def abort(self):
+        """Discard a partial file, leaving any previous one at `path` in place."""
+        if not self.f.closed:
+            self.f.close()
+            os.remove(self.path + ".tmp")
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+class TrajectoryStore:
+    """Read-only, lazily paged view of a trajectory file.
+
+    `store[members, samples]` accepts ints, slices or index arrays for
+    `members` and an int or step-1 slice for `samples`, and returns float32
+    of shape (members, samples, 3) (dimensions given as ints are dropped).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            head = f.read(len(MAGIC) + 4)
+            if len(head) < len(MAGIC) + 4 or head[:len(MAGIC)] != MAGIC:
+                raise StoreError(f"{path} is not a trajectory file")
+            (length,) = struct.unpack("<I", head[len(MAGIC):])
+            try:
+                self.header = json.loads(f.read(length).decode("utf-8"))
+            except ValueError as exc:
+                raise StoreError(f"{path}: unreadable header ({exc})") from None
+        if self.header.get("version") != VERSION:
+            raise StoreError(f"unsupported trajectory file version {self.header.get('version')}")
+        if not self.header.get("complete"):
+            raise StoreError(f"{path} is incomplete: the run ended before all its samples were written")
+        self.n_members = self.header["n_members"]
+        self.n_samples = self.header["n_samples"]
+        self.chunk = self.header["chunk"]
+        self.perturbations = self.header.get("perturbations")
+        n_chunks = -(-self.n_samples // self.chunk)
+        offset = -(-(len(MAGIC) + 4 + length) // ALIGN) * ALIGN
+        expected = offset + n_chunks * self.n_members * self.chunk * SAMPLE_BYTES
+        if size != expected:
+            raise StoreError(f"{path} holds {size} bytes, its header describes {expected}")
+        self.data = np.memmap(path, dtype=np.float32, mode="r", offset=offset,
+                              shape=(n_chunks, self.n_members, self.chunk, 3))
+
+    @property
+    def shape(self):
+        return (self.n_members, self.n_samples, 3)
+
+    @property
+    def times(self):
+        return np.arange(self.n_samples) * self.header["dt"] * self.header["every"]
+
+    def sample_index(self, t):
+        """Nearest stored sample to time `t`."""
+        return int(round(t / (self.header["dt"] * self.header["every"])))
+
+    def __getitem__(self, key):
+        members, samples = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(samples, (int, np.integer)):
+            index = samples + self.n_samples if samples < 0 else samples
+            if not 0 <= index < self.n_samples:
+                raise IndexError("sample index out of range")
+            return np.array(self.data[index // self.chunk, members, index % self.chunk])
+        start, stop, stride = samples.indices(self.n_samples)
+        if stride != 1:
+            raise ValueError("sample slices must be contiguous; decimate after reading")
+        start = min(start, stop)
+        # Only the chunks overlapping [start, stop) are touched.
+        parts = []
+        for c in range(start // self.chunk, -(-stop // self.chunk)):
+            lo = max(start - c * self.chunk, 0)
+            hi = min(stop - c * self.chunk, self.chunk)
+            parts.append(self.data[c, members, lo:hi])
+        if not parts:
+            return np.empty((self.n_members, 0, 3), dtype=np.float32)[members]
+        return np.concatenate(parts, axis=-2)
+
+    def member(self, i, t0=None, t1=None):
+        """One member's (samples, 3) path between times t0 and t1 (inclusive)."""
+        lo = 0 if t0 is None else self.sample_index(t0)
+        hi = self.n_samples if t1 is None else self.sample_index(t1) + 1
+        return self[i, lo:hi]
+
+    def close(self):
+        mm = getattr(self.data, "_mmap", None)
+        self.data = None
+        if mm is not None:
+            mm.close()
+
+
+def record(path, initial=None, steps=STEPS, dt=DT, model=None, every=1, meta=None, chunk=None,
+           perturbations=None, scale=1e-3):
+    """Integrates `initial` with RK4 and streams the samples to `path`. Returns the final state.
+
+    `perturbations` (one string per member) is recorded in the header. Without
+    `initial`, the starting points are derived from them with
+    `seeding.initial_conditions(perturbations, scale)`.
+    """
+    if initial is None:
+        if perturbations is None:
+            raise StoreError("record() needs initial conditions or perturbation strings")
+        initial = seeding.initial_conditions(perturbations, scale)
+    else:
+        scale = None  # the offsets were not drawn here
+    initial = np.asarray(initial, dtype=np.float64)
+    with TrajectoryWriter(path, len(initial), steps, dt, every, model, meta, chunk, perturbations, scale) as writer:
+        return integrate(initial, steps, dt, model, writer, every)
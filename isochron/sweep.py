@@ -0,0 +1,196 @@
+"""
+[SYSTEM: ISOCHRON_SWEEP]
+[ROLE: RESUMABLE (SIGMA, RHO, BETA) GRID SWEEPS -> PER-CELL SUMMARIES]
+
+Every grid cell is one ensemble member with its own parameters, so a tile
+of cells is a single batched integration (`isochron.divergence.lyapunov`
+with per-member `Lorenz` parameters). Nothing per-step is kept: while the
+tile runs, `PeakStats` streams the summaries each cell needs,
+
+    lyapunov   maximal Lyapunov exponent            -> divergence heatmap
+    peaks      first PEAKS local maxima of z        -> bifurcation diagram
+    n_peaks    number of z maxima after transient
+    z_mean     mean z after transient
+    x_pos      fraction of time on the x > 0 lobe
+
+into `.npy` files opened as memmaps in the output directory. A tile's cells
+are flushed before the tile is recorded in `progress.json`, so an
+interrupted sweep resumes at the first unfinished tile and never trusts a
+half-written one. `sweep.json` pins the grid and settings; resuming with a
+different spec is refused.
+"""
+import json
+import os
+
+import numpy as np
+
+from isochron.divergence import lyapunov
+from isochron.lorenz import BETA, DT, ORIGIN, RHO, SIGMA, Lorenz
+
+TILE = 16384  # cells integrated together
+PEAKS = 32
+FIELDS = ("lyapunov", "n_peaks", "z_mean", "x_pos", "peaks")
+
+
+class SweepError(Exception):
+    pass
+
+
+class PeakStats:
+    """Streaming per-member summaries; fed by `lyapunov(..., divergence=stats)`."""
+
+    def __init__(self, n, transient_time, peaks=PEAKS):
+        self.transient_time = transient_time
+        self.peaks = np.full((n, peaks), np.nan, dtype=np.float32)
+        self.n_peaks = np.zeros(n, dtype=np.int64)
+        self.z_sum = np.zeros(n)
+        self.x_pos = np.zeros(n)
+        self.samples = 0
+        self.z1 = None  # z one and two observations ago
+        self.z2 = None
+        self._rows = np.arange(n)
+
+    def observe(self, step, t, state):
+        z = state[:, 2]
+        if t > self.transient_time:
+            self.z_sum += z
+            self.x_pos += state[:, 0] > 0
+            self.samples += 1
+            if self.z2 is not None:
+                peak = (self.z1 > self.z2) & (self.z1 >= z)
+                rows = self._rows[peak]
+                slot = self.n_peaks[rows]
+                room = slot < self.peaks.shape[1]
+                self.peaks[rows[room], slot[room]] = self.z1[rows[room]]
+                self.n_peaks[rows] += 1
+        # Rotate the two history buffers instead of allocating per step.
+        if self.z1 is None:
+            self.z1 = z.copy()
+        else:
+            if self.z2 is None:
+                self.z2 = np.empty_like(self.z1)
+            self.z1, self.z2 = self.z2, self.z1
+            self.z1[:] = z
+
+
+def grid_axes(sigma=SIGMA, rho=RHO, beta=BETA):
+    """The three parameter axes as 1-D arrays (scalars become length-1 axes)."""
+    return [np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (sigma, rho, beta)]
+
+
+def cell_params(axes, lo, hi):
+    """(sigma, rho, beta) arrays for flat cells [lo, hi) of the grid."""
+    shape = tuple(len(a) for a in axes)
+    i, j, k = np.unravel_index(np.arange(lo, hi), shape)
+    return axes[0][i], axes[1][j], axes[2][k]
+
+
+class Sweep:
+    """A sweep on disk in `directory`. `run()` starts or resumes it."""
+
+    def __init__(self, directory, sigma=SIGMA, rho=RHO, beta=BETA, steps=20000, dt=DT, transient=5000,
+                 origin=ORIGIN, renorm_every=10, tile=TILE, peaks=PEAKS):
+        self.directory = directory
+        self.axes = grid_axes(sigma, rho, beta)
+        self.shape = tuple(len(a) for a in self.axes)
+        self.cells = int(np.prod(self.shape))
+        self.tile = tile
+        self.spec = {
+            "sigma": self.axes[0].tolist(),
+            "rho": self.axes[1].tolist(),
+            "beta": self.axes[2].tolist(),
+            "steps": steps,
+            "dt": dt,
+            "transient": transient,
+            "origin": list(origin),
+            "renorm_every": renorm_every,
+            "tile": tile,
+            "peaks": peaks,
+        }
+
+    @property
+    def n_tiles(self):
+        return -(-self.cells // self.tile)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _open(self, mode):
+        shapes = {"lyapunov": (self.cells,), "n_peaks": (self.cells,), "z_mean": (self.cells,),
+                  "x_pos": (self.cells,), "peaks": (self.cells, self.spec["peaks"])}
+        dtypes = {"lyapunov": np.float32, "n_peaks": np.int32, "z_mean": np.float32,
+                  "x_pos": np.float32, "peaks": np.float32}
+        out = {}
+        for name in FIELDS:
+            path = self._path(name + ".npy")
+            if mode == "w+" or not os.path.exists(path):
+                out[name] = np.lib.format.open_memmap(path, mode="w+", dtype=dtypes[name], shape=shapes[name])
+                out[name][...] = np.nan if dtypes[name] is np.float32 else -1
+            else:
+                out[name] = np.lib.format.open_memmap(path, mode=mode)
+        return out
+
+    def _prepare(self):
+        os.makedirs(self.directory, exist_ok=True)
+        spec_path = self._path("sweep.json")
+        if os.path.exists(spec_path):
+            with open(spec_path, "r", encoding="utf-8") as f:
+                if json.load(f) != json.loads(json.dumps(self.spec)):
+                    raise SweepError(f"{self.directory} holds a different sweep; use a new directory")
+            return self._open("r+")
+        outputs = self._open("w+")
+        with open(spec_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.spec, f)
+        os.replace(spec_path + ".tmp", spec_path)
+        self._save_progress(set())
+        return outputs
+
+    def done(self):
+        path = self._path("progress.json")
+        if not os.path.exists(path):
+            return set()
+        with open(path, "r", encoding="utf-8") as f:
+            return set(json.load(f)["done"])
+
+    def _save_progress(self, done):
+        path = self._path("progress.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"done": sorted(done), "tiles": self.n_tiles}, f)
+        os.replace(path + ".tmp", path)
+
+    def run_tile(self, index, outputs):
+        spec = self.spec
+        lo, hi = index * self.tile, min(self.cells, (index + 1) * self.tile)
+        model = Lorenz(*cell_params(self.axes, lo, hi))
+        initial = np.broadcast_to(np.asarray(spec["origin"], dtype=np.float64), (hi - lo, 3))
+        stats = PeakStats(hi - lo, spec["transient"] * spec["dt"], spec["peaks"])
+        result = lyapunov(initial, spec["steps"], spec["dt"], model, renorm_every=spec["renorm_every"],
+                          transient=spec["transient"], divergence=stats)
+        outputs["lyapunov"][lo:hi] = result.exponents
+        outputs["n_peaks"][lo:hi] = stats.n_peaks
+        outputs["z_mean"][lo:hi] = stats.z_sum / max(1, stats.samples)
+        outputs["x_pos"][lo:hi] = stats.x_pos / max(1, stats.samples)
+        outputs["peaks"][lo:hi] = stats.peaks
+        for array in outputs.values():
+            array.flush()
+
+    def run(self, max_tiles=None, progress=print):
+        """Integrates every unfinished tile (at most `max_tiles` this call). Returns tiles left."""
+        outputs = self._prepare()
+        done = self.done()
+        todo = [i for i in range(self.n_tiles) if i not in done]
+        for count, index in enumerate(todo[:max_tiles] if max_tiles else todo):
+            self.run_tile(index, outputs)
+            done.add(index)
+            self._save_progress(done)
+            if progress:
+                progress(f"[SYSTEM] sweep tile {index + 1}/{self.n_tiles} done ({len(done)}/{self.n_tiles})")
+        return self.n_tiles - len(done)
+
+    def results(self):
+        """{field: read-only array shaped like the grid (peaks gain a trailing axis)}."""
+        out = {}
+        for name in FIELDS:
+            array = np.lib.format.open_memmap(self._path(name + ".npy"), mode="r")
+            out[name] = array.reshape(self.shape + array.shape[1:])
+        return out
@@ -0,0 +1,4 @@
+"""
+[SYSTEM: NATURA_PAYLOAD]
+[ROLE: LIQUID TIME-CONSTANT NETWORKS FOR THE Q-PID]
+"""
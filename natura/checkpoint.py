@@ -0,0 +1,214 @@
+"""
+[SYSTEM: NATURA_CHECKPOINT]
+[ROLE: ALIGNED, SELF-DESCRIBING MODEL FILES, MEMORY-MAPPED ON OPEN]
+
+Cold start is the moment the Q-PID is plugged in, so a model must open
+without reading, parsing or copying its weights:
+
+    b"NATCKPT1"  header length (uint32 LE)  JSON header  padding to 4 KiB
+    tensor 0 (raw, little-endian)  padding to 64 B  tensor 1  ...
+
+The header names every tensor with its dtype (explicit byte order), shape,
+offset and CRC-32, and carries the cell's settings (unfolds, dtype, units,
+inputs, outputs), the wiring's config and free-form `meta`. The wiring's
+synapse structure is stored as tensors too (CSR indptr / indices /
+polarity), so a checkpoint rebuilds the exact network without re-running
+a random wiring generator.
+
+`Checkpoint` maps the file once and hands out read-only ndarray views at
+the recorded offsets. Opening costs one header read and one mmap whatever
+the model size; pages are read from the stick the first time a tensor is
+touched, and `LTCCell` uses the views as its parameters without copying
+them (it derives its fused weights lazily, on the first step). Each tensor
+also sits at a 64-byte aligned offset of its own, so
+`np.memmap(path, dtype, offset=..., shape=...)` works on it directly.
+Checksums are only read by `verify()`, since checking them on open would
+page in every weight. Files are written to a temporary name and renamed,
+so a pulled stick never leaves a torn checkpoint behind.
+"""
+import json
+import os
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"NATCKPT1"
+VERSION = 1
+HEADER_ALIGN = 4096
+TENSOR_ALIGN = 64
+FORMAT = "natura-ltc"
+
+
+class CheckpointError(Exception):
+    pass
+
+
+def _align(n, to):
+    return -(-n // to) * to
+
+
+def write(path, tensors, config=None, meta=None):
+    """Writes {name: array} plus `config`/`meta` dicts to `path` atomically."""
+    arrays = {}
+    for name, value in tensors.items():
+        value = np.ascontiguousarray(value)
+        arrays[name] = value.astype(value.dtype.newbyteorder("<"), copy=False)
+    entries = {}
+    offset = 0
+    for name, value in arrays.items():
+        entries[name] = {"dtype": value.dtype.str, "shape": list(value.shape), "offset": offset,
+                         "nbytes": value.nbytes, "crc32": zlib.crc32(memoryview(value).cast("B"))}
+        offset = _align(offset + value.nbytes, TENSOR_ALIGN)
+    header = {"version": VERSION, "format": FORMAT, "config": config or {}, "meta": meta or {},
+              "tensors": entries}
+    body = json.dumps(header, sort_keys=True).encode("utf-8")
+    base = _align(len(MAGIC) + 4 + len(body), HEADER_ALIGN)
+    for entry in entries.values():
+        entry["offset"] += base
+    # Absolute offsets can lengthen the header; grow the reserved block until it fits.
+    body = json.dumps(header, sort_keys=True).encode("utf-8")
+    while len(MAGIC) + 4 + len(body) > base:
+        shift = HEADER_ALIGN
+        base += shift
+        for entry in entries.values():
+            entry["offset"] += shift
+        body = json.dumps(header, sort_keys=True).encode("utf-8")
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            block = MAGIC + struct.pack("<I", len(body)) + body
+            f.write(block + b"\0" * (base - len(block)))
+            for name, value in arrays.items():
+                f.seek(entries[name]["offset"])
+                f.write(memoryview(value).cast("B"))
+            f.truncate(max([base] + [e["offset"] + e["nbytes"] for e in entries.values()]))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return path
+
+
+class Checkpoint:
+    """Read-only mapped checkpoint; `ckpt[name]` is a zero-copy view of one tensor."""
+
+    def __init__(self, path):
+        self.path = path
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            head = f.read(len(MAGIC) + 4)
+            if len(head) < len(MAGIC) + 4 or head[:len(MAGIC)] != MAGIC:
+                raise CheckpointError(f"{path} is not a NATURA checkpoint")
+            (length,) = struct.unpack("<I", head[len(MAGIC):])
+            try:
+                self.header = json.loads(f.read(length).decode("utf-8"))
+            except ValueError as exc:
+                raise CheckpointError(f"{path}: unreadable header ({exc})") from None
+        if self.header.get("version") != VERSION:
+            raise CheckpointError(f"unsupported checkpoint version {self.header.get('version')}")
+        self.config = self.header["config"]
+        self.meta = self.header["meta"]
+        self.entries = self.header["tensors"]
+        for name, entry in self.entries.items():
+            if entry["offset"] % TENSOR_ALIGN or entry["offset"] + entry["nbytes"] > size:
+                raise CheckpointError(f"{path}: tensor {name!r} lies outside the file")
+        self._map = np.memmap(path, dtype=np.uint8, mode="r") if size else None
+        self._views = {}
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __getitem__(self, name):
+        view = self._views.get(name)
+        if view is None:
+            entry = self.entries[name]
+            dtype = np.dtype(entry["dtype"])
+            view = np.ndarray(entry["shape"], dtype=dtype, buffer=self._map, offset=entry["offset"])
+            self._views[name] = view
+        return view
+
+    @property
+    def names(self):
+        return list(self.entries)
+
+    @property
+    def nbytes(self):
+        return sum(entry["nbytes"] for entry in self.entries.values())
+
+    def memmap(self, name):
+        """The tensor as its own `np.memmap` (same bytes, separate mapping)."""
+        entry = self.entries[name]
+        return np.memmap(self.path, dtype=np.dtype(entry["dtype"]), mode="r", offset=entry["offset"],
+                         shape=tuple(entry["shape"]))
+
+    def verify(self):
+        """Checks every tensor's CRC-32 (reads the whole file). Raises CheckpointError on a mismatch."""
+        for name, entry in self.entries.items():
+            if zlib.crc32(memoryview(np.ascontiguousarray(self[name])).cast("B")) != entry["crc32"]:
+                raise CheckpointError(f"{self.path}: tensor {name!r} is corrupt")
+        return True
+
+    def close(self):
+        self._views = {}
+        mm = getattr(self._map, "_mmap", None)
+        self._map = None
+        if mm is not None:
+            mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+# ==========================================
+# LTC CELLS
+# ==========================================
+def save(path, cell, meta=None):
+    """Writes an `LTCCell` (parameters and wiring) to `path`."""
+    tensors = dict(cell.params)
+    for prefix, csr in (("synapses", cell.synapses), ("sensory_synapses", cell.sensory_synapses)):
+        tensors[f"{prefix}.indptr"] = csr.indptr
+        tensors[f"{prefix}.indices"] = csr.indices
+        tensors[f"{prefix}.polarity"] = csr.data
+    config = {
+        "unfolds": cell.unfolds,
+        "dtype": cell.dtype.str,
+        "units": cell.units,
+        "inputs": cell.inputs,
+        "outputs": cell.outputs,
+        "wiring": cell.wiring.config,
+    }
+    return write(path, tensors, config, meta)
+
+
+def load(path):
+    """An `LTCCell` whose parameters are views into the mapped checkpoint at `path`.
+
+    The mapping stays open for as long as the cell's arrays are referenced.
+    """
+    from natura.csr import CSR
+    from natura.ltc import PARAMS, LTCCell
+    from natura.wiring import Fixed
+
+    ckpt = Checkpoint(path)
+    config = ckpt.config
+    missing = [name for name in PARAMS if name not in ckpt]
+    if missing:
+        raise CheckpointError(f"{path}: missing tensors {', '.join(missing)}")
+    synapses = CSR(ckpt["synapses.indptr"], ckpt["synapses.indices"], ckpt["synapses.polarity"], config["units"])
+    sensory = CSR(ckpt["sensory_synapses.indptr"], ckpt["sensory_synapses.indices"],
+                  ckpt["sensory_synapses.polarity"], config["inputs"])
+    wiring = Fixed(synapses, sensory, config["outputs"], config.get("wiring"))
+    params = {name: ckpt[name] for name in PARAMS}
+    cell = LTCCell(wiring, unfolds=config["unfolds"], dtype=np.dtype(config["dtype"]).newbyteorder("="),
+                   params=params)
+    cell.checkpoint = ckpt
+    return cell
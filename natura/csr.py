@@ -0,0 +1,84 @@
+"""
+[SYSTEM: NATURA_CSR]
+[ROLE: COMPRESSED SPARSE ROW SYNAPSE STORAGE]
+
+Synapses are stored grouped by their target neuron: row i of the matrix is
+the list of synapses onto neuron i, `indices` holds their presynaptic
+neurons and `data` their polarity. Per-synapse parameters are flat (nnz,)
+arrays in the same order, so memory and work both scale with the number of
+synapses rather than with neurons squared.
+
+The LTC update needs more than a plain sparse matrix-vector product: every
+synapse applies its own sigmoid to its presynaptic value before the sum.
+So the product is done in two whole-array passes, a gather
+(`x[:, indices]`, one column per synapse, for the whole batch) and a
+segmented sum per row (`np.add.reduceat` over `indptr`).
+"""
+import numpy as np
+
+
+class CSR:
+    """`n_rows` x `n_cols` sparse matrix; rows are postsynaptic, columns presynaptic neurons."""
+
+    def __init__(self, indptr, indices, data, n_cols):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data)
+        self.n_rows = len(self.indptr) - 1
+        self.n_cols = n_cols
+        counts = np.diff(self.indptr)
+        self._rows = np.flatnonzero(counts)
+        self._starts = self.indptr[:-1][self._rows]
+        self._dense_rows = len(self._rows) == self.n_rows
+
+    @classmethod
+    def from_edges(cls, pre, post, data, n_pre, n_post):
+        """Builds from parallel (pre, post, value) lists; duplicate edges are an error."""
+        pre = np.asarray(pre, dtype=np.int64)
+        post = np.asarray(post, dtype=np.int64)
+        data = np.asarray(data)
+        order = np.lexsort((pre, post))
+        pre, post, data = pre[order], post[order], data[order]
+        if len(pre) > 1 and np.any((np.diff(post) == 0) & (np.diff(pre) == 0)):
+            raise ValueError("duplicate synapse")
+        indptr = np.zeros(n_post + 1, dtype=np.int64)
+        np.cumsum(np.bincount(post, minlength=n_post), out=indptr[1:])
+        return cls(indptr, pre, data, n_pre)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """From a (pre, post) matrix; nonzero entries become synapses."""
+        matrix = np.asarray(matrix)
+        pre, post = np.nonzero(matrix)
+        return cls.from_edges(pre, post, matrix[pre, post], *matrix.shape)
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    @property
+    def post(self):
+        """(nnz,) target neuron of every synapse."""
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+    def to_dense(self):
+        """The (pre, post) matrix of `data`."""
+        out = np.zeros((self.n_cols, self.n_rows), dtype=self.data.dtype)
+        out[self.indices, self.post] = self.data
+        return out
+
+    def gather(self, x, out=None):
+        """(batch, nnz): the presynaptic value of every synapse, for (batch, n_cols) `x`."""
+        return np.take(x, self.indices, axis=1, out=out)
+
+    def segment_sum(self, values, out):
+        """out (batch, n_rows) <- per-row sums of per-synapse (batch, nnz) `values`."""
+        if not self.nnz:
+            out[...] = 0
+        elif self._dense_rows:
+            np.add.reduceat(values, self._starts, axis=1, out=out)
+        else:
+            # reduceat over an empty row would return the next element, not 0.
+            out[...] = 0
+            out[:, self._rows] = np.add.reduceat(values, self._starts, axis=1)
+        return out
@@ -0,0 +1,234 @@
+"""
+[SYSTEM: NATURA_LTC]
+[ROLE: BATCHED LIQUID TIME-CONSTANT CELL, FUSED SEMI-IMPLICIT UPDATE]
+
+The Q-PID payload solves, for every neuron i,
+
+    dx_i/dt = -[1/tau_i + f_i(x, I)] x_i + A_i(x, I)
+
+with tau_i = cm_i / gleak_i (plus the leak reversal vleak_i) and the
+liquid part carried by synapses: every synapse j -> i opens with a
+conductance g_ji = w_ji * sigmoid(gamma_ji (x_j - mu_ji)), so that
+f_i = sum_j g_ji / cm_i and A_i = sum_j g_ji E_ji / cm_i, E being the
+synapse's reversal potential. Sensory synapses do the same from the input
+I(t) instead of x.
+
+The fused step treats the decay term implicitly and the synaptic drive
+explicitly (Hasani et al.), which stays stable for stiff time constants
+where explicit Euler blows up:
+
+    x <- (cm/h x + gleak vleak + sum g E) / (cm/h + gleak + sum g)
+
+applied UNFOLDS times per input sample with h = dt / UNFOLDS.
+
+Synapses come from a `natura.wiring` wiring and are stored as CSR
+(`natura.csr`): every per-synapse parameter is a flat (nnz,) array, and a
+synaptic sum is a gather of presynaptic values followed by a segmented sum
+per target neuron, so memory and work scale with the synapse count, not
+with neurons squared. Everything else is a whole-array operation over
+(batch, neuron) or (batch, synapse): the sigmoid is `tanh` with its 1/2
+folded into gamma and the weights, sensory conductances depend only on the
+sample so they are computed once per sample rather than once per unfold,
+and all scratch buffers are allocated once per batch size. There is no
+per-neuron or per-sequence Python loop; the only loop is over time.
+
+`dt` may be a scalar or one value per sequence, so irregularly sampled
+sequences are integrated over their real gaps. Weights are for inference;
+they are drawn from the usual LTC initialisation ranges or loaded.
+"""
+import numpy as np
+
+UNFOLDS = 6
+EPSILON = 1e-8  # keeps the denominator off zero for fully silent neurons
+
+PARAMS = ("gleak", "vleak", "cm", "w", "mu", "gamma", "erev",
+          "sensory_w", "sensory_mu", "sensory_gamma", "sensory_erev",
+          "input_w", "input_b", "output_w", "output_b")
+
+
+def _uniform(rng, lo, hi, shape, dtype):
+    return rng.uniform(lo, hi, shape).astype(dtype)
+
+
+class LTCCell:
+    """LTC neurons wired by `wiring`; its first `outputs` neurons are read out."""
+
+    def __init__(self, wiring, unfolds=UNFOLDS, seed=0, dtype=np.float32, params=None):
+        self.wiring = wiring
+        self.units = wiring.units
+        self.inputs = wiring.inputs
+        self.outputs = wiring.outputs
+        self.unfolds = unfolds
+        self.dtype = np.dtype(dtype)
+        self.synapses = wiring.synapses
+        self.sensory_synapses = wiring.sensory_synapses
+        if params is None:
+            params = self._initial_params(np.random.default_rng(seed))
+        self.load(params)
+
+    def _initial_params(self, rng):
+        units, inputs, dtype = self.units, self.inputs, self.dtype
+        nnz, s_nnz = self.synapses.nnz, self.sensory_synapses.nnz
+        return {
+            "gleak": _uniform(rng, 0.001, 1.0, units, dtype),
+            "vleak": _uniform(rng, -0.2, 0.2, units, dtype),
+            "cm": _uniform(rng, 0.4, 0.6, units, dtype),
+            "w": _uniform(rng, 0.001, 1.0, nnz, dtype),
+            "mu": _uniform(rng, 0.3, 0.8, nnz, dtype),
+            "gamma": _uniform(rng, 3.0, 8.0, nnz, dtype),
+            "erev": self.synapses.data.astype(dtype),
+            "sensory_w": _uniform(rng, 0.001, 1.0, s_nnz, dtype),
+            "sensory_mu": _uniform(rng, 0.3, 0.8, s_nnz, dtype),
+            "sensory_gamma": _uniform(rng, 3.0, 8.0, s_nnz, dtype),
+            "sensory_erev": self.sensory_synapses.data.astype(dtype),
+            "input_w": np.ones(inputs, dtype=dtype),
+            "input_b": np.zeros(inputs, dtype=dtype),
+            "output_w": np.ones(self.outputs, dtype=dtype),
+            "output_b": np.zeros(self.outputs, dtype=dtype),
+        }
+
+    @property
+    def params(self):
+        return {name: getattr(self, name) for name in PARAMS}
+
+    @property
+    def nbytes(self):
+        return sum(value.nbytes for value in self.params.values())
+
+    def load(self, params):
+        """Replaces parameters from a {name: array} mapping.
+
+        Arrays already of the cell's dtype are used as they are, not copied,
+        so memory-mapped checkpoint tensors stay mapped.
+        """
+        for name in PARAMS:
+            if name in params:
+                setattr(self, name, np.asarray(params[name], dtype=self.dtype))
+        self.prepare()
+        return self
+
+    def prepare(self):
+        """Marks the fused weights stale. Call after editing parameters; the next step re-derives them."""
+        self._fused = None
+        self._buffers = {}
+        self._capacity = 0
+
+    def _fuse(self):
+        """Folds constants into the arrays the step actually reads."""
+        # sigmoid(g (x - mu)) = 0.5 + 0.5 tanh(g/2 (x - mu)); the 0.5s fold into the weights.
+        fused = {}
+        for prefix, csr in (("", self.synapses), ("sensory_", self.sensory_synapses)):
+            w = getattr(self, prefix + "w") / 2
+            w_erev = w * getattr(self, prefix + "erev")
+            base = np.empty((1, csr.n_rows), dtype=self.dtype)
+            base_erev = np.empty((1, csr.n_rows), dtype=self.dtype)
+            csr.segment_sum(w[None, :], base)
+            csr.segment_sum(w_erev[None, :], base_erev)
+            fused[prefix] = (csr, (getattr(self, prefix + "gamma") / 2).astype(self.dtype),
+                             getattr(self, prefix + "mu"), w.astype(self.dtype),
+                             w_erev.astype(self.dtype), base[0], base_erev[0])
+        self._leak = (self.gleak * self.vleak).astype(self.dtype)
+        self._fused = fused
+        return fused
+
+    def _scratch(self, batch):
+        """Scratch buffers for `batch` rows: leading slices of one set sized for the largest batch seen.
+
+        Streaming sessions step shrinking prefixes of a batch, so one set
+        serves every size without reallocating.
+        """
+        if self._capacity < batch:
+            n, m, dt = self.units, self.inputs, self.dtype
+            self._capacity = batch
+            self._buffers = {
+                "act": np.empty((batch, self.synapses.nnz), dt),
+                "prod": np.empty((batch, self.synapses.nnz), dt),
+                "sact": np.empty((batch, self.sensory_synapses.nnz), dt),
+                "sprod": np.empty((batch, self.sensory_synapses.nnz), dt),
+                "drive": np.empty((batch, m), dt),
+                "num": np.empty((batch, n), dt),
+                "den": np.empty((batch, n), dt),
+                "s_num": np.empty((batch, n), dt),
+                "s_den": np.empty((batch, n), dt),
+                "cm_h": np.empty((batch, n), dt),
+                "tmp": np.empty((batch, n), dt),
+            }
+        if batch == self._capacity:
+            return self._buffers
+        return {name: buf[:batch] for name, buf in self._buffers.items()}
+
+    def init_state(self, batch):
+        return np.zeros((batch, self.units), dtype=self.dtype)
+
+    def _conductances(self, fused, pre, act, prod, num, den):
+        """num <- sum g E, den <- sum g per neuron, for g = w sigmoid(gamma (pre - mu)) per synapse."""
+        csr, half_gamma, mu, w, w_erev, base, base_erev = fused
+        csr.gather(pre, out=act)
+        np.subtract(act, mu, out=act)
+        np.multiply(act, half_gamma, out=act)
+        np.tanh(act, out=act)
+        csr.segment_sum(np.multiply(act, w, out=prod), den)
+        den += base
+        csr.segment_sum(np.multiply(act, w_erev, out=prod), num)
+        num += base_erev
+
+    def step(self, x, inputs, dt=1.0):
+        """Advances (batch, units) state `x` in place over one sample of (batch, inputs) `inputs`.
+
+        `dt` is a scalar or a (batch,) array of elapsed times.
+        """
+        fused = self._fused or self._fuse()
+        batch = len(x)
+        buf = self._scratch(batch)
+        drive = buf["drive"]
+        np.multiply(inputs, self.input_w, out=drive)
+        drive += self.input_b
+        self._conductances(fused["sensory_"], drive, buf["sact"], buf["sprod"], buf["s_num"], buf["s_den"])
+        # Terms constant across the unfolds of this sample.
+        s_num, s_den = buf["s_num"], buf["s_den"]
+        s_num += self._leak
+        s_den += self.gleak
+        s_den += EPSILON
+        cm_h = buf["cm_h"]
+        h = np.asarray(dt, dtype=self.dtype) / self.unfolds
+        np.divide(self.cm, h[:, None] if h.ndim else h, out=cm_h)
+        s_den += cm_h
+
+        num, den, tmp = buf["num"], buf["den"], buf["tmp"]
+        for _ in range(self.unfolds):
+            self._conductances(fused[""], x, buf["act"], buf["prod"], num, den)
+            np.multiply(cm_h, x, out=tmp)
+            num += tmp
+            num += s_num
+            den += s_den
+            np.divide(num, den, out=x)
+        return x
+
+    def readout(self, x, out=None):
+        """(batch, outputs) from the first `outputs` neurons of `x`."""
+        out = np.multiply(x[:, :self.outputs], self.output_w, out=out)
+        out += self.output_b
+        return out
+
+    def forward(self, inputs, dt=1.0, state=None, return_states=False):
+        """Runs (batch, T, inputs) sequences. Returns (outputs (batch, T, outputs), final state).
+
+        `dt` is a scalar, a (T,) array shared by the batch, or (batch, T).
+        With `return_states` the (batch, T, units) hidden states are returned too.
+        """
+        inputs = np.asarray(inputs, dtype=self.dtype)
+        batch, steps = inputs.shape[:2]
+        x = self.init_state(batch) if state is None else np.array(state, dtype=self.dtype)
+        dt = np.asarray(dt, dtype=self.dtype)
+        if dt.ndim == 1:
+            dt = np.broadcast_to(dt[None, :], (batch, steps))
+        out = np.empty((batch, steps, self.outputs), dtype=self.dtype)
+        states = np.empty((batch, steps, self.units), dtype=self.dtype) if return_states else None
+        for t in range(steps):
+            self.step(x, inputs[:, t], dt if dt.ndim == 0 else dt[:, t])
+            self.readout(x, out=out[:, t])
+            if states is not None:
+                states[:, t] = x
+        if return_states:
+            return out, x, states
+        return out, x
@@ -0,0 +1,392 @@
+"""
+[SYSTEM: NATURA_SERVER]
+[ROLE: LOCAL WEB INTERFACE, LIVE LTC STATE OVER WEBSOCKETS]
+
+"Observing the 'Liquid' state adaptation in real-time via a local web
+interface": an asyncio HTTP server on loopback serves one page, and the page
+opens a WebSocket (RFC 6455, written out here over asyncio streams so the
+stick needs no extra packages) that receives hidden-state frames.
+
+Three parties, none of which can hold up another:
+
+* the solver runs in its own thread, pulling chunks from a source and
+  feeding `Sessions`. About twice per frame period it publishes a snapshot
+  by swapping one reference, so every tick finds a fresh one; it never
+  touches the event loop or a client.
+* a ticker on the event loop encodes the newest snapshot once per tick,
+  whatever the number of viewers, and offers it to every client.
+* each client has a one-frame mailbox and its own writer task. A newer
+  frame replaces an unsent one (counted as coalesced), and the writer
+  awaits `drain()` before taking the next, so a slow browser gets fewer,
+  fresher frames and never grows a queue. A client whose connection fails
+  is dropped at once.
+
+If the solver stops on an exception, frames and `/state` carry it as
+`error`. The WebSocket upgrade only accepts pages served from this server
+(or clients that send no Origin, i.e. not a browser), so another site open
+in the same browser cannot read the stream.
+
+    python -m natura.server                 # demo NCP on synthetic sensors
+    python -m natura.server --rate 30 --port 8765
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("NATURA_PORT", "8765"))
+RATE = 20.0  # frames per second pushed to viewers
+MAX_MESSAGE = 1 << 16  # largest client frame accepted
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC11B85"
+CLOSE_PROTOCOL_ERROR = 1002  # RFC 6455 7.4.1
+
+PAGE = """<!doctype html>
+<meta charset="utf-8"><title>Q-PID / NATURA</title>
+<style>body{background:#111;color:#ddd;font:13px monospace;margin:16px}canvas{display:block;margin:8px 0}</style>
+<div id="info">connecting...</div><div id="plots"></div>
+<script>
+const plots = {}, info = document.getElementById("info");
+const ws = new WebSocket(`ws://${location.host}/ws`);
+ws.onclose = () => info.textContent = "disconnected";
+ws.onmessage = (event) => {
+  const frame = JSON.parse(event.data);
+  info.textContent = `frame ${frame.seq}  solver ${frame.rate.toFixed(0)} samples/s  coalesced ${frame.coalesced}`
+    + (frame.error ? `  SOLVER STOPPED: ${frame.error}` : "");
+  for (const [key, s] of Object.entries(frame.streams)) {
+    let c = plots[key];
+    if (!c) {
+      c = plots[key] = document.createElement("canvas");
+      c.width = 640; c.height = 120;
+      document.getElementById("plots").append(key, c);
+    }
+    const g = c.getContext("2d"), w = c.width / s.state.length;
+    g.clearRect(0, 0, c.width, c.height);
+    s.state.forEach((v, i) => {
+      g.fillStyle = i < s.output.length ? "#e8a33d" : "#3da5e8";
+      const h = Math.max(-1, Math.min(1, v)) * c.height / 2;
+      g.fillRect(i * w, c.height / 2 - Math.max(h, 0), w - 1, Math.abs(h));
+    });
+  }
+};
+</script>
+"""
+
+
+# ==========================================
+# 0. SOLVER THREAD
+# ==========================================
+class Frame:
+    def __init__(self, seq, snapshot, rate):
+        self.seq = seq
+        self.snapshot = snapshot  # {key: (time, samples, state)}
+        self.rate = rate  # samples integrated per second, recent
+
+
+class Solver(threading.Thread):
+    """Feeds `sessions` from `source()` ({key: chunk}, or None to stop) and publishes frames."""
+
+    def __init__(self, sessions, source, rate=RATE):
+        super().__init__(name="natura-solver", daemon=True)
+        self.sessions = sessions
+        self.source = source
+        self.period = 1.0 / rate
+        self.latest = None
+        self.error = None
+        self.stopping = threading.Event()
+
+    def run(self):
+        seq, samples, mark, published = 0, 0, time.monotonic(), 0.0
+        try:
+            while not self.stopping.is_set():
+                chunks = self.source()
+                if chunks is None:
+                    break
+                outputs = self.sessions.feed_many(chunks)
+                samples += sum(len(out) for out in outputs.values())
+                now = time.monotonic()
+                if now - published >= self.period / 2:
+                    seq += 1
+                    self.latest = Frame(seq, self.sessions.snapshot(), samples / max(now - mark, 1e-9))
+                    published = now
+                    if now - mark > 2.0:
+                        samples, mark = 0, now
+        except Exception as exc:  # surfaced to viewers and the console
+            self.error = exc
+            print(f"[ERROR] solver stopped: {exc!r}")
+
+    def stop(self):
+        self.stopping.set()
+
+
+class SyntheticSensors:
+    """Demo source: `streams` noisy sine sensors sampled at ~`hz` with jittered timestamps, in real time."""
+
+    def __init__(self, streams, inputs, hz=200.0, chunk=0.02, seed=0):
+        self.keys = [f"sensor-{i}" for i in range(streams)]
+        self.inputs = inputs
+        self.hz = hz
+        self.chunk = chunk
+        self.rng = np.random.default_rng(seed)
+        self.freq = self.rng.uniform(0.2, 2.0, (streams, inputs))
+        self.clock = time.monotonic()
+        self.t = {key: 0.0 for key in self.keys}
+
+    def __call__(self):
+        time.sleep(max(0.0, self.clock + self.chunk - time.monotonic()))
+        self.clock += self.chunk
+        out = {}
+        for i, key in enumerate(self.keys):
+            n = self.rng.poisson(self.hz * self.chunk)
+            times = self.t[key] + np.cumsum(self.rng.exponential(1.0 / self.hz, n))
+            if n:
+                self.t[key] = float(times[-1])
+            values = np.sin(2 * np.pi * self.freq[i] * times[:, None]) + 0.1 * self.rng.standard_normal((n, self.inputs))
+            out[key] = (values, times)
+        return out
+
+
+# ==========================================
+# 1. WEBSOCKET
+# ==========================================
+def accept_key(key):
+    return base64.b64encode(hashlib.sha1(key.encode("ascii") + WS_GUID).digest()).decode("ascii")
+
+
+def encode_frame(payload, opcode=0x1):
+    """One unmasked, unfragmented server frame."""
+    n = len(payload)
+    if n < 126:
+        head = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        head = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return head + payload
+
+
+class ProtocolError(ConnectionError):
+    """The client broke RFC 6455; `code` is the status to close with."""
+
+    def __init__(self, code, reason):
+        super().__init__(reason)
+        self.code = code
+
+
+async def read_frame(reader):
+    """(opcode, payload) of one client frame.
+
+    Clients must mask every frame (RFC 6455 5.1); an unmasked one raises
+    ProtocolError before its payload is read.
+    """
+    b0, b1 = await reader.readexactly(2)
+    if not b1 & 0x80:
+        raise ProtocolError(CLOSE_PROTOCOL_ERROR, "client frame not masked")
+    n = b1 & 0x7F
+    if n == 126:
+        (n,) = struct.unpack("!H", await reader.readexactly(2))
+    elif n == 127:
+        (n,) = struct.unpack("!Q", await reader.readexactly(8))
+    if n > MAX_MESSAGE:
+        raise ConnectionError("client frame too large")
+    mask = await reader.readexactly(4)
+    data = await reader.readexactly(n)
+    data = (np.frombuffer(data, np.uint8) ^ np.resize(np.frombuffer(mask, np.uint8), n)).tobytes()
+    return b0 & 0x0F, data
+
+
+class Client:
+    def __init__(self, writer):
+        self.writer = writer
+        self.pending = None
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.coalesced = 0
+
+    def offer(self, payload):
+        if self.pending is not None:
+            self.coalesced += 1
+        self.pending = payload
+        self.ready.set()
+
+    async def pump(self):
+        try:
+            while True:
+                await self.ready.wait()
+                self.ready.clear()
+                payload, self.pending = self.pending, None
+                self.writer.write(encode_frame(payload))
+                await self.writer.drain()
+                self.sent += 1
+        except ConnectionError:
+            # The peer is gone; closing also ends the connection's read loop.
+            self.writer.close()
+
+
+# ==========================================
+# 2. HTTP + BROADCAST
+# ==========================================
+class Server:
+    def __init__(self, sessions, source, rate=RATE, host=HOST, port=PORT):
+        self.sessions = sessions
+        self.solver = Solver(sessions, source, rate)
+        self.period = 1.0 / rate
+        self.host = host
+        self.port = port
+        self.clients = set()
+        self.coalesced = 0
+        self.origins = {f"http://{name}:{port}" for name in (host, "localhost", "127.0.0.1", "[::1]")}
+
+    def encode(self, frame):
+        """JSON for `frame` (None before the first one) and the solver's error, if it stopped."""
+        cell = self.sessions.cell
+        streams = {}
+        for key, (t, samples, state) in (frame.snapshot.items() if frame else ()):
+            streams[str(key)] = {
+                "time": t,
+                "samples": samples,
+                "state": np.round(state, 4).tolist(),
+                "output": np.round(cell.readout(state[None])[0], 4).tolist(),
+            }
+        coalesced = self.coalesced + sum(c.coalesced for c in self.clients)
+        error = self.solver.error
+        return json.dumps({"seq": frame.seq if frame else 0, "rate": frame.rate if frame else 0.0,
+                           "coalesced": coalesced, "streams": streams,
+                           "error": None if error is None else repr(error)}).encode("utf-8")
+
+    async def broadcast(self):
+        loop = asyncio.get_running_loop()
+        seq, failed, tick = 0, None, loop.time()
+        while True:
+            # A fixed schedule, so a slow tick does not push back every later one.
+            tick = max(tick + self.period, loop.time())
+            await asyncio.sleep(tick - loop.time())
+            frame, error = self.solver.latest, self.solver.error
+            fresh = frame is not None and frame.seq != seq
+            if not self.clients or not (fresh or error is not failed):
+                continue
+            seq, failed = frame.seq if frame else seq, error
+            payload = self.encode(frame)
+            for client in self.clients:
+                client.offer(payload)
+
+    async def handle(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        parts = lines[0].split()
+        path = parts[1] if len(parts) > 1 else "/"
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self.websocket(reader, writer, headers)
+            elif path == "/":
+                await self.respond(writer, "200 OK", "text/html; charset=utf-8", PAGE.encode("utf-8"))
+            elif path == "/state":
+                frame = self.solver.latest
+                body = self.encode(frame) if frame or self.solver.error else b"{}"
+                await self.respond(writer, "200 OK", "application/json", body)
+            else:
+                await self.respond(writer, "404 Not Found", "text/plain", b"not found")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, content_type, body):
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode("latin-1") + body)
+        await writer.drain()
+
+    async def websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self.respond(writer, "400 Bad Request", "text/plain", b"missing Sec-WebSocket-Key")
+            return
+        origin = headers.get("origin")
+        if origin is not None and origin.lower() not in self.origins:
+            await self.respond(writer, "403 Forbidden", "text/plain", b"origin not allowed")
+            return
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        client = Client(writer)
+        self.clients.add(client)
+        if self.solver.error is not None:  # the ticker has nothing new to send
+            client.offer(self.encode(self.solver.latest))
+        pump = asyncio.ensure_future(client.pump())
+        pump.add_done_callback(lambda _: self.clients.discard(client))
+        try:
+            while True:
+                # The reader only answers control frames; viewers have nothing to send.
+                try:
+                    opcode, data = await read_frame(reader)
+                except ProtocolError as e:
+                    writer.write(encode_frame(struct.pack("!H", e.code), 0x8))
+                    await writer.drain()
+                    break
+                if opcode == 0x8:
+                    writer.write(encode_frame(data[:2], 0x8))
+                    break
+                if opcode == 0x9:
+                    writer.write(encode_frame(data, 0xA))
+        finally:
+            self.clients.discard(client)
+            self.coalesced += client.coalesced
+            pump.cancel()
+
+    async def serve(self):
+        self.solver.start()
+        server = await asyncio.start_server(self.handle, self.host, self.port)
+        ticker = asyncio.ensure_future(self.broadcast())
+        print(f"[SYSTEM] natura listening on http://{self.host}:{self.port}/")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            ticker.cancel()
+            self.solver.stop()
+
+
+def main(argv=None):
+    from natura.ltc import LTCCell
+    from natura.session import Sessions
+    from natura.wiring import NCP
+
+    parser = argparse.ArgumentParser(prog="python -m natura.server", description="Serve live LTC state.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--rate", type=float, default=RATE, help="frames per second to viewers")
+    parser.add_argument("--streams", type=int, default=4)
+    parser.add_argument("--hz", type=float, default=200.0, help="demo sensor sample rate")
+    args = parser.parse_args(argv)
+
+    inputs = 8
+    cell = LTCCell(NCP(inputs, inter=12, command=8, motor=4, sensory_fanout=4, inter_fanout=4,
+                       recurrent_command=8, motor_fanin=4))
+    source = SyntheticSensors(args.streams, inputs, args.hz)
+    sessions = Sessions(cell)
+    for key in source.keys:
+        sessions.open(key, time=0.0)
+    try:
+        asyncio.run(Server(sessions, source, args.rate, args.host, args.port).serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""
+[SYSTEM: NATURA_SESSION]
+[ROLE: STATEFUL STREAMING INFERENCE, ONE HIDDEN STATE PER STREAM]
+
+A sensor does not hand over a finished series: samples arrive in bursts of
+any size, at uneven times, from several sources at once. `Sessions` keeps,
+per stream, only what the ODE needs to carry on: the (units,) hidden state
+and the timestamp of the last sample. A chunk is integrated from there,
+each sample over its real gap to the previous one, and its outputs are
+returned straight away. Nothing already consumed is kept or replayed, so
+memory is constant in the length of a stream.
+
+`feed_many()` advances every stream that has data in one batch. Chunks are
+sorted by length so that, at sample k, the streams still running are a
+prefix of the batch; each step runs the cell on that prefix (a view, with
+the cell's scratch buffers sliced to match) and no padding is ever
+integrated.
+
+Timestamps must not go backwards. Two samples at the same time are
+integrated over MIN_DT, which leaves the state as good as unchanged (the
+fused update's denominator would otherwise divide by a zero step).
+"""
+import threading
+
+import numpy as np
+
+MIN_DT = 1e-6
+
+
+class StreamError(Exception):
+    pass
+
+
+class Stream:
+    def __init__(self, state, time=None):
+        self.state = state
+        self.time = time  # timestamp of the last sample seen
+        self.samples = 0
+
+
+class Sessions:
+    """Per-stream LTC state over one `LTCCell`. `default_dt` spaces samples that carry no timestamps."""
+
+    def __init__(self, cell, default_dt=1.0):
+        self.cell = cell
+        self.default_dt = default_dt
+        self.streams = {}
+        self.lock = threading.Lock()
+
+    def open(self, key, state=None, time=None):
+        """Starts stream `key` at `state` (zeros by default); `time` is the timestamp it holds."""
+        if state is None:
+            state = self.cell.init_state(1)[0]
+        state = np.array(state, dtype=self.cell.dtype).reshape(self.cell.units)
+        with self.lock:
+            self.streams[key] = Stream(state, time)
+        return key
+
+    def close(self, key):
+        with self.lock:
+            self.streams.pop(key, None)
+
+    def state(self, key):
+        """A copy of the stream's hidden state."""
+        with self.lock:
+            return self._get(key).state.copy()
+
+    def snapshot(self):
+        """{key: (time, samples, state copy)} for every open stream."""
+        with self.lock:
+            return {key: (s.time, s.samples, s.state.copy()) for key, s in self.streams.items()}
+
+    def _get(self, key):
+        stream = self.streams.get(key)
+        if stream is None:
+            raise StreamError(f"no open stream {key!r}")
+        return stream
+
+    def _gaps(self, stream, n, times, dt):
+        """(n,) elapsed times for the chunk's samples, and the stream's new last timestamp."""
+        if times is None:
+            gaps = np.maximum(np.broadcast_to(np.asarray(self.default_dt if dt is None else dt, dtype=np.float64), (n,)),
+                              MIN_DT)
+            last = None if stream.time is None else stream.time + float(np.sum(gaps))
+            return gaps, last
+        times = np.asarray(times, dtype=np.float64)
+        if times.shape != (n,):
+            raise StreamError(f"{n} samples but {times.shape} timestamps")
+        if not n:
+            return times, stream.time
+        gaps = np.empty(n)
+        gaps[0] = self.default_dt if stream.time is None else times[0] - stream.time
+        np.subtract(times[1:], times[:-1], out=gaps[1:])
+        if np.any(gaps < 0):
+            raise StreamError("timestamps go backwards")
+        np.maximum(gaps, MIN_DT, out=gaps)
+        return gaps, float(times[-1])
+
+    def feed(self, key, values, times=None, dt=None):
+        """Integrates one chunk of (T, inputs) `values` for stream `key`; returns (T, outputs).
+
+        `times` are the samples' timestamps; without them samples are `dt`
+        (or `default_dt`) apart.
+        """
+        return self.feed_many({key: (values, times, dt)})[key]
+
+    def feed_many(self, chunks):
+        """{key: values | (values, times) | (values, times, dt)} -> {key: (T, outputs)}, in one batch."""
+        cell = self.cell
+        with self.lock:
+            work = []
+            for key, chunk in chunks.items():
+                values, times, dt = (chunk + (None, None))[:3] if isinstance(chunk, tuple) else (chunk, None, None)
+                values = np.asarray(values, dtype=cell.dtype).reshape(-1, cell.inputs)
+                stream = self._get(key)
+                gaps, last = self._gaps(stream, len(values), times, dt)
+                work.append((len(values), key, stream, values, gaps, last))
+            work.sort(key=lambda item: -item[0])
+            results = {key: np.empty((n, cell.outputs), dtype=cell.dtype) for n, key, *_ in work}
+            if not work or not work[0][0]:
+                return results
+
+            batch, longest = len(work), work[0][0]
+            lengths = np.array([item[0] for item in work])
+            x = np.stack([item[2].state for item in work])
+            inputs = np.zeros((longest, batch, cell.inputs), dtype=cell.dtype)
+            gaps = np.zeros((longest, batch), dtype=cell.dtype)
+            for b, (n, _, _, values, dts, _) in enumerate(work):
+                inputs[:n, b] = values
+                gaps[:n, b] = dts
+            out = np.empty((longest, batch, cell.outputs), dtype=cell.dtype)
+            # active[k]: how many streams (a prefix, by the sort) still have sample k.
+            active = batch - np.searchsorted(lengths[::-1], np.arange(longest), side="right")
+            for k in range(longest):
+                rows = active[k]
+                cell.step(x[:rows], inputs[k, :rows], gaps[k, :rows])
+                cell.readout(x[:rows], out=out[k, :rows])
+
+            for b, (n, key, stream, _, _, last) in enumerate(work):
+                results[key][...] = out[:n, b]
+                stream.state[...] = x[b]
+                stream.time = last
+                stream.samples += n
+        return results
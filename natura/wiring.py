@@ -0,0 +1,171 @@
+"""
+[SYSTEM: NATURA_WIRING]
+[ROLE: NEURAL CIRCUIT POLICY WIRING -> CSR SYNAPSES]
+
+A wiring fixes which synapses exist and their polarity (+1 excitatory, -1
+inhibitory); the LTC cell owns the weights. Two synapse matrices come out
+of every wiring, both as `CSR` with rows = target neurons:
+
+    synapses          units  -> units
+    sensory_synapses  inputs -> units
+
+`NCP` builds the four-layer Neural Circuit Policy,
+
+    sensory -> inter -> command (-> command, recurrent) -> motor
+
+Every sensory input fans out to `sensory_fanout` inter neurons, every inter
+neuron to `inter_fanout` command neurons, and every motor neuron takes
+`motor_fanin` command inputs; neurons a layer leaves unconnected get the
+layer's mean fan-in (or fan-out) so that nothing is orphaned. Neuron ids run
+motor, command, inter, so the motor neurons are the first `outputs` units
+and are what `LTCCell.readout` reads. Construction touches only the
+synapses it creates.
+"""
+import numpy as np
+
+from natura.csr import CSR
+
+POLARITY = (-1, 1, 1)  # drawn uniformly: two thirds excitatory
+
+
+class Wiring:
+    """Synapse lists for `units` neurons fed by `inputs` channels, read out on the first `outputs`."""
+
+    def __init__(self, units, inputs, outputs, seed=0):
+        self.units = units
+        self.inputs = inputs
+        self.outputs = outputs
+        self.seed = seed
+        self._edges = {}  # (pre, post) -> polarity
+        self._sensory_edges = {}
+
+    def add(self, pre, post, polarity):
+        self._edges[(int(pre), int(post))] = int(polarity)
+
+    def add_sensory(self, pre, post, polarity):
+        self._sensory_edges[(int(pre), int(post))] = int(polarity)
+
+    @staticmethod
+    def _csr(edges, n_pre, n_post):
+        if not edges:
+            return CSR(np.zeros(n_post + 1), [], np.zeros(0, dtype=np.int8), n_pre)
+        (pre, post), polarity = zip(*edges.keys()), list(edges.values())
+        return CSR.from_edges(pre, post, np.asarray(polarity, dtype=np.int8), n_pre, n_post)
+
+    @property
+    def synapses(self):
+        return self._csr(self._edges, self.units, self.units)
+
+    @property
+    def sensory_synapses(self):
+        return self._csr(self._sensory_edges, self.inputs, self.units)
+
+    @property
+    def config(self):
+        return {"kind": type(self).__name__, "units": self.units, "inputs": self.inputs,
+                "outputs": self.outputs, "seed": self.seed}
+
+
+class FullyConnected(Wiring):
+    """Every neuron to every neuron and every input to every neuron, random polarity."""
+
+    def __init__(self, units, inputs, outputs=None, seed=0):
+        super().__init__(units, inputs, units if outputs is None else outputs, seed)
+        rng = np.random.default_rng(seed)
+        polarity = rng.choice(POLARITY, size=(units, units))
+        sensory = rng.choice(POLARITY, size=(inputs, units))
+        for pre, post in np.ndindex(units, units):
+            self.add(pre, post, polarity[pre, post])
+        for pre, post in np.ndindex(inputs, units):
+            self.add_sensory(pre, post, sensory[pre, post])
+
+
+class NCP(Wiring):
+    def __init__(self, inputs, inter, command, motor, sensory_fanout, inter_fanout, recurrent_command,
+                 motor_fanin, seed=0):
+        super().__init__(inter + command + motor, inputs, motor, seed)
+        for name, fan, size in (("sensory_fanout", sensory_fanout, inter), ("inter_fanout", inter_fanout, command),
+                                ("motor_fanin", motor_fanin, command)):
+            if not 1 <= fan <= size:
+                raise ValueError(f"{name}={fan} must be between 1 and {size}")
+        self.layers = {"inter": inter, "command": command, "motor": motor}
+        self.fan = {"sensory_fanout": sensory_fanout, "inter_fanout": inter_fanout,
+                    "recurrent_command": recurrent_command, "motor_fanin": motor_fanin}
+        rng = np.random.default_rng(seed)
+        motors = np.arange(motor)
+        commands = np.arange(motor, motor + command)
+        inters = np.arange(motor + command, motor + command + inter)
+
+        def pol():
+            return rng.choice(POLARITY)
+
+        # sensory -> inter
+        reached = set()
+        for src in range(inputs):
+            for dst in rng.choice(inters, size=sensory_fanout, replace=False):
+                self.add_sensory(src, dst, pol())
+                reached.add(int(dst))
+        fanin = min(inputs, max(1, inputs * sensory_fanout // inter))
+        for dst in inters:
+            if int(dst) not in reached:
+                for src in rng.choice(inputs, size=fanin, replace=False):
+                    self.add_sensory(src, dst, pol())
+
+        # inter -> command
+        reached = set()
+        for src in inters:
+            for dst in rng.choice(commands, size=inter_fanout, replace=False):
+                self.add(src, dst, pol())
+                reached.add(int(dst))
+        fanin = min(inter, max(1, inter * inter_fanout // command))
+        for dst in commands:
+            if int(dst) not in reached:
+                for src in rng.choice(inters, size=fanin, replace=False):
+                    self.add(src, dst, pol())
+
+        # command -> command
+        for _ in range(recurrent_command):
+            self.add(rng.choice(commands), rng.choice(commands), pol())
+
+        # command -> motor
+        used = set()
+        for dst in motors:
+            for src in rng.choice(commands, size=motor_fanin, replace=False):
+                self.add(src, dst, pol())
+                used.add(int(src))
+        fanout = min(motor, max(1, motor * motor_fanin // command))
+        for src in commands:
+            if int(src) not in used:
+                for dst in rng.choice(motors, size=fanout, replace=False):
+                    self.add(src, dst, pol())
+
+    @property
+    def config(self):
+        out = super().config
+        out.update(self.layers)
+        out.update(self.fan)
+        return out
+
+
+class Fixed(Wiring):
+    """A wiring given directly as its CSR matrices, e.g. read back from a checkpoint."""
+
+    def __init__(self, synapses, sensory_synapses, outputs, config=None):
+        super().__init__(synapses.n_rows, sensory_synapses.n_cols, outputs, None)
+        self._synapses = synapses
+        self._sensory_synapses = sensory_synapses
+        self._config = dict(config or {})
+
+    @property
+    def synapses(self):
+        return self._synapses
+
+    @property
+    def sensory_synapses(self):
+        return self._sensory_synapses
+
+    @property
+    def config(self):
+        out = super().config
+        out.update(self._config)
+        return out
@@ -0,0 +1,39 @@
+"""
+[SYSTEM: STARTUP_GUARD_TEST]
+[ROLE: KEEP THE COLD-START PATHS FREE OF HEAVY IMPORTS]
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import GENERATE  # noqa: E402  (argparse/os/sys only)
+
+
+def _run(argv):
+    return subprocess.run([sys.executable] + argv, cwd=ROOT, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True, timeout=300)
+
+
+def test_startup_check_passes():
+    # A loose budget: this guards the import set; timing is noisy on shared runners.
+    proc = _run(["GENERATE.py", "startup-check", "--budget", "5"])
+    assert proc.returncode == 0, proc.stdout
+    assert "[ERROR]" not in proc.stdout
+    assert proc.stdout.count("no heavy imports") == 3, proc.stdout
+
+
+def test_help_loads_no_heavy_modules():
+    script = ("import sys, json, GENERATE\n"
+              "try:\n    GENERATE.parse_args(['--help'])\nexcept SystemExit:\n    pass\n"
+              "print(json.dumps(sorted(sys.modules)))")
+    before = set(json.loads(_run(["-c", "import sys, json; print(json.dumps(sorted(sys.modules)))"]).stdout))
+    proc = _run(["-c", script])
+    assert proc.returncode == 0, proc.stdout
+    fresh = set(json.loads(proc.stdout.splitlines()[-1])) - before
+    leaked = [b for b in GENERATE.HEAVY if any(m == b or m.startswith(b + ".") for m in fresh)]
+    assert not leaked
+    assert "GENERATE_HCI_PAPER_V7" not in fresh